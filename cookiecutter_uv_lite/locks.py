@@ -0,0 +1,160 @@
+"""Maintain the pre-resolved uv lockfiles shipped with the template.
+
+Generated projects start with a `uv.lock` that matches their dependency set, so
+the first `uv sync` (run by `make install`) only downloads and links packages
+instead of resolving them. The dependency lists in the project's
+`pyproject.toml` depend on `project_type`, `mkdocs`, `github_actions` and, in
+notebooks projects, `dataframe_backend`, so there is one lockfile per
+combination of these options.
+They are resolved for a placeholder project name and stored together in a
+gzipped JSON bundle. The lockfiles share most of their `[[package]]` entries,
+so the bundle keeps each entry once and every lockfile as a header plus entry
+indices: this makes it a fraction of their combined size and cheap to
+decompress on every bake. The post-generation hook rebuilds the matching
+lockfile and renames the project entry.
+
+Usage:
+    python -m cookiecutter_uv_lite.locks             # refresh, keeping existing pins where possible
+    python -m cookiecutter_uv_lite.locks --upgrade   # re-resolve to the latest versions
+    python -m cookiecutter_uv_lite.locks --check     # verify against the rendered pyproject.toml files
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import gzip
+import itertools
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from cookiecutter_uv_lite.render import PROJECT_TEMPLATE, TEMPLATE_DIR, render_project
+
+BUNDLE = Path(PROJECT_TEMPLATE) / ".uv-locks.json.gz"
+# Options that change the dependency lists in the generated pyproject.toml.
+LOCK_OPTIONS = ("project_type", "dataframe_backend", "mkdocs", "github_actions")
+PROJECT_NAME = "my-project"
+# Precedes every package entry in a uv.lock; the bundle splits lockfiles on it.
+_SEPARATOR = "\n[[package]]\n"
+
+
+def lock_key(options: dict[str, str]) -> str:
+    """Return the bundle key of a dependency set; must match LOCK_KEY in hooks/post_gen_project.py.
+
+    Only notebooks projects depend on `dataframe_backend`; the other types share the pandas lockfile.
+    """
+    backend = options["dataframe_backend"] if options["project_type"] == "notebooks" else "pandas"
+    return "{project_type}-{backend}-mkdocs_{mkdocs}-github_actions_{github_actions}".format(**options, backend=backend)
+
+
+def lock_combinations(template_dir: Path = TEMPLATE_DIR) -> list[dict[str, str]]:
+    """Return one combination of the options that affect dependencies per dependency set."""
+    variables = json.loads((template_dir / "cookiecutter.json").read_text(encoding="utf-8"))
+    combinations: dict[str, dict[str, str]] = {}
+    for values in itertools.product(*(variables[name] for name in LOCK_OPTIONS)):
+        options = dict(zip(LOCK_OPTIONS, values))  # noqa: B905 | zip(strict=) needs Python 3.10
+        combinations.setdefault(lock_key(options), options)
+    return list(combinations.values())
+
+
+def read_bundle(template_dir: Path = TEMPLATE_DIR) -> dict[str, str]:
+    """Return the shipped lockfiles by key; empty if there is no bundle yet."""
+    path = template_dir / BUNDLE
+    if not path.exists():
+        return {}
+    bundle = json.loads(gzip.decompress(path.read_bytes()))
+    packages = bundle["packages"]
+    return {
+        key: _SEPARATOR.join([header, *(packages[i] for i in indices)])
+        for key, (header, indices) in bundle["locks"].items()
+    }
+
+
+def write_bundle(locks: dict[str, str], template_dir: Path = TEMPLATE_DIR) -> None:
+    """Store lockfiles in the bundle. The output is deterministic, so unchanged locks give an unchanged file."""
+    packages: dict[str, int] = {}
+    entries = {}
+    for key in sorted(locks):
+        header, *blocks = locks[key].split(_SEPARATOR)
+        entries[key] = [header, [packages.setdefault(block, len(packages)) for block in blocks]]
+    bundle = {"project_name": PROJECT_NAME, "packages": list(packages), "locks": entries}
+    data = json.dumps(bundle, sort_keys=True).encode()
+    (template_dir / BUNDLE).write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+
+
+def _uv_lock(options: dict[str, str], existing: str | None, args: list[str], template_dir: Path) -> tuple[int, str]:
+    """Run `uv lock` on the rendered pyproject.toml of one dependency set. Returns the exit code and lockfile."""
+    files = render_project({**options, "project_name": PROJECT_NAME, "git_repo": "n"}, template_dir)
+    with tempfile.TemporaryDirectory(prefix="cookiecutter-uv-lite-lock-") as tmp:
+        project = Path(tmp)
+        (project / "pyproject.toml").write_text(files["pyproject.toml"], encoding="utf-8")
+        if existing is not None:
+            (project / "uv.lock").write_text(existing, encoding="utf-8")
+        completed = subprocess.run(["uv", "lock", "--quiet", *args], cwd=project, check=False)  # noqa: S603, S607
+        lock = project / "uv.lock"
+        return completed.returncode, lock.read_text(encoding="utf-8") if lock.exists() else ""
+
+
+def update(upgrade: bool = False, jobs: int = 4, template_dir: Path = TEMPLATE_DIR) -> int:
+    """Re-lock every dependency set, keeping existing pins unless `upgrade` is set, and rewrite the bundle."""
+    existing = read_bundle(template_dir)
+    combinations = lock_combinations(template_dir)
+    args = ["--upgrade"] if upgrade else []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            lock_key(options): pool.submit(_uv_lock, options, existing.get(lock_key(options)), args, template_dir)
+            for options in combinations
+        }
+        results = {key: future.result() for key, future in futures.items()}
+
+    failed = [key for key, (code, _) in results.items() if code != 0]
+    if failed:
+        print(f"uv lock failed for: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    write_bundle({key: lock for key, (_, lock) in results.items()}, template_dir)
+    print(f"Wrote {len(results)} lockfiles to {BUNDLE}")
+    return 0
+
+
+def check(jobs: int = 4, template_dir: Path = TEMPLATE_DIR) -> int:
+    """Verify that every dependency set has a lockfile that is up to date with its rendered pyproject.toml."""
+    existing = read_bundle(template_dir)
+    combinations = lock_combinations(template_dir)
+    problems = [
+        f"{key}: no longer a dependency set" for key in sorted(set(existing) - set(map(lock_key, combinations)))
+    ]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            lock_key(options): pool.submit(_uv_lock, options, existing[lock_key(options)], ["--locked"], template_dir)
+            for options in combinations
+            if lock_key(options) in existing
+        }
+        problems += [f"{key}: missing" for key in map(lock_key, combinations) if key not in existing]
+        problems += [f"{key}: out of date" for key, future in futures.items() if future.result()[0] != 0]
+
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    if problems:
+        print("Run `python -m cookiecutter_uv_lite.locks` to refresh the lockfiles.", file=sys.stderr)
+        return 1
+    print(f"All {len(combinations)} lockfiles are up to date.")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m cookiecutter_uv_lite.locks", description=__doc__.split("\n")[0])
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--check", action="store_true", help="fail if a lockfile is missing or out of date")
+    group.add_argument("--upgrade", action="store_true", help="re-resolve every lockfile to the latest versions")
+    parser.add_argument("--jobs", "-j", type=int, default=4, help="concurrent `uv lock` runs (default: %(default)s)")
+    args = parser.parse_args(argv)
+    if args.check:
+        return check(args.jobs)
+    return update(args.upgrade, args.jobs)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Render the template in memory, without writing files or running subprocesses.
+
+`render_project` evaluates every file of the template and the pruning rules of
+the post-generation hook, and returns the generated project as a mapping of
+relative path to content. Content checks against this mapping take milliseconds,
+so only tests that need a real tree (running `make test`, `make check`, ...)
+have to bake to disk.
+
+Example:
+    >>> files = render_project({"project_type": "cli", "project_name": "my-app"})
+    >>> "my_app/cli.py" in files
+    True
+"""
+
+from __future__ import annotations
+
+import contextlib
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from cookiecutter.environment import StrictEnvironment  # type: ignore[import-untyped]
+from cookiecutter.exceptions import FailedHookException  # type: ignore[import-untyped]
+from cookiecutter.generate import generate_context  # type: ignore[import-untyped]
+from cookiecutter.prompt import prompt_for_config  # type: ignore[import-untyped]
+from jinja2 import Environment, FileSystemLoader
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent
+PROJECT_TEMPLATE = "{{cookiecutter.project_name}}"
+
+
+@contextlib.contextmanager
+def _template_on_path(template_dir: Path) -> Iterator[None]:
+    """Make the template's `local_extensions` importable, as cookiecutter does during a bake."""
+    sys.path.insert(0, str(template_dir))
+    try:
+        yield
+    finally:
+        sys.path.remove(str(template_dir))
+
+
+def _load_hook(env: Environment, template_dir: Path, name: str, context: dict[str, Any]) -> dict[str, Any]:
+    """Render a hook script and execute it as a module (not as `__main__`), returning its namespace."""
+    path = template_dir / "hooks" / f"{name}.py"
+    source = env.from_string(path.read_text(encoding="utf-8")).render(**context)
+    namespace: dict[str, Any] = {"__name__": name, "__file__": str(path)}
+    try:
+        exec(compile(source, str(path), "exec"), namespace)  # noqa: S102 | the template's own hook
+    except SystemExit as exc:
+        msg = f"Hook script failed (exit status: {exc.code})"
+        raise FailedHookException(msg) from exc
+    return namespace
+
+
+def _is_binary(content: bytes) -> bool:
+    """Binary template files are copied verbatim by cookiecutter and only read by the hooks here."""
+    try:
+        content.decode("utf-8")
+    except UnicodeDecodeError:
+        return True
+    return False
+
+
+def _is_removed(path: str, removed: list[str]) -> bool:
+    return any(path.startswith(entry) if entry.endswith("/") else path == entry for entry in removed)
+
+
+def render_project(extra_context: dict[str, Any] | None = None, template_dir: Path = TEMPLATE_DIR) -> dict[str, str]:
+    """Render a project into memory.
+
+    Args:
+        extra_context: Answers to the template's prompts; the others take their default.
+        template_dir: Root of the cookiecutter template.
+
+    Returns:
+        The generated text files, keyed by POSIX path relative to the project directory.
+
+    Raises:
+        FailedHookException: The pre-generation hook rejected the context, e.g. an invalid project name.
+    """
+    context = generate_context(context_file=str(template_dir / "cookiecutter.json"), extra_context=extra_context)
+    with _template_on_path(template_dir):
+        context["cookiecutter"].update(prompt_for_config(context, no_input=True))
+        env = StrictEnvironment(context=context, keep_trailing_newline=True)
+        env.loader = FileSystemLoader(str(template_dir))
+
+        _load_hook(env, template_dir, "pre_gen_project", context)
+        files = {}
+        raw = {}
+        for path in sorted((template_dir / PROJECT_TEMPLATE).rglob("*")):
+            if not path.is_file():
+                continue
+            name = path.relative_to(template_dir).as_posix()
+            # Same calls as cookiecutter's generate_file, so compiled templates are shared with real bakes.
+            rendered_name = env.from_string(name).render(**context).split("/", 1)[1]
+            raw[rendered_name] = path.read_bytes()
+            if not _is_binary(raw[rendered_name]):
+                files[rendered_name] = env.get_template(name).render(**context)
+        post_gen = _load_hook(env, template_dir, "post_gen_project", context)
+        files.update(post_gen["generated_files"](raw.get))
+        removed = post_gen["paths_to_remove"]()
+
+    return {path: content for path, content in files.items() if not _is_removed(path, removed)}
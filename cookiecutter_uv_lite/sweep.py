@@ -0,0 +1,215 @@
+"""Render every combination of the template's options and validate each distinct output once.
+
+Every choice variable in `cookiecutter.json` is expanded, and each combination
+is rendered in memory (see `cookiecutter_uv_lite.render`) in a process pool.
+Combinations whose rendered trees hash the same are grouped: options such as
+`git_repo` only change what the hooks do, not the generated files. The
+expensive checks (ruff, mypy and the project's own tests) then run once per
+distinct tree, so covering all combinations costs roughly the number of
+distinct outputs instead of one full validation per combination.
+
+Usage:
+    python -m cookiecutter_uv_lite.sweep                      # render and group only
+    python -m cookiecutter_uv_lite.sweep --validate           # also run the checks
+    python -m cookiecutter_uv_lite.sweep --validate --report sweep.md
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import hashlib
+import itertools
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from cookiecutter_uv_lite.render import TEMPLATE_DIR, render_project
+
+# Run in the generated project, in order, after `uv sync`. A failing check does not stop the next one.
+# ruff uses the project's own settings (`fix = true`), so only issues a developer would see remain.
+CHECKS: dict[str, list[str]] = {
+    "ruff": ["uv", "run", "ruff", "check", "."],
+    "mypy": ["uv", "run", "mypy"],
+    "pytest": ["uv", "run", "python", "-m", "pytest", "-q", "-p", "no:cacheprovider"],
+}
+SETUP: list[str] = ["uv", "sync", "--quiet"]
+
+# Number of output lines kept per failed check in the report.
+_TAIL_LINES = 20
+
+
+class CheckResult(NamedTuple):
+    """Outcome of one check on one rendered tree."""
+
+    name: str
+    passed: bool
+    seconds: float
+    output: str
+
+
+class Tree(NamedTuple):
+    """A distinct rendered tree and the option combinations that produce it."""
+
+    digest: str
+    combinations: list[dict[str, str]]
+    checks: list[CheckResult]
+
+
+def option_combinations(template_dir: Path = TEMPLATE_DIR) -> list[dict[str, str]]:
+    """Return every combination of the choice variables in `cookiecutter.json`."""
+    variables = json.loads((template_dir / "cookiecutter.json").read_text(encoding="utf-8"))
+    # Private variables such as `_extensions` are lists too, but not prompts.
+    choices = {
+        name: values for name, values in variables.items() if isinstance(values, list) and not name.startswith("_")
+    }
+    return [dict(zip(choices, values)) for values in itertools.product(*choices.values())]  # noqa: B905 | zip(strict=) needs Python 3.10
+
+
+def tree_digest(files: dict[str, str]) -> str:
+    """Hash a rendered tree: paths and contents, independent of rendering order."""
+    digest = hashlib.sha256()
+    for path in sorted(files):
+        digest.update(path.encode())
+        digest.update(b"\0")
+        digest.update(files[path].encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _render_digest(combination: dict[str, str]) -> str:
+    return tree_digest(render_project(combination))
+
+
+def group_combinations(combinations: list[dict[str, str]], jobs: int | None = None) -> dict[str, list[dict[str, str]]]:
+    """Render all combinations in a process pool and group them by tree digest.
+
+    Groups keep the order in which their first combination appears.
+    """
+    groups: dict[str, list[dict[str, str]]] = {}
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        chunksize = max(1, len(combinations) // ((jobs or os.cpu_count() or 1) * 4))
+        digests = pool.map(_render_digest, combinations, chunksize=chunksize)
+        for combination, digest in zip(combinations, digests):  # noqa: B905 | zip(strict=) needs Python 3.10
+            groups.setdefault(digest, []).append(combination)
+    return groups
+
+
+def write_tree(files: dict[str, str], directory: Path) -> None:
+    """Write a rendered tree to disk."""
+    for path, content in files.items():
+        target = directory / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content, encoding="utf-8")
+
+
+def _run(command: list[str], cwd: Path) -> tuple[bool, float, str]:
+    start = time.perf_counter()
+    try:
+        completed = subprocess.run(command, cwd=cwd, capture_output=True, text=True, check=False)  # noqa: S603
+    except FileNotFoundError as e:
+        return False, time.perf_counter() - start, str(e)
+    output = "\n".join((completed.stdout + completed.stderr).splitlines()[-_TAIL_LINES:])
+    return completed.returncode == 0, time.perf_counter() - start, output
+
+
+def validate_tree(
+    combination: dict[str, str], checks: dict[str, list[str]], setup: list[str] | None = None
+) -> list[CheckResult]:
+    """Render one combination into a temporary directory and run the checks in it."""
+    files = render_project(combination)
+    with tempfile.TemporaryDirectory(prefix="cookiecutter-uv-lite-sweep-") as tmp:
+        project_dir = Path(tmp) / "project"
+        write_tree(files, project_dir)
+        if setup:
+            passed, seconds, output = _run(setup, project_dir)
+            if not passed:
+                return [CheckResult("setup", False, seconds, output)]
+        return [CheckResult(name, *_run(command, project_dir)) for name, command in checks.items()]
+
+
+def sweep(
+    checks: dict[str, list[str]] | None = None,
+    setup: list[str] | None = None,
+    jobs: int | None = None,
+    template_dir: Path = TEMPLATE_DIR,
+) -> list[Tree]:
+    """Group all option combinations by rendered tree and validate one representative per tree.
+
+    Args:
+        checks: Commands to run in each distinct tree; None renders and groups only.
+        setup: Command run before the checks, e.g. `uv sync`.
+        jobs: Worker processes for rendering and concurrently validated trees; defaults to the CPU count.
+        template_dir: Root of the cookiecutter template.
+    """
+    groups = group_combinations(option_combinations(template_dir), jobs)
+    if not checks:
+        return [Tree(digest, combinations, []) for digest, combinations in groups.items()]
+
+    # The checks are subprocesses, so threads are enough to run several trees at once.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+        futures = {
+            digest: pool.submit(validate_tree, combinations[0], checks, setup)
+            for digest, combinations in groups.items()
+        }
+        return [Tree(digest, groups[digest], future.result()) for digest, future in futures.items()]
+
+
+def format_report(trees: list[Tree], seconds: float) -> str:
+    """Render the sweep as a Markdown matrix: one row per combination, plus failure details."""
+    combinations = [combination for tree in trees for combination in tree.combinations]
+    options = list(combinations[0]) if combinations else []
+    check_names = list(dict.fromkeys(check.name for tree in trees for check in tree.checks))
+    failed = [tree for tree in trees if any(not check.passed for check in tree.checks)]
+
+    lines = [
+        "# Option sweep",
+        "",
+        f"{len(combinations)} combinations rendered into {len(trees)} distinct trees in {seconds:.1f}s.",
+    ]
+    if check_names:
+        lines.append(f"{len(trees) - len(failed)} of {len(trees)} trees passed validation.")
+    lines += ["", "| " + " | ".join([*options, "tree", *check_names]) + " |"]
+    lines.append("|" + "---|" * (len(options) + 1 + len(check_names)))
+    for tree in trees:
+        status = {check.name: f"{'pass' if check.passed else 'FAIL'} ({check.seconds:.1f}s)" for check in tree.checks}
+        for combination in tree.combinations:
+            cells = [*combination.values(), tree.digest[:10], *(status.get(name, "-") for name in check_names)]
+            lines.append("| " + " | ".join(cells) + " |")
+
+    for tree in failed:
+        lines += ["", f"## Tree {tree.digest[:10]}", "", f"Options: `{json.dumps(tree.combinations[0])}`"]
+        for check in tree.checks:
+            if not check.passed:
+                lines += ["", f"`{check.name}` failed:", "", "```", check.output, "```"]
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m cookiecutter_uv_lite.sweep", description=__doc__.split("\n")[0])
+    parser.add_argument("--validate", action="store_true", help="run ruff, mypy and pytest once per distinct tree")
+    parser.add_argument("--checks", default=",".join(CHECKS), help="comma-separated subset of: %(default)s")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--report", type=Path, default=None, help="write the Markdown report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    checks: dict[str, list[str]] | None = None
+    if args.validate:
+        checks = {name: CHECKS[name] for name in args.checks.split(",")}
+    start = time.perf_counter()
+    trees = sweep(checks, SETUP if checks else None, args.jobs)
+    report = format_report(trees, time.perf_counter() - start)
+    if args.report:
+        args.report.write_text(report, encoding="utf-8")
+    else:
+        sys.stdout.write(report)
+    return 1 if any(not check.passed for tree in trees for check in tree.checks) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
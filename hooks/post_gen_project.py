@@ -1,12 +1,20 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
+import gzip
+import json
 import os
 import shutil
 import subprocess
+from collections.abc import Callable
 
 PROJECT_DIRECTORY = os.path.realpath(os.path.curdir)
 
+# Pre-resolved uv lockfiles, one per dependency set; maintained with `python -m cookiecutter_uv_lite.locks`.
+LOCK_BUNDLE = ".uv-locks.json.gz"
+# Only notebooks projects depend on dataframe_backend; the other types share the pandas lockfile.
+LOCK_KEY = "{{cookiecutter.project_type}}-{{cookiecutter.dataframe_backend if cookiecutter.project_type == 'notebooks' else 'pandas'}}-mkdocs_{{cookiecutter.mkdocs}}-github_actions_{{cookiecutter.github_actions}}"
+
 HELP_LOCAL_REPO = """
 You can create a git repository later by creating an empty repository named {{cookiecutter.project_name}} on {{cookiecutter.git_server}}
 and running the following commands
@@ -55,6 +63,29 @@ Next steps:
 Have fun building your CLI!
 """
 
+END_MESSAGE_SERVICE = """
+Next steps:
+  • cd {{cookiecutter.project_name}}
+  • make run           # Start the service with a local stub upstream
+  • make test          # Run your tests
+  • make loadtest      # Report p50/p99 latency and requests per second
+
+Have fun building your service!
+"""
+
+END_MESSAGE_WORKER = """
+Next steps:
+  • cd {{cookiecutter.project_name}}
+  • make test          # Run your tests
+  • make bench-worker  # Report items per second as the worker count grows
+
+Queue and run jobs with:
+  • uv run {{cookiecutter.project_name}} enqueue jobs.db documents.txt
+  • uv run {{cookiecutter.project_name}} run jobs.db    # run again to resume
+
+Have fun building your worker!
+"""
+
 END_MESSAGE_NOTEBOOKS = """
 Next steps:
   • cd {{cookiecutter.project_name}}
@@ -77,6 +108,99 @@ def remove_dir(filepath: str) -> None:
     shutil.rmtree(os.path.join(PROJECT_DIRECTORY, filepath))
 
 
+def paths_to_remove() -> list[str]:
+    """Return the template paths that the selected options do not use. Directories end with a slash.
+
+    Kept free of side effects so that `cookiecutter_uv_lite.render` can apply the same rules in memory.
+    """
+    package_dir = "{{cookiecutter.project_name|lower|replace('-', '_')}}"
+    cli_files = [
+        f"{package_dir}/cli.py",
+        f"{package_dir}/completion.py",
+        f"{package_dir}/output.py",
+        f"{package_dir}/plugins.py",
+        f"{package_dir}/server.py",
+        "tests/test_completion.py",
+        "tests/test_output.py",
+        "tests/test_plugins.py",
+        "tests/test_server.py",
+    ]
+    notebooks_files = [
+        f"{package_dir}/parallel.py",
+        f"{package_dir}/results.py",
+        "tests/test_parallel.py",
+        "tests/test_results.py",
+    ]
+    service_files = [f"{package_dir}/app.py", f"{package_dir}/stub.py", "tests/test_service.py", "scripts/loadtest.py"]
+    worker_files = [
+        f"{package_dir}/jobs.py",
+        f"{package_dir}/tasks.py",
+        f"{package_dir}/worker.py",
+        "tests/test_jobs.py",
+        "tests/test_worker.py",
+        "scripts/bench_worker.py",
+    ]
+    paths = [LOCK_BUNDLE]
+
+    if "{{cookiecutter.mkdocs}}" != "y":
+        paths += ["docs/", "mkdocs.yml"]
+
+    if "{{cookiecutter.github_actions}}" != "y":
+        paths += [".github/"]
+
+    # Handle project type specific cleanup
+    project_type = "{{cookiecutter.project_type}}"
+
+    if project_type == "cli":
+        # Remove standard example.py, keep CLI
+        paths += [f"{package_dir}/example.py", "tests/test_import_time.py", "notebooks/", "data/", *notebooks_files]
+        paths += [*service_files, *worker_files]
+    elif project_type == "notebooks":
+        # Remove example.py, metrics.py, cache.py and the CLI files, keep notebooks and data directories
+        paths += [f"{package_dir}/example.py", f"{package_dir}/metrics.py", "tests/test_metrics.py"]
+        paths += [f"{package_dir}/cache.py", "tests/test_cache.py", "scripts/bench_cache.py"]
+        paths += ["tests/test_import_time.py", *cli_files, *service_files, *worker_files]
+    elif project_type == "service":
+        # Remove example.py, the CLI files and notebooks directories, keep the service, metrics and cache
+        paths += [f"{package_dir}/example.py", "tests/test_import_time.py", *cli_files]
+        paths += ["notebooks/", "data/", *notebooks_files, *worker_files]
+    elif project_type == "worker":
+        # Remove example.py, the CLI, service and notebooks files, keep the worker, metrics and cache
+        paths += [f"{package_dir}/example.py", "tests/test_import_time.py", *cli_files, *service_files]
+        paths += ["notebooks/", "data/", *notebooks_files]
+    else:  # package type (default)
+        # Remove CLI files and notebooks directories for package projects
+        paths += [*cli_files, "notebooks/", "data/", *notebooks_files, *service_files, *worker_files]
+
+    return paths
+
+
+def generated_files(read: Callable[[str], bytes | None]) -> dict[str, str]:
+    """Return the files that the hook derives from template files, keyed by path.
+
+    `read` returns the raw content of a template file, or None if it does not exist.
+    Like `paths_to_remove`, this has no side effects.
+    """
+    data = read(LOCK_BUNDLE)
+    bundle = json.loads(gzip.decompress(data)) if data is not None else {"locks": {}}
+    if LOCK_KEY not in bundle["locks"]:
+        return {}
+    # Lockfiles share most of their [[package]] entries, so the bundle stores each entry once.
+    header, indices = bundle["locks"][LOCK_KEY]
+    lock = "\n[[package]]\n".join([header, *(bundle["packages"][i] for i in indices)])
+    # The lockfiles are resolved for a placeholder name; only the project's own entry carries it.
+    placeholder = 'name = "' + bundle["project_name"] + '"\n'
+    return {"uv.lock": lock.replace(placeholder, 'name = "{{cookiecutter.project_name|lower}}"\n', 1)}
+
+
+def read_template_file(path: str) -> bytes | None:
+    """Return the content of a file of the generated project, or None if it does not exist."""
+    if not os.path.exists(os.path.join(PROJECT_DIRECTORY, path)):
+        return None
+    with open(os.path.join(PROJECT_DIRECTORY, path), "rb") as f:
+        return f.read()
+
+
 def get_exec_path(executable: str) -> str:
     """Used to avoid ruff start-process-with-partial-path (S607)"""
     path = shutil.which(executable)
@@ -173,35 +297,18 @@ def add_remote_git_repo(use_ssh: bool = True) -> bool:
 
 
 if __name__ == "__main__":
-    if "{{cookiecutter.mkdocs}}" != "y":
-        remove_dir("docs")
-        remove_file("mkdocs.yml")
+    for path, content in generated_files(read_template_file).items():
+        with open(os.path.join(PROJECT_DIRECTORY, path), "w", encoding="utf-8") as f:
+            f.write(content)
 
-    if "{{cookiecutter.github_actions}}" != "y":
-        remove_dir(".github")
+    for path in paths_to_remove():
+        if path.endswith("/"):
+            remove_dir(path)
+        else:
+            remove_file(path)
 
-    # Handle project type specific cleanup
     project_type = "{{cookiecutter.project_type}}"
 
-    if project_type == "cli":
-        # Remove standard example.py, keep CLI
-        remove_file("{{cookiecutter.project_name|lower|replace('-', '_')}}/example.py")
-        remove_dir("notebooks")
-        remove_dir("data")
-    elif project_type == "notebooks":
-        # Remove example.py and cli.py, keep notebooks and data directories
-        remove_file("{{cookiecutter.project_name|lower|replace('-', '_')}}/example.py")
-        cli_file = os.path.join(PROJECT_DIRECTORY, "{{cookiecutter.project_name|lower|replace('-', '_')}}", "cli.py")
-        if os.path.exists(cli_file):
-            remove_file("{{cookiecutter.project_name|lower|replace('-', '_')}}/cli.py")
-    else:  # package type (default)
-        # Remove CLI file and notebooks directories for package projects
-        cli_file = os.path.join(PROJECT_DIRECTORY, "{{cookiecutter.project_name|lower|replace('-', '_')}}", "cli.py")
-        if os.path.exists(cli_file):
-            remove_file("{{cookiecutter.project_name|lower|replace('-', '_')}}/cli.py")
-        remove_dir("notebooks")
-        remove_dir("data")
-
     # Create environment (skip in test mode for performance):
     skip_install = os.environ.get("COOKIECUTTER_SKIP_INSTALL", "").lower() == "true"
     if not skip_install:
@@ -258,5 +365,9 @@ if __name__ == "__main__":
         print(END_MESSAGE_CLI)
     elif project_type == "notebooks":
         print(END_MESSAGE_NOTEBOOKS)
+    elif project_type == "service":
+        print(END_MESSAGE_SERVICE)
+    elif project_type == "worker":
+        print(END_MESSAGE_WORKER)
     else:  # package
         print(END_MESSAGE_PACKAGE)
@@ -0,0 +1,119 @@
+"""Jinja extensions loaded by cookiecutter for this template (see `_extensions` in cookiecutter.json)."""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import hashlib
+import os
+from pathlib import Path
+from typing import Any
+
+from jinja2 import Environment, FileSystemBytecodeCache, Template
+from jinja2.bccache import Bucket
+from jinja2.ext import Extension
+
+CACHE_DIR_ENV = "COOKIECUTTER_UV_LITE_CACHE_DIR"
+NO_CACHE_ENV = "COOKIECUTTER_UV_LITE_NO_CACHE"
+# Compiled templates kept on disk. Strings that embed a bake's output path add entries on every bake,
+# so the least recently used ones beyond this are removed when a bake starts.
+MAX_CACHE_ENTRIES = 2000
+
+
+def cache_dir() -> Path:
+    """Return the directory that holds compiled templates."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "cookiecutter-uv-lite" / "jinja"
+
+
+class ContentHashBytecodeCache(FileSystemBytecodeCache):
+    """Bytecode cache keyed on template name and content instead of the file's location.
+
+    Bakes from different checkouts of the template share entries, and editing a
+    template simply produces a new key, so stale code is never loaded.
+    """
+
+    def get_bucket(self, environment: Environment, name: str, filename: str | None, source: str) -> Bucket:
+        # Compiled code depends on the environment's extensions as well as on the source.
+        config = ",".join(sorted(environment.extensions))
+        key = hashlib.sha256(f"{name}\0{config}\0{source}".encode()).hexdigest()
+        bucket = Bucket(environment, key, self.get_source_checksum(source))
+        self.load_bytecode(bucket)
+        return bucket
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        super().load_bytecode(bucket)
+        if bucket.code is not None:
+            # Mark the entry as recently used, for `prune`.
+            with contextlib.suppress(OSError):
+                os.utime(os.path.join(self.directory, self.pattern % (bucket.key,)))
+
+    def prune(self, max_entries: int = MAX_CACHE_ENTRIES) -> int:
+        """Remove the least recently used entries beyond `max_entries`; return how many were removed."""
+        prefix, suffix = self.pattern.split("%s")
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.startswith(prefix) and entry.name.endswith(suffix):
+                    with contextlib.suppress(OSError):
+                        entries.append((entry.stat().st_mtime, entry.path))
+        if len(entries) <= max_entries:
+            return 0
+        entries.sort(reverse=True)
+        removed = 0
+        for _, path in entries[max_entries:]:
+            with contextlib.suppress(OSError):
+                os.remove(path)
+                removed += 1
+        return removed
+
+
+def _cached_from_string(
+    environment: Environment,
+    source: str,
+    globals: dict[str, Any] | None = None,  # noqa: A002 | same signature as Environment.from_string
+    template_class: type[Template] | None = None,
+) -> Template:
+    """`Environment.from_string` that reuses compiled code from the bytecode cache."""
+    cls = template_class or environment.template_class
+    cache = environment.bytecode_cache
+    if cache is None or "{" not in source:
+        # Plain text such as already rendered paths: compiling is trivial and caching it would only
+        # fill the cache with one-off entries.
+        return cls.from_code(environment, environment.compile(source), environment.make_globals(globals), None)
+    bucket = cache.get_bucket(environment, "<string>", None, source)
+    if bucket.code is None:
+        bucket.code = environment.compile(source)
+        cache.set_bucket(bucket)
+    return cls.from_code(environment, bucket.code, environment.make_globals(globals), None)
+
+
+class BytecodeCacheExtension(Extension):
+    """Persist compiled templates on disk so that repeated bakes skip recompilation.
+
+    Covers the project files (loaded through `get_template`) as well as the strings
+    cookiecutter compiles with `from_string`: path names, prompts and hook scripts.
+    The cache keeps the MAX_CACHE_ENTRIES most recently used entries. Set
+    COOKIECUTTER_UV_LITE_NO_CACHE=1 to disable it, or COOKIECUTTER_UV_LITE_CACHE_DIR
+    to move the cache.
+    """
+
+    def __init__(self, environment: Environment) -> None:
+        super().__init__(environment)
+        if os.environ.get(NO_CACHE_ENV) or environment.bytecode_cache is not None:
+            return
+        directory = cache_dir()
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return  # Read-only home or similar: bake without a cache.
+        cache = ContentHashBytecodeCache(str(directory))
+        try:
+            cache.prune()
+        except OSError:
+            return
+        environment.bytecode_cache = cache
+        environment.from_string = functools.partial(_cached_from_string, environment)  # type: ignore[method-assign]
@@ -6,9 +6,19 @@ import os
 
 import pytest
 
+from cookiecutter_uv_lite.render import render_project
 from tests.utils import run_within_dir
 
 
+@pytest.fixture(autouse=True, scope="session")
+def template_cache_dir(tmp_path_factory):
+    """Keep compiled templates from the test bakes out of the developer's real cache."""
+    with pytest.MonkeyPatch.context() as mp:
+        path = tmp_path_factory.mktemp("jinja-cache")
+        mp.setenv("COOKIECUTTER_UV_LITE_CACHE_DIR", str(path))
+        yield path
+
+
 @pytest.fixture
 def baked_project(cookies, tmp_path):
     """Fixture that bakes a project with default settings.
@@ -44,3 +54,19 @@ def baked_project(cookies, tmp_path):
                     os.environ["COOKIECUTTER_SKIP_INSTALL"] = original_skip
 
     return _bake
+
+
+@pytest.fixture
+def rendered_project():
+    """Fixture that renders a project into memory with default settings.
+
+    Returns a callable that accepts extra_context kwargs and returns the
+    generated files as a mapping of relative path to content. Nothing is
+    written to disk and no hooks run subprocesses, so use it for content
+    checks and `baked_project` only for tests that need a real tree.
+    """
+
+    def _render(**extra_context):
+        return render_project({"git_repo": "n", **extra_context})
+
+    return _render
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import json
+import os
 import shlex
+import shutil
 import subprocess
+import sys
+import time
 from unittest.mock import patch
 
 import pytest
+from cookiecutter.exceptions import FailedHookException
 
-from tests.utils import file_contains_text, run_within_dir
+from cookiecutter_uv_lite import locks, sweep
+from cookiecutter_uv_lite.render import render_project
+from tests.utils import has_dir, run_within_dir
 
 # Template placeholder for package_name derivation
 PACKAGE_NAME_PLACEHOLDER = "{{cookiecutter.project_name|lower|replace('-', '_')}}"
@@ -16,7 +24,7 @@ PACKAGE_NAME_PLACEHOLDER = "{{cookiecutter.project_name|lower|replace('-', '_')}
 # ============================================================================
 
 
-@pytest.mark.parametrize("project_type", ["package", "cli", "notebooks"])
+@pytest.mark.parametrize("project_type", ["package", "cli", "notebooks", "service", "worker"])
 def test_bake_project(baked_project, project_type):
     """Test basic project baking with custom name for all project types."""
     result = baked_project(project_name="my-project", project_type=project_type)
@@ -24,6 +32,19 @@ def test_bake_project(baked_project, project_type):
     assert result.project_path.name == "my-project"
 
 
+@pytest.mark.parametrize("project_type", ["package", "cli", "notebooks", "service", "worker"])
+def test_render_matches_bake(baked_project, rendered_project, project_type):
+    """Test that the in-memory render produces exactly the files of a real bake."""
+    result = baked_project(project_type=project_type)
+    baked = {
+        path.relative_to(result.project_path).as_posix(): path.read_text()
+        for path in result.project_path.rglob("*")
+        if path.is_file()
+    }
+
+    assert rendered_project(project_type=project_type) == baked
+
+
 def test_using_pytest(baked_project):
     """Test that generated project can run its own tests."""
     result = baked_project(_needs_install=True)
@@ -61,17 +82,17 @@ def test_cli_main():
         (None, None, ["tox.ini"], True),
     ],
 )
-def test_optional_files(baked_project, feature, enabled, files_to_check, should_exist):
+def test_optional_files(rendered_project, feature, enabled, files_to_check, should_exist):
     """Test that optional features create/remove expected files."""
     context = {feature: enabled} if feature else {}
-    result = baked_project(**context)
+    files = rendered_project(**context)
 
     for file_path in files_to_check:
-        full_path = result.project_path / file_path
+        exists = file_path in files or has_dir(files, file_path)
         if should_exist:
-            assert full_path.exists(), f"Expected {file_path} to exist"
+            assert exists, f"Expected {file_path} to exist"
         else:
-            assert not full_path.exists(), f"Expected {file_path} to not exist"
+            assert not exists, f"Expected {file_path} to not exist"
 
 
 @pytest.mark.parametrize(
@@ -81,15 +102,14 @@ def test_optional_files(baked_project, feature, enabled, files_to_check, should_
         ("n", None),
     ],
 )
-def test_mkdocs_makefile_targets(baked_project, mkdocs, expected_in_makefile):
+def test_mkdocs_makefile_targets(rendered_project, mkdocs, expected_in_makefile):
     """Test that MkDocs-related Makefile targets are conditionally included."""
-    result = baked_project(mkdocs=mkdocs)
-    makefile = result.project_path / "Makefile"
+    makefile = rendered_project(mkdocs=mkdocs)["Makefile"]
 
     if expected_in_makefile:
-        assert file_contains_text(str(makefile), expected_in_makefile)
+        assert expected_in_makefile in makefile
     else:
-        assert not file_contains_text(str(makefile), "docs:")
+        assert "docs:" not in makefile
 
 
 @pytest.mark.parametrize(
@@ -100,17 +120,15 @@ def test_mkdocs_makefile_targets(baked_project, mkdocs, expected_in_makefile):
         ("y", "n", False),  # No CI files at all
     ],
 )
-def test_codecov_integration(baked_project, codecov, github_actions, should_have_codecov):
+def test_codecov_integration(rendered_project, codecov, github_actions, should_have_codecov):
     """Test that Codecov integration is conditionally added to CI."""
-    result = baked_project(codecov=codecov, github_actions=github_actions)
-    ci_file = result.project_path / ".github/workflows/ci.yml"
+    files = rendered_project(codecov=codecov, github_actions=github_actions)
 
     if github_actions == "y":
-        assert ci_file.exists()
-        has_codecov = file_contains_text(str(ci_file), "CODECOV_TOKEN")
+        has_codecov = "CODECOV_TOKEN" in files[".github/workflows/ci.yml"]
         assert has_codecov == should_have_codecov
     else:
-        assert not ci_file.exists()
+        assert ".github/workflows/ci.yml" not in files
 
 
 # ============================================================================
@@ -118,7 +136,7 @@ def test_codecov_integration(baked_project, codecov, github_actions, should_have
 # ============================================================================
 
 
-@pytest.mark.parametrize("project_type", ["package", "cli", "notebooks"])
+@pytest.mark.parametrize("project_type", ["package", "cli", "notebooks", "service", "worker"])
 @pytest.mark.parametrize(
     "file_path,expected_contents",
     [
@@ -127,14 +145,13 @@ def test_codecov_integration(baked_project, codecov, github_actions, should_have
         ("tox.ini", ["[tox]"]),
     ],
 )
-def test_config_file_content(baked_project, project_type, file_path, expected_contents):
+def test_config_file_content(rendered_project, project_type, file_path, expected_contents):
     """Test that configuration files contain expected content for all project types."""
-    result = baked_project(project_type=project_type)
-    config_file = result.project_path / file_path
+    files = rendered_project(project_type=project_type)
 
-    assert config_file.exists(), f"{file_path} should exist"
+    assert file_path in files, f"{file_path} should exist"
     for content in expected_contents:
-        assert file_contains_text(str(config_file), content), f"{file_path} should contain '{content}'"
+        assert content in files[file_path], f"{file_path} should contain '{content}'"
 
 
 @pytest.mark.parametrize(
@@ -146,14 +163,12 @@ def test_config_file_content(baked_project, project_type, file_path, expected_co
         ("build", ["pyproject-build"]),
     ],
 )
-def test_makefile_targets(baked_project, target, expected_content):
+def test_makefile_targets(rendered_project, target, expected_content):
     """Test that Makefile targets contain expected commands."""
-    result = baked_project()
-    makefile = result.project_path / "Makefile"
+    makefile = rendered_project()["Makefile"]
 
-    assert makefile.exists()
     for content in expected_content:
-        assert file_contains_text(str(makefile), content), f"Makefile should contain '{content}' in {target} target"
+        assert content in makefile, f"Makefile should contain '{content}' in {target} target"
 
 
 # ============================================================================
@@ -161,7 +176,7 @@ def test_makefile_targets(baked_project, target, expected_content):
 # ============================================================================
 
 
-@pytest.mark.parametrize("project_type", ["package", "cli", "notebooks"])
+@pytest.mark.parametrize("project_type", ["package", "cli", "notebooks", "service", "worker"])
 @pytest.mark.parametrize(
     "project_name,expected_package_name",
     [
@@ -171,14 +186,11 @@ def test_makefile_targets(baked_project, target, expected_content):
         ("a-b-c-d", "a_b_c_d"),
     ],
 )
-def test_package_name_derivation(baked_project, project_type, project_name, expected_package_name):
+def test_package_name_derivation(rendered_project, project_type, project_name, expected_package_name):
     """Test that package names are correctly derived from project names for all types."""
-    result = baked_project(project_name=project_name, project_type=project_type)
+    files = rendered_project(project_name=project_name, project_type=project_type)
 
-    assert result.project_path.name == project_name
-    package_dir = result.project_path / expected_package_name
-    assert package_dir.is_dir(), f"Package directory {expected_package_name} should exist"
-    assert (package_dir / "__init__.py").is_file()
+    assert f"{expected_package_name}/__init__.py" in files, f"Package directory {expected_package_name} should exist"
 
 
 @pytest.mark.parametrize(
@@ -197,6 +209,9 @@ def test_invalid_project_names(cookies, tmp_path, invalid_name, reason):
         assert result.exit_code != 0, f"Should reject project name that {reason}"
         assert result.exception is not None
 
+    with pytest.raises(FailedHookException):
+        render_project({"project_name": invalid_name})
+
 
 # ============================================================================
 # Dependency and Content Tests
@@ -210,28 +225,26 @@ def test_invalid_project_names(cookies, tmp_path, invalid_name, reason):
         ("n", False),
     ],
 )
-def test_mkdocs_dependencies(baked_project, mkdocs, should_have_mkdocs_deps):
+def test_mkdocs_dependencies(rendered_project, mkdocs, should_have_mkdocs_deps):
     """Test that MkDocs dependencies are conditionally included in pyproject.toml."""
-    result = baked_project(mkdocs=mkdocs)
-    pyproject = result.project_path / "pyproject.toml"
+    pyproject = rendered_project(mkdocs=mkdocs)["pyproject.toml"]
 
-    assert pyproject.exists()
-    has_mkdocs = file_contains_text(str(pyproject), "mkdocs")
+    has_mkdocs = "mkdocs" in pyproject
     assert has_mkdocs == should_have_mkdocs_deps
 
 
-@pytest.mark.parametrize("project_type", ["package", "cli", "notebooks"])
-def test_pyproject_metadata(baked_project, project_type):
+@pytest.mark.parametrize("project_type", ["package", "cli", "notebooks", "service", "worker"])
+def test_pyproject_metadata(rendered_project, project_type):
     """Test that pyproject.toml contains correct project metadata for all types."""
-    result = baked_project(
+    files = rendered_project(
         project_name="test-app",
         project_description="A test application",
         project_type=project_type,
     )
-    pyproject = result.project_path / "pyproject.toml"
+    pyproject = files["pyproject.toml"]
 
-    assert file_contains_text(str(pyproject), 'name = "test-app"')
-    assert file_contains_text(str(pyproject), "A test application")
+    assert 'name = "test-app"' in pyproject
+    assert "A test application" in pyproject
 
 
 @pytest.mark.parametrize(
@@ -242,20 +255,17 @@ def test_pyproject_metadata(baked_project, project_type):
         ("notebooks", "make jupyter"),
     ],
 )
-def test_readme_content(baked_project, project_type, expected_content):
+def test_readme_content(rendered_project, project_type, expected_content):
     """Test that README contains project-type-specific instructions."""
-    result = baked_project(
+    files = rendered_project(
         project_name="awesome-project",
         project_description="An awesome test project",
         project_type=project_type,
     )
-    readme = result.project_path / "README.md"
+    readme = files["README.md"]
 
-    assert readme.exists()
-    assert file_contains_text(str(readme), "awesome-project")
-    assert file_contains_text(
-        str(readme), expected_content
-    ), f"README should contain '{expected_content}' for {project_type}"
+    assert "awesome-project" in readme
+    assert expected_content in readme, f"README should contain '{expected_content}' for {project_type}"
 
 
 # ============================================================================
@@ -263,7 +273,7 @@ def test_readme_content(baked_project, project_type, expected_content):
 # ============================================================================
 
 
-@pytest.mark.parametrize("project_type", ["package", "cli", "notebooks"])
+@pytest.mark.parametrize("project_type", ["package", "cli", "notebooks", "service", "worker"])
 @pytest.mark.parametrize(
     "features",
     [
@@ -274,20 +284,20 @@ def test_readme_content(baked_project, project_type, expected_content):
     ],
     ids=["all-features", "ci-only", "docs-only", "minimal"],
 )
-def test_feature_combinations(baked_project, project_type, features):
+def test_feature_combinations(rendered_project, project_type, features):
     """Test that various feature combinations work with all project types."""
-    result = baked_project(project_type=project_type, **features)
+    files = rendered_project(project_type=project_type, **features)
 
     # Verify features are correctly enabled/disabled
-    assert (result.project_path / ".github").is_dir() == (features["github_actions"] == "y")
-    assert (result.project_path / "docs").is_dir() == (features["mkdocs"] == "y")
-    assert (result.project_path / "mkdocs.yml").is_file() == (features["mkdocs"] == "y")
+    assert has_dir(files, ".github") == (features["github_actions"] == "y")
+    assert has_dir(files, "docs") == (features["mkdocs"] == "y")
+    assert ("mkdocs.yml" in files) == (features["mkdocs"] == "y")
 
     # Verify basic structure is always present
-    assert (result.project_path / "pyproject.toml").is_file()
-    assert (result.project_path / "Makefile").is_file()
-    assert (result.project_path / ".pre-commit-config.yaml").is_file()
-    assert (result.project_path / "tests").is_dir()
+    assert "pyproject.toml" in files
+    assert "Makefile" in files
+    assert ".pre-commit-config.yaml" in files
+    assert has_dir(files, "tests")
 
 
 # ============================================================================
@@ -300,30 +310,236 @@ def test_feature_combinations(baked_project, project_type, features):
     [
         (
             "package",
-            ["{PACKAGE_NAME_PLACEHOLDER}/example.py"],
-            ["{PACKAGE_NAME_PLACEHOLDER}/cli.py", "notebooks", "data"],
+            [
+                "{PACKAGE_NAME_PLACEHOLDER}/example.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/metrics.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/cache.py",
+                "tests/test_import_time.py",
+                "tests/test_metrics.py",
+                "tests/test_cache.py",
+                "scripts/bench_cache.py",
+            ],
+            [
+                "{PACKAGE_NAME_PLACEHOLDER}/cli.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/completion.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/output.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/plugins.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/server.py",
+                "tests/test_completion.py",
+                "tests/test_output.py",
+                "tests/test_plugins.py",
+                "tests/test_server.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/parallel.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/results.py",
+                "tests/test_parallel.py",
+                "tests/test_results.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/app.py",
+                "tests/test_service.py",
+                "scripts/loadtest.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/worker.py",
+                "tests/test_worker.py",
+                "scripts/bench_worker.py",
+                "notebooks",
+                "data",
+            ],
+        ),
+        (
+            "cli",
+            [
+                "{PACKAGE_NAME_PLACEHOLDER}/cli.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/completion.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/output.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/plugins.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/server.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/metrics.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/cache.py",
+                "tests/test_completion.py",
+                "tests/test_output.py",
+                "tests/test_plugins.py",
+                "tests/test_server.py",
+                "tests/test_metrics.py",
+                "tests/test_cache.py",
+                "scripts/bench_cache.py",
+            ],
+            [
+                "{PACKAGE_NAME_PLACEHOLDER}/example.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/parallel.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/results.py",
+                "tests/test_import_time.py",
+                "tests/test_parallel.py",
+                "tests/test_results.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/app.py",
+                "tests/test_service.py",
+                "scripts/loadtest.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/worker.py",
+                "tests/test_worker.py",
+                "scripts/bench_worker.py",
+                "notebooks",
+                "data",
+            ],
         ),
-        ("cli", ["{PACKAGE_NAME_PLACEHOLDER}/cli.py"], ["{PACKAGE_NAME_PLACEHOLDER}/example.py", "notebooks", "data"]),
         (
             "notebooks",
-            ["{PACKAGE_NAME_PLACEHOLDER}/utils.py", "notebooks", "data"],
-            ["{PACKAGE_NAME_PLACEHOLDER}/example.py", "{PACKAGE_NAME_PLACEHOLDER}/cli.py"],
+            [
+                "{PACKAGE_NAME_PLACEHOLDER}/utils.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/parallel.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/results.py",
+                "tests/test_parallel.py",
+                "tests/test_results.py",
+                "notebooks",
+                "data",
+            ],
+            [
+                "{PACKAGE_NAME_PLACEHOLDER}/example.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/cli.py",
+                "tests/test_import_time.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/completion.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/output.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/plugins.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/server.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/metrics.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/cache.py",
+                "tests/test_completion.py",
+                "tests/test_output.py",
+                "tests/test_plugins.py",
+                "tests/test_server.py",
+                "tests/test_metrics.py",
+                "tests/test_cache.py",
+                "scripts/bench_cache.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/app.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/stub.py",
+                "tests/test_service.py",
+                "scripts/loadtest.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/worker.py",
+                "tests/test_worker.py",
+                "scripts/bench_worker.py",
+            ],
+        ),
+        (
+            "service",
+            [
+                "{PACKAGE_NAME_PLACEHOLDER}/app.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/stub.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/metrics.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/cache.py",
+                "tests/test_service.py",
+                "tests/test_metrics.py",
+                "tests/test_cache.py",
+                "scripts/loadtest.py",
+                "scripts/bench_cache.py",
+            ],
+            [
+                "{PACKAGE_NAME_PLACEHOLDER}/example.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/cli.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/completion.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/output.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/plugins.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/server.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/parallel.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/results.py",
+                "tests/test_import_time.py",
+                "tests/test_completion.py",
+                "tests/test_output.py",
+                "tests/test_plugins.py",
+                "tests/test_server.py",
+                "tests/test_parallel.py",
+                "tests/test_results.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/worker.py",
+                "tests/test_worker.py",
+                "scripts/bench_worker.py",
+                "notebooks",
+                "data",
+            ],
+        ),
+        (
+            "worker",
+            [
+                "{PACKAGE_NAME_PLACEHOLDER}/jobs.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/tasks.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/worker.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/metrics.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/cache.py",
+                "tests/test_jobs.py",
+                "tests/test_worker.py",
+                "tests/test_metrics.py",
+                "tests/test_cache.py",
+                "scripts/bench_worker.py",
+                "scripts/bench_cache.py",
+            ],
+            [
+                "{PACKAGE_NAME_PLACEHOLDER}/example.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/cli.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/server.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/parallel.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/results.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/app.py",
+                "{PACKAGE_NAME_PLACEHOLDER}/stub.py",
+                "tests/test_import_time.py",
+                "tests/test_server.py",
+                "tests/test_parallel.py",
+                "tests/test_results.py",
+                "tests/test_service.py",
+                "scripts/loadtest.py",
+                "notebooks",
+                "data",
+            ],
         ),
     ],
 )
-def test_project_type_files(baked_project, project_type, expected_files, not_expected):
+def test_project_type_files(rendered_project, project_type, expected_files, not_expected):
     """Test correct files exist for each project type."""
-    result = baked_project(project_type=project_type)
+    files = rendered_project(project_type=project_type, project_name="my-project")
 
     for file_path in expected_files:
-        actual_path = file_path.replace("{PACKAGE_NAME_PLACEHOLDER}", result.project_path.name.replace("-", "_"))
-        full_path = result.project_path / actual_path
-        assert full_path.exists(), f"Expected {file_path} for {project_type}"
+        actual_path = file_path.replace("{PACKAGE_NAME_PLACEHOLDER}", "my_project")
+        assert actual_path in files or has_dir(files, actual_path), f"Expected {file_path} for {project_type}"
 
     for file_path in not_expected:
-        actual_path = file_path.replace("{PACKAGE_NAME_PLACEHOLDER}", result.project_path.name.replace("-", "_"))
-        full_path = result.project_path / actual_path
-        assert not full_path.exists(), f"Did not expect {file_path} for {project_type}"
+        actual_path = file_path.replace("{PACKAGE_NAME_PLACEHOLDER}", "my_project")
+        assert actual_path not in files, f"Did not expect {file_path} for {project_type}"
+        assert not has_dir(files, actual_path), f"Did not expect {file_path} for {project_type}"
+
+
+@pytest.mark.parametrize(
+    "project_type,lazy_exports",
+    [("package", True), ("cli", False), ("notebooks", False), ("service", False), ("worker", False)],
+)
+def test_package_lazy_exports(rendered_project, project_type, lazy_exports):
+    """Test package projects get lazy exports and an import-time budget."""
+    files = rendered_project(project_type=project_type, project_name="my-project")
+
+    assert ("def __getattr__(name: str)" in files["my_project/__init__.py"]) == lazy_exports
+    assert ("[tool.import-budget]" in files["pyproject.toml"]) == lazy_exports
+
+
+def test_cli_metrics_option(rendered_project):
+    """Test CLI commands are timed and exported with --metrics-out."""
+    cli_file = rendered_project(project_type="cli", project_name="my-project")["my_project/cli.py"]
+
+    assert "metrics.enable()" in cli_file
+    assert '"--metrics-out"' in cli_file
+    assert "@metrics.timed(" in cli_file
+
+
+def test_cli_output_option(rendered_project):
+    """Test CLI commands write records through the --output abstraction."""
+    cli_file = rendered_project(project_type="cli", project_name="my-project")["my_project/cli.py"]
+
+    assert '"--output"' in cli_file
+    assert "out.emit(" in cli_file
+    assert "from rich" not in cli_file
+
+
+@pytest.mark.parametrize(
+    "project_type,has_completions",
+    [("cli", True), ("package", False), ("notebooks", False), ("service", False), ("worker", False)],
+)
+def test_shell_completion_target(rendered_project, project_type, has_completions):
+    """Test static shell completion scripts are generated on install only for CLI projects."""
+    makefile = rendered_project(project_type=project_type)["Makefile"]
+
+    assert ("completions: ## Generate static" in makefile) == has_completions
+    assert ("$(MAKE) --no-print-directory completions" in makefile) == has_completions
 
 
 @pytest.mark.parametrize(
@@ -333,13 +549,12 @@ def test_project_type_files(baked_project, project_type, expected_files, not_exp
         ("package", False),
     ],
 )
-def test_cli_dependencies(baked_project, project_type, should_have_cli_deps):
+def test_cli_dependencies(rendered_project, project_type, should_have_cli_deps):
     """Test CLI dependencies are present only in CLI projects."""
-    result = baked_project(project_type=project_type)
-    pyproject = result.project_path / "pyproject.toml"
+    pyproject = rendered_project(project_type=project_type)["pyproject.toml"]
 
-    has_typer = file_contains_text(str(pyproject), "typer")
-    has_rich = file_contains_text(str(pyproject), "rich")
+    has_typer = "typer" in pyproject
+    has_rich = "rich" in pyproject
 
     assert has_typer == should_have_cli_deps, f"typer dependency for {project_type}"
     assert has_rich == should_have_cli_deps, f"rich dependency for {project_type}"
@@ -352,13 +567,13 @@ def test_cli_dependencies(baked_project, project_type, should_have_cli_deps):
         ("cli", True),
     ],
 )
-def test_cli_entry_point(baked_project, project_type, has_scripts):
+def test_cli_entry_point(rendered_project, project_type, has_scripts):
     """Test CLI projects have entry point configuration."""
-    result = baked_project(project_type=project_type)
-    pyproject = result.project_path / "pyproject.toml"
+    pyproject = rendered_project(project_type=project_type)["pyproject.toml"]
 
-    has_section = file_contains_text(str(pyproject), "[project.scripts]")
+    has_section = "[project.scripts]" in pyproject
     assert has_section == has_scripts
+    assert ("-warm = " in pyproject) == has_scripts
 
 
 @pytest.mark.parametrize(
@@ -368,15 +583,128 @@ def test_cli_entry_point(baked_project, project_type, has_scripts):
         ("package", False),
     ],
 )
-def test_makefile_run_target(baked_project, project_type, should_have_run_target):
+def test_makefile_run_target(rendered_project, project_type, should_have_run_target):
     """Test run target is present only in CLI projects."""
-    result = baked_project(project_type=project_type)
-    makefile = result.project_path / "Makefile"
+    makefile = rendered_project(project_type=project_type)["Makefile"]
 
-    has_run_target = file_contains_text(str(makefile), "run: ## Run the CLI application")
+    has_run_target = "run: ## Run the CLI application" in makefile
     assert has_run_target == should_have_run_target, f"run target for {project_type}"
 
 
+@pytest.mark.parametrize("project_type", ["package", "cli", "notebooks", "service", "worker"])
+def test_synthetic_data_fixture(rendered_project, project_type):
+    """Test that notebooks projects can run their tests against synthetic data of any size."""
+    conftest = rendered_project(project_type=project_type)["tests/conftest.py"]
+
+    assert ('"--synthetic-rows"' in conftest) == (project_type == "notebooks")
+    assert ("def synthetic_data(n_rows)" in conftest) == (project_type == "notebooks")
+
+
+def test_service_project(rendered_project):
+    """Test service projects get an entry point, uvloop on POSIX, and the run and loadtest targets."""
+    files = rendered_project(project_type="service", project_name="my-project")
+
+    assert 'my-project = "my_project.app:main"' in files["pyproject.toml"]
+    assert '"aiohttp>=' in files["pyproject.toml"]
+    assert "uvloop>=0.19.0; sys_platform != 'win32'" in files["pyproject.toml"]
+    assert "run: ## Run the service" in files["Makefile"]
+    assert "loadtest: ## Load a local server" in files["Makefile"]
+    assert "::: my_project.app" in files["docs/modules.md"]
+
+
+def test_worker_project(rendered_project):
+    """Test worker projects get an entry point without runtime dependencies, and the benchmark target."""
+    files = rendered_project(project_type="worker", project_name="my-project")
+
+    assert 'my-project = "my_project.worker:main"' in files["pyproject.toml"]
+    assert "dependencies = [" not in files["pyproject.toml"]
+    assert "bench-worker: ## Report items per second" in files["Makefile"]
+    assert "::: my_project.jobs" in files["docs/modules.md"]
+
+
+def test_budget_markers_enforced_under_xdist(rendered_project, tmp_path):
+    """Test that the conftest's time and memory budgets fail slow or hungry tests and report the closest ones."""
+    (tmp_path / "conftest.py").write_text(rendered_project()["tests/conftest.py"])
+    (tmp_path / "test_budgets.py").write_text(
+        "import time\n"
+        "import pytest\n\n"
+        "@pytest.mark.time_budget(5)\n"
+        "def test_fast():\n    pass\n\n"
+        "@pytest.mark.time_budget(0.05)\n"
+        "def test_slow():\n    time.sleep(0.2)\n\n"
+        "@pytest.mark.memory_budget(1)\n"
+        "def test_hungry():\n    data = bytearray(4 * 2**20)\n    del data\n\n"
+        "@pytest.mark.memory_budget(mb=8)\n"
+        "def test_frugal():\n    data = bytearray(2**20)\n    del data\n"
+    )
+
+    def run(*args: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [sys.executable, "-m", "pytest", "-p", "no:cacheprovider", "-n", "2", *args],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+        )
+
+    result = run()
+    assert result.returncode == 1, result.stdout
+    assert "2 failed, 2 passed" in result.stdout
+    assert "time budget exceeded" in result.stdout
+    assert "memory budget exceeded" in result.stdout
+    assert "(tolerance 50%)" in result.stdout
+    table = result.stdout.split("performance budgets closest to their limits")[1]
+    assert table.index("test_hungry") < table.index("test_frugal") < table.index("test_fast")
+
+    assert run("--budget-tolerance", "10").returncode == 0
+
+
+def test_shared_fixture_built_once_across_xdist_workers(rendered_project, tmp_path):
+    """Test that a shared fixture is built once for all workers, reused by later runs and rebuilt when it changes."""
+    conftest = rendered_project()["tests/conftest.py"]
+    fixture = (
+        "\n\n@shared_fixture\n"
+        "def big_array():\n"
+        "    import numpy as np\n"
+        "    with open('builds.log', 'a') as log:\n"
+        "        log.write('built\\n')\n"
+        "    return np.arange(1_000_000)\n"
+    )
+    (tmp_path / "conftest.py").write_text(conftest + fixture)
+    (tmp_path / "test_shared.py").write_text(
+        "".join(
+            f"def test_{i}(big_array):\n    assert big_array[-1] == 999_999\n    assert not big_array.flags.writeable\n\n"
+            for i in range(6)
+        )
+    )
+
+    def run() -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [sys.executable, "-m", "pytest", "-n", "2"], cwd=tmp_path, capture_output=True, text=True, check=False
+        )
+
+    for _ in range(2):
+        result = run()
+        assert result.returncode == 0, result.stdout
+    assert (tmp_path / "builds.log").read_text() == "built\n"
+
+    (tmp_path / "conftest.py").write_text(conftest + fixture.replace("'built", "'rebuilt"))
+    assert run().returncode == 0
+    assert (tmp_path / "builds.log").read_text() == "built\nrebuilt\n"
+    cached = list((tmp_path / ".pytest_cache" / "d" / "shared_fixtures").glob("*.pickle"))
+    assert len(cached) == 1
+
+
+@pytest.mark.parametrize(
+    "project_type,has_cache",
+    [("package", True), ("cli", True), ("notebooks", False), ("service", True), ("worker", True)],
+)
+def test_makefile_bench_cache_target(rendered_project, project_type, has_cache):
+    """Test the cache benchmark target ships with the cache module."""
+    makefile = rendered_project(project_type=project_type)["Makefile"]
+
+    assert ("bench-cache: ## Compare the overhead of the cache module" in makefile) == has_cache
+
+
 @pytest.mark.parametrize(
     "project_type,expected_in_tests",
     [
@@ -384,15 +712,55 @@ def test_makefile_run_target(baked_project, project_type, should_have_run_target
         ("package", "@pytest.mark.parametrize"),
     ],
 )
-def test_project_type_test_content(baked_project, project_type, expected_in_tests):
+def test_project_type_test_content(rendered_project, project_type, expected_in_tests):
     """Test that generated test files contain type-appropriate content."""
-    result = baked_project(project_type=project_type)
-    test_file = result.project_path / "tests" / "test_example.py"
+    test_file = rendered_project(project_type=project_type)["tests/test_example.py"]
+
+    assert expected_in_tests in test_file, f"Test file should contain '{expected_in_tests}' for {project_type}"
+
+
+@pytest.mark.parametrize("project_type", ["package", "cli", "notebooks", "service", "worker"])
+def test_test_matrix_target(rendered_project, project_type):
+    """Test that every project type can run its tests on all supported Python versions."""
+    files = rendered_project(project_type=project_type)
+
+    assert "test-matrix: ## Test every Python version" in files["Makefile"]
+    assert "scripts/test_matrix.py" in files
+    assert ".venvs/" in files[".gitignore"]
+
+
+def test_test_matrix_runs_versions_concurrently(rendered_project, tmp_path):
+    """Test that the matrix script syncs and tests each version in its own environment, concurrently."""
+    project = tmp_path / "project"
+    sweep.write_tree(rendered_project(), project)
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    # Fake uv: logs its arguments and environment, takes `run_seconds` to test and fails the tests on 3.10.
+    run_seconds = 2
+    fake_uv = bin_dir / "uv"
+    fake_uv.write_text(
+        "#!/bin/sh\n"
+        f'echo "$* env=$UV_PROJECT_ENVIRONMENT" >> "{tmp_path}/calls"\n'
+        f'case "$*" in run*) sleep {run_seconds}; case "$UV_PROJECT_ENVIRONMENT" in *3.10) exit 1;; esac;; esac\n'
+    )
+    fake_uv.chmod(0o755)
+    env = {**os.environ, "PATH": f"{bin_dir}{os.pathsep}{os.environ['PATH']}"}
 
-    assert test_file.exists()
-    assert file_contains_text(
-        str(test_file), expected_in_tests
-    ), f"Test file should contain '{expected_in_tests}' for {project_type}"
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "scripts/test_matrix.py", "--jobs", "5"], cwd=project, env=env, capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - start
+
+    assert result.returncode == 1
+    assert "FAIL (test)" in result.stdout
+    assert "4/5 versions passed" in result.stdout
+    calls = (tmp_path / "calls").read_text().splitlines()
+    for version in ["3.9", "3.10", "3.11", "3.12", "3.13"]:
+        assert f"sync --frozen --python {version} env={project}/.venvs/{version}" in calls
+    # Five versions one after another take 5 * run_seconds; concurrently about run_seconds, so leave
+    # plenty of room for slow process start-up on a loaded machine.
+    assert elapsed < 3 * run_seconds
 
 
 @pytest.mark.parametrize("project_type", ["package", "cli"])
@@ -405,7 +773,7 @@ def test_project_type_with_pytest(baked_project, project_type):
         assert subprocess.check_call(shlex.split("uv run pytest -v")) == 0
 
 
-@pytest.mark.parametrize("project_type", ["package", "cli", "notebooks"])
+@pytest.mark.parametrize("project_type", ["package", "cli", "notebooks", "service", "worker"])
 def test_make_check_passes(baked_project, project_type):
     """Test that make check passes for all generated project types."""
     result = baked_project(project_type=project_type, _needs_install=True)
@@ -415,7 +783,7 @@ def test_make_check_passes(baked_project, project_type):
         assert subprocess.check_call(shlex.split("uv run make check")) == 0
 
 
-@pytest.mark.parametrize("project_type", ["package", "cli", "notebooks"])
+@pytest.mark.parametrize("project_type", ["package", "cli", "notebooks", "service", "worker"])
 def test_make_build_passes(baked_project, project_type):
     """Test that make build successfully creates a wheel for all project types."""
     result = baked_project(project_type=project_type, _needs_install=True)
@@ -435,43 +803,38 @@ def test_make_build_passes(baked_project, project_type):
 # ============================================================================
 
 
-def test_notebooks_directory_structure(baked_project):
+def test_notebooks_directory_structure(rendered_project):
     """Test that notebooks project has correct directory structure."""
-    result = baked_project(project_type="notebooks")
+    files = rendered_project(project_type="notebooks")
 
     # Verify notebooks directory exists with sample notebooks
-    notebooks_dir = result.project_path / "notebooks"
-    assert notebooks_dir.is_dir()
-    assert (notebooks_dir / "README.md").is_file()
-    assert (notebooks_dir / "01-exploratory.ipynb").is_file()
-    assert (notebooks_dir / "02-visualization.ipynb").is_file()
+    assert "notebooks/README.md" in files
+    assert "notebooks/01-exploratory.ipynb" in files
+    assert "notebooks/02-visualization.ipynb" in files
 
     # Verify data directory exists
-    data_dir = result.project_path / "data"
-    assert data_dir.is_dir()
-    assert (data_dir / "README.md").is_file()
-    assert (data_dir / ".gitkeep").is_file()
+    assert "data/README.md" in files
+    assert "data/.gitkeep" in files
 
 
-def test_notebooks_dependencies(baked_project):
+def test_notebooks_dependencies(rendered_project):
     """Test that notebooks project has correct dependencies."""
-    result = baked_project(project_type="notebooks")
-    pyproject = result.project_path / "pyproject.toml"
+    pyproject_content = rendered_project(project_type="notebooks")["pyproject.toml"]
 
     # Check main dependencies
-    assert file_contains_text(str(pyproject), "jupyterlab>=4.0.0")
-    assert file_contains_text(str(pyproject), "pandas>=2.0.0")
-    assert file_contains_text(str(pyproject), "numpy>=1.24.0")
-    assert file_contains_text(str(pyproject), "matplotlib>=3.7.0")
-    assert file_contains_text(str(pyproject), "seaborn>=0.12.0")
-    assert file_contains_text(str(pyproject), "ipywidgets>=8.0.0")
+    assert "jupyterlab>=4.0.0" in pyproject_content
+    assert "pandas>=2.0.0" in pyproject_content
+    assert "numpy>=1.24.0" in pyproject_content
+    assert "matplotlib>=3.7.0" in pyproject_content
+    assert "seaborn>=0.12.0" in pyproject_content
+    assert "pyarrow>=14.0.0" in pyproject_content
+    assert "ipywidgets>=8.0.0" in pyproject_content
 
     # Check dev dependencies
-    assert file_contains_text(str(pyproject), "nbval>=0.10.0")
-    assert file_contains_text(str(pyproject), "nbconvert>=7.0.0")
+    assert "nbval>=0.10.0" in pyproject_content
+    assert "nbconvert>=7.0.0" in pyproject_content
 
     # Verify jupyterlab is not in dev dependencies (it's in main dependencies)
-    pyproject_content = pyproject.read_text()
     # Check that jupyterlab appears before [dependency-groups]
     deps_section_idx = pyproject_content.find("dependencies = [")
     dev_section_idx = pyproject_content.find("[dependency-groups]")
@@ -479,83 +842,109 @@ def test_notebooks_dependencies(baked_project):
     assert deps_section_idx < jupyterlab_idx < dev_section_idx
 
 
-def test_notebooks_makefile_targets(baked_project):
+def test_notebooks_makefile_targets(rendered_project):
     """Test that notebooks project has correct Makefile targets."""
-    result = baked_project(project_type="notebooks")
-    makefile = result.project_path / "Makefile"
+    makefile = rendered_project(project_type="notebooks")["Makefile"]
 
     # Check notebooks-specific targets exist
-    assert file_contains_text(str(makefile), "jupyter: ## Start JupyterLab server")
-    assert file_contains_text(str(makefile), "jupyter-notebook: ## Start Jupyter Notebook")
-    assert file_contains_text(str(makefile), "test-notebooks: ## Test notebooks execute without errors")
+    assert "jupyter: ## Start JupyterLab server" in makefile
+    assert "jupyter-notebook: ## Start Jupyter Notebook" in makefile
+    assert "test-notebooks: ## Test notebooks execute without errors" in makefile
 
     # Verify they use correct commands
-    assert file_contains_text(str(makefile), "uv run jupyter lab")
-    assert file_contains_text(str(makefile), "uv run jupyter notebook")
-    assert file_contains_text(str(makefile), "pytest --nbval notebooks/")
+    assert "uv run jupyter lab" in makefile
+    assert "uv run jupyter notebook" in makefile
+    assert "pytest --nbval notebooks/" in makefile
 
     # Kernel registration should be in install target
-    assert file_contains_text(str(makefile), "ipykernel install --user")
-    assert file_contains_text(str(makefile), "PROJECT_NAME :=")
+    assert "ipykernel install --user" in makefile
+    assert "PROJECT_NAME :=" in makefile
 
     # CLI-specific target should not exist
-    assert not file_contains_text(str(makefile), "run: ## Run the CLI application")
+    assert "run: ## Run the CLI application" not in makefile
 
 
-def test_notebooks_utils_module(baked_project):
+def test_notebooks_utils_module(rendered_project):
     """Test that notebooks project has utils.py with data science helpers."""
-    result = baked_project(project_type="notebooks", project_name="my-project")
-    utils_file = result.project_path / "my_project" / "utils.py"
+    utils_file = rendered_project(project_type="notebooks", project_name="my-project")["my_project/utils.py"]
 
-    assert utils_file.is_file()
-    assert file_contains_text(str(utils_file), "def load_sample_data()")
-    assert file_contains_text(str(utils_file), "def setup_plotting_style()")
-    assert file_contains_text(str(utils_file), "pd.DataFrame")
+    assert "def load_sample_data()" in utils_file
+    assert "def setup_plotting_style()" in utils_file
+    assert "pd.DataFrame" in utils_file
 
 
-def test_notebooks_gitignore_entries(baked_project):
+def test_notebooks_gitignore_entries(rendered_project):
     """Test that notebooks project has notebook-specific gitignore entries."""
-    result = baked_project(project_type="notebooks")
-    gitignore = result.project_path / ".gitignore"
+    gitignore = rendered_project(project_type="notebooks")[".gitignore"]
 
     # Check notebook-specific patterns
-    assert file_contains_text(str(gitignore), "*.ipynb_checkpoints")
-    assert file_contains_text(str(gitignore), "*/.ipynb_checkpoints/*")
-    assert file_contains_text(str(gitignore), ".jupyter/")
-    assert file_contains_text(str(gitignore), "*.pkl")
-    assert file_contains_text(str(gitignore), "*.pickle")
+    assert "*.ipynb_checkpoints" in gitignore
+    assert "*/.ipynb_checkpoints/*" in gitignore
+    assert ".jupyter/" in gitignore
+    assert "*.pkl" in gitignore
+    assert "*.pickle" in gitignore
 
 
-def test_notebooks_readme_instructions(baked_project):
+def test_notebooks_readme_instructions(rendered_project):
     """Test that notebooks README contains appropriate instructions."""
-    result = baked_project(project_type="notebooks", project_name="data-project")
-    readme = result.project_path / "README.md"
+    readme = rendered_project(project_type="notebooks", project_name="data-project")["README.md"]
 
-    assert file_contains_text(str(readme), "make jupyter")
-    assert file_contains_text(str(readme), "01-exploratory.ipynb")
-    assert file_contains_text(str(readme), "02-visualization.ipynb")
-    assert file_contains_text(str(readme), "make test-notebooks")
+    assert "make jupyter" in readme
+    assert "01-exploratory.ipynb" in readme
+    assert "02-visualization.ipynb" in readme
+    assert "make test-notebooks" in readme
 
 
-def test_notebooks_sample_notebooks_content(baked_project):
+def test_notebooks_sample_notebooks_content(rendered_project):
     """Test that sample notebooks contain expected content."""
-    result = baked_project(project_type="notebooks", project_name="test-proj")
+    files = rendered_project(project_type="notebooks", project_name="test-proj")
 
     # Check exploratory notebook
-    exploratory_nb = result.project_path / "notebooks" / "01-exploratory.ipynb"
-    assert file_contains_text(str(exploratory_nb), "load_sample_data")
-    assert file_contains_text(str(exploratory_nb), "from test_proj.utils import")
-    assert file_contains_text(str(exploratory_nb), "Exploratory Data Analysis")
-    assert file_contains_text(str(exploratory_nb), "df.describe()")
-    assert file_contains_text(str(exploratory_nb), "df.groupby")
+    exploratory_nb = files["notebooks/01-exploratory.ipynb"]
+    assert "load_sample_data" in exploratory_nb
+    assert "from test_proj.utils import" in exploratory_nb
+    assert "Exploratory Data Analysis" in exploratory_nb
+    assert "df.describe()" in exploratory_nb
+    assert "df.groupby" in exploratory_nb
 
     # Check visualization notebook
-    viz_nb = result.project_path / "notebooks" / "02-visualization.ipynb"
-    assert file_contains_text(str(viz_nb), "matplotlib.pyplot")
-    assert file_contains_text(str(viz_nb), "seaborn")
-    assert file_contains_text(str(viz_nb), "setup_plotting_style")
-    assert file_contains_text(str(viz_nb), "from test_proj.utils import")
-    assert file_contains_text(str(viz_nb), "Data Visualization")
+    viz_nb = files["notebooks/02-visualization.ipynb"]
+    assert "matplotlib.pyplot" in viz_nb
+    assert "seaborn" in viz_nb
+    assert "setup_plotting_style" in viz_nb
+    assert "from test_proj.utils import" in viz_nb
+    assert "Data Visualization" in viz_nb
+
+
+@pytest.mark.parametrize("dataframe_backend", ["pandas", "polars"])
+def test_notebooks_dataframe_backend(rendered_project, dataframe_backend):
+    """Test that the polars backend makes the loaders and sample notebooks lazy, with pandas kept for the edges."""
+    files = rendered_project(project_type="notebooks", project_name="test-proj", dataframe_backend=dataframe_backend)
+    polars = dataframe_backend == "polars"
+
+    assert ("polars>=" in files["pyproject.toml"]) == polars
+    assert "pandas>=2.0.0" in files["pyproject.toml"]
+    utils_file = files["test_proj/utils.py"]
+    assert ("def load_sample_data() -> pl.LazyFrame:" in utils_file) == polars
+    assert ("def to_pandas(" in utils_file) == polars
+    assert ("ProcessPoolExecutor" in utils_file) != polars
+    for notebook in ("notebooks/01-exploratory.ipynb", "notebooks/02-visualization.ipynb"):
+        content = files[notebook]
+        json.loads(content)
+        assert ("import polars as pl" in content) == polars
+        assert ("df.groupby(" in content) != polars
+    assert ("def test_to_pandas_converts_the_query_result" in files["tests/test_notebooks.py"]) == polars
+
+
+@pytest.mark.parametrize("project_type", ["package", "cli", "service", "worker"])
+def test_dataframe_backend_ignored_by_other_types(rendered_project, project_type):
+    """Test that the dataframe backend only changes notebooks projects."""
+    files = {
+        backend: rendered_project(project_type=project_type, dataframe_backend=backend)
+        for backend in ("pandas", "polars")
+    }
+
+    assert files["pandas"] == files["polars"]
 
 
 def test_make_test_notebooks_passes(baked_project):
@@ -575,15 +964,165 @@ def test_make_test_notebooks_passes(baked_project):
         ("cli", False),
     ],
 )
-def test_notebooks_dependencies_only_in_notebooks_type(baked_project, project_type, should_have_notebooks_deps):
+def test_notebooks_dependencies_only_in_notebooks_type(rendered_project, project_type, should_have_notebooks_deps):
     """Test that notebooks dependencies are only in notebooks projects."""
-    result = baked_project(project_type=project_type)
-    pyproject = result.project_path / "pyproject.toml"
+    pyproject = rendered_project(project_type=project_type)["pyproject.toml"]
 
-    has_pandas = file_contains_text(str(pyproject), "pandas>=")
-    has_matplotlib = file_contains_text(str(pyproject), "matplotlib>=")
-    has_nbval = file_contains_text(str(pyproject), "nbval>=")
+    has_pandas = "pandas>=" in pyproject
+    has_matplotlib = "matplotlib>=" in pyproject
+    has_nbval = "nbval>=" in pyproject
 
     assert has_pandas == should_have_notebooks_deps, f"pandas dependency for {project_type}"
     assert has_matplotlib == should_have_notebooks_deps, f"matplotlib dependency for {project_type}"
     assert has_nbval == should_have_notebooks_deps, f"pytest-nbval dependency for {project_type}"
+
+
+# ============================================================================
+# Compiled Template Cache Tests
+# ============================================================================
+
+
+def test_template_cache_reused_across_bakes(baked_project, tmp_path, monkeypatch):
+    """Test that a second bake loads compiled templates from the cache instead of compiling them."""
+    import jinja2
+
+    cache_dir = tmp_path / "jinja-cache"
+    monkeypatch.setenv("COOKIECUTTER_UV_LITE_CACHE_DIR", str(cache_dir))
+    compile_calls = []
+    original_compile = jinja2.Environment.compile
+
+    def counting_compile(self, *args, **kwargs):
+        if "{" in args[0]:
+            compile_calls.append(args[0])
+        return original_compile(self, *args, **kwargs)
+
+    monkeypatch.setattr(jinja2.Environment, "compile", counting_compile)
+
+    first = baked_project(project_name="first-bake")
+    assert any(cache_dir.iterdir()), "compiled templates should be written to the cache directory"
+    assert compile_calls
+
+    compile_calls.clear()
+    second = baked_project(project_name="second-bake")
+    # Only directory names joined to this bake's own output path are new.
+    recompiled = [source for source in compile_calls if str(second.project_path) not in source]
+    assert not recompiled, f"templates recompiled: {recompiled}"
+    assert (first.project_path / "pyproject.toml").read_text().replace("first", "second") == (
+        second.project_path / "pyproject.toml"
+    ).read_text()
+
+
+def test_template_cache_prunes_least_recently_used(tmp_path):
+    """Test that pruning keeps the most recently used entries, counting cache hits as uses."""
+    import jinja2
+
+    from local_extensions import ContentHashBytecodeCache
+
+    cache = ContentHashBytecodeCache(str(tmp_path))
+    env = jinja2.Environment(bytecode_cache=cache)  # noqa: S701 | renders no HTML
+    sources = [f"{{{{ x }}}} {i}" for i in range(4)]
+    for age, source in enumerate(sources):
+        bucket = cache.get_bucket(env, "<string>", None, source)
+        bucket.code = env.compile(source)
+        cache.set_bucket(bucket)
+        path = tmp_path / (cache.pattern % (bucket.key,))
+        os.utime(path, (time.time() - 100 * (age + 1),) * 2)
+
+    assert cache.get_bucket(env, "<string>", None, sources[3]).code is not None
+    assert cache.prune(max_entries=2) == 2
+
+    kept = [source for source in sources if cache.get_bucket(env, "<string>", None, source).code is not None]
+    assert kept == [sources[0], sources[3]]
+    assert cache.prune(max_entries=2) == 0
+
+
+def test_template_cache_can_be_disabled(baked_project, tmp_path, monkeypatch):
+    """Test that COOKIECUTTER_UV_LITE_NO_CACHE bakes without touching the cache directory."""
+    cache_dir = tmp_path / "jinja-cache"
+    monkeypatch.setenv("COOKIECUTTER_UV_LITE_CACHE_DIR", str(cache_dir))
+    monkeypatch.setenv("COOKIECUTTER_UV_LITE_NO_CACHE", "1")
+
+    baked_project()
+    assert not cache_dir.exists()
+
+
+# ============================================================================
+# Option Sweep Tests
+# ============================================================================
+
+
+def test_sweep_covers_all_combinations():
+    """Test that the sweep expands every choice variable and groups identical trees."""
+    trees = sweep.sweep(jobs=2)
+    combinations = [combination for tree in trees for combination in tree.combinations]
+
+    assert len(combinations) == 5 * 2**6
+    assert len({json.dumps(combination, sort_keys=True) for combination in combinations}) == len(combinations)
+    # git_repo and private_repo only affect the hooks, never the generated files.
+    assert len(trees) <= len(combinations) // 4
+    project_types = {tree.combinations[0]["project_type"] for tree in trees}
+    assert project_types == {"package", "cli", "notebooks", "service", "worker"}
+
+
+def test_sweep_validates_each_tree_once(tmp_path):
+    """Test that checks run once per distinct tree and failures are reported per combination."""
+    log = tmp_path / "runs.log"
+    # Fails only in CLI projects.
+    script = (
+        f"import os; open({str(log)!r}, 'a').write('run\\n'); raise SystemExit(os.path.exists('my_project/cli.py'))"
+    )
+    trees = sweep.sweep({"probe": [sys.executable, "-c", script]}, jobs=2)
+    report = sweep.format_report(trees, 0.0)
+
+    assert len(log.read_text().splitlines()) == len(trees)
+    for tree in trees:
+        assert tree.checks[0].passed == (tree.combinations[0]["project_type"] != "cli")
+    failed = sum(not tree.checks[0].passed for tree in trees)
+    assert f"{len(trees) - failed} of {len(trees)} trees passed validation." in report
+    assert report.count("| cli |") == 64
+    assert report.count("FAIL") == 64
+
+
+# ============================================================================
+# Pre-resolved Lockfile Tests
+# ============================================================================
+
+
+@pytest.mark.parametrize("project_type", ["package", "cli", "notebooks", "service", "worker"])
+@pytest.mark.parametrize("mkdocs", ["y", "n"])
+def test_lockfile_shipped(rendered_project, project_type, mkdocs):
+    """Test that generated projects get the lockfile of their dependency set under their own name."""
+    files = rendered_project(project_type=project_type, mkdocs=mkdocs, project_name="Lock-Test")
+
+    assert ".uv-locks.json.gz" not in files
+    lockfile = files["uv.lock"]
+    assert 'name = "lock-test"\nversion = "0.0.1"\nsource = { editable = "." }' in lockfile
+    assert f'name = "{locks.PROJECT_NAME}"\n' not in lockfile
+    assert ('name = "mkdocs"' in lockfile) == (mkdocs == "y")
+
+
+def test_lockfile_bundle_covers_all_dependency_sets():
+    """Test that the bundle has exactly one lockfile per dependency set."""
+    bundle = locks.read_bundle()
+
+    assert set(bundle) == {locks.lock_key(options) for options in locks.lock_combinations()}
+    assert all(lockfile.startswith("version = 1\n") for lockfile in bundle.values())
+    # dataframe_backend only changes the dependencies of notebooks projects.
+    assert len(bundle) == 5 * 2**2 + 2**2
+
+
+@pytest.mark.parametrize("project_type", ["package", "cli", "service", "worker"])
+def test_lockfile_shared_by_dataframe_backends(rendered_project, project_type):
+    """Test that project types that ignore dataframe_backend get the same lockfile for either backend."""
+    pandas, polars = (
+        rendered_project(project_type=project_type, dataframe_backend=backend) for backend in ("pandas", "polars")
+    )
+
+    assert polars["uv.lock"] == pandas["uv.lock"]
+    assert 'name = "polars"' not in polars["uv.lock"]
+
+
+@pytest.mark.skipif(shutil.which("uv") is None, reason="uv not available")
+def test_lockfiles_consistent():
+    """Test that the shipped lockfiles are up to date with the rendered dependency lists."""
+    assert locks.check() == 0
@@ -14,6 +14,6 @@ def run_within_dir(path: str):
         os.chdir(oldpwd)
 
 
-def file_contains_text(file: str, text: str) -> bool:
-    with open(file) as f:
-        return f.read().find(text) != -1
+def has_dir(files: dict[str, str], path: str) -> bool:
+    """Return whether a rendered project (see `cookiecutter_uv_lite.render`) has files under `path`."""
+    return any(name.startswith(f"{path}/") for name in files)
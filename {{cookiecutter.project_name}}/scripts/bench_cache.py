@@ -0,0 +1,68 @@
+"""Compare the per-call overhead of the `cache` module with `functools.lru_cache`.
+
+Each variant caches a trivial function, so the timings measure the cache alone:
+hits on a warm cache, and misses that evict on every call. `lru_cache` is
+implemented in C and has none of the locking, expiry and size accounting, so
+it is the lower bound.
+
+Usage:
+    python scripts/bench_cache.py              # default number of calls
+    python scripts/bench_cache.py --calls 1000 # quick run
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import sys
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from {{cookiecutter.project_name|lower|replace('-', '_')}} import cache
+
+
+def _identity(x: Any) -> Any:
+    return x
+
+
+def variants() -> dict[str, Callable[[int], Callable[[Any], Any]]]:
+    """Decorator factories to compare, by name; each takes the maximum number of entries."""
+    return {
+        "functools.lru_cache": lambda maxsize: functools.lru_cache(maxsize)(_identity),
+        "cache.cached": lambda maxsize: cache.cached(maxsize)(_identity),
+        "cache.cached(ttl)": lambda maxsize: cache.cached(maxsize, ttl=3600)(_identity),
+        "cache.cached(maxbytes)": lambda maxsize: cache.cached(None, maxbytes=maxsize * 28)(_identity),
+    }
+
+
+def measure(factory: Callable[[int], Callable[[Any], Any]], calls: int) -> tuple[float, float]:
+    """Return the nanoseconds per call for hits and for misses."""
+    keys = list(range(100))
+    warm = factory(len(keys))
+    for key in keys:
+        warm(key)
+    hit = min(timeit.repeat(lambda: [warm(key) for key in keys], number=calls // len(keys), repeat=5))
+    # A single entry: every call with a new key misses and evicts the previous one.
+    cold = factory(1)
+    miss = min(timeit.repeat(lambda: [cold(key) for key in keys], number=calls // len(keys), repeat=5))
+    per_call = 1e9 / (calls // len(keys) * len(keys))
+    return hit * per_call, miss * per_call
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare cache overhead with functools.lru_cache.")
+    parser.add_argument("--calls", type=int, default=200_000, help="calls per measurement (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    results = {name: measure(factory, max(args.calls, 100)) for name, factory in variants().items()}
+
+    baseline_hit, baseline_miss = results["functools.lru_cache"]
+    print(f"{'variant':<24} {'hit':>10} {'miss':>10} {'hit vs lru':>11} {'miss vs lru':>12}")
+    for name, (hit, miss) in results.items():
+        print(f"{name:<24} {hit:>8.0f}ns {miss:>8.0f}ns {hit / baseline_hit:>10.1f}x {miss / baseline_miss:>11.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""Report the throughput of the worker pool as the number of workers grows.
+
+For each worker count, the same synthetic documents are queued in a fresh
+database and processed with the example task in `{{cookiecutter.project_name|lower|replace('-', '_')}}.tasks`. The
+timings include starting and initializing the pool and committing the results,
+as in a real run. Speedup is relative to one worker, or to the first count
+scaled down to one. Efficiency is the speedup per worker; it drops once the
+workers outnumber the CPU cores or the parent process becomes the bottleneck.
+
+Usage:
+    python scripts/bench_worker.py                          # 1, 2, 4, ... workers up to the CPU count
+    python scripts/bench_worker.py --items 5000 --workers 1,2
+    python scripts/bench_worker.py --batch-size 256         # fewer, larger batches
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+from {{cookiecutter.project_name|lower|replace('-', '_')}} import tasks
+from {{cookiecutter.project_name|lower|replace('-', '_')}}.jobs import JobQueue
+from {{cookiecutter.project_name|lower|replace('-', '_')}}.worker import RunStats, run
+
+
+def documents(count: int, words: int = 200, seed: int = 0) -> list[str]:
+    """Return `count` reproducible documents of `words` words drawn from a vocabulary of 5000."""
+    rng = random.Random(seed)  # noqa: S311 | reproducible test data
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    vocabulary = ["".join(rng.choices(letters, k=rng.randint(2, 10))) for _ in range(5000)]
+    return [" ".join(rng.choices(vocabulary, k=words)) for _ in range(count)]
+
+
+def default_worker_counts() -> list[int]:
+    """Powers of two up to the CPU count, and the CPU count itself."""
+    cpus = os.cpu_count() or 1
+    counts = [1 << i for i in range(cpus.bit_length()) if 1 << i <= cpus]
+    return counts if counts[-1] == cpus else [*counts, cpus]
+
+
+def measure(payloads: list[str], workers: int, batch_size: int) -> RunStats:
+    """Queue the payloads in a fresh database and process them with `workers` processes."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        with JobQueue(path) as queue:
+            queue.put(payloads)
+        stats = run(path, tasks.extract_features, init=tasks.init, workers=workers, batch_size=batch_size)
+    if stats.done != len(payloads):
+        msg = f"{len(payloads) - stats.done} of {len(payloads)} jobs did not complete"
+        raise RuntimeError(msg)
+    return stats
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Report items per second as the number of workers grows.")
+    parser.add_argument("--items", type=int, default=20_000, help="documents to process (default: %(default)s)")
+    parser.add_argument("--workers", help="comma-separated worker counts (default: 1, 2, 4, ... up to the CPU count)")
+    parser.add_argument("--batch-size", type=int, default=64, help="jobs per batch (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    counts = sorted(int(n) for n in args.workers.split(",")) if args.workers else default_worker_counts()
+    payloads = documents(args.items)
+    print(f"{args.items} documents, batches of {args.batch_size}, {os.cpu_count()} CPUs")
+    print(f"{'workers':>7} {'seconds':>8} {'items/s':>10} {'speedup':>8} {'efficiency':>10}")
+    baseline = None
+    for workers in counts:
+        stats = measure(payloads, workers, args.batch_size)
+        rate = stats.items_per_second
+        baseline = baseline or rate / workers
+        speedup = rate / baseline
+        print(f"{workers:>7} {stats.seconds:>8.2f} {rate:>10,.0f} {speedup:>7.2f}x {speedup / workers:>10.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
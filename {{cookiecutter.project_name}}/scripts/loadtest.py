@@ -0,0 +1,167 @@
+"""Measure the latency and throughput of the service under concurrent load.
+
+Without `--url`, the script starts the service with a local stub upstream in a
+subprocess, waits until it is healthy, runs the load, and stops it with SIGTERM.
+A fixed number of concurrent clients send requests back to back for the given
+duration, after a warm-up that is not measured. The report shows the latency
+percentiles and the requests per second.
+
+The load generator is Python too and shares the machine with the server, so
+the numbers are for comparing changes, not for capacity planning; use a
+dedicated tool such as wrk or oha against a deployed instance for that.
+
+Usage:
+    python scripts/loadtest.py                           # start a local server and load it for 10 s
+    python scripts/loadtest.py --duration 3 --concurrency 16
+    python scripts/loadtest.py --url http://127.0.0.1:8080 --path /hello
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import math
+import socket
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+
+import aiohttp
+
+from {{cookiecutter.project_name|lower|replace('-', '_')}}.app import new_event_loop
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of sorted values, e.g. `fraction=0.99` for p99.
+
+    Example:
+        >>> percentile([1.0, 2.0, 3.0, 4.0], 0.5)
+        2.0
+    """
+    if not ordered:
+        return math.nan
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict[str, float]:
+    """Return request counts, requests per second and latency percentiles in milliseconds."""
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "rps": len(ordered) / elapsed if elapsed > 0 else math.nan,
+        "p50_ms": percentile(ordered, 0.50) * 1000,
+        "p90_ms": percentile(ordered, 0.90) * 1000,
+        "p99_ms": percentile(ordered, 0.99) * 1000,
+        "max_ms": (ordered[-1] if ordered else math.nan) * 1000,
+    }
+
+
+async def _client(
+    session: aiohttp.ClientSession, path: str, deadline: float, measure_from: float, latencies: list[float]
+) -> int:
+    errors = 0
+    while (start := time.perf_counter()) < deadline:
+        try:
+            async with session.get(path) as response:
+                await response.read()
+                ok = response.status < 500
+        except aiohttp.ClientError:
+            ok = False
+        if start >= measure_from:
+            if ok:
+                latencies.append(time.perf_counter() - start)
+            else:
+                errors += 1
+    return errors
+
+
+async def run_load(url: str, path: str, concurrency: int, duration: float, warmup: float) -> dict[str, float]:
+    """Send requests from `concurrency` clients for `warmup + duration` seconds and summarize the measured part."""
+    latencies: list[float] = []
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(url, connector=connector) as session:
+        measure_from = time.perf_counter() + warmup
+        deadline = measure_from + duration
+        errors = await asyncio.gather(
+            *(_client(session, path, deadline, measure_from, latencies) for _ in range(concurrency))
+        )
+        # Requests still running at the deadline finish after it; count the time they took.
+        elapsed = max(time.perf_counter(), deadline) - measure_from
+    return summarize(latencies, sum(errors), elapsed)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port: int = s.getsockname()[1]
+        return port
+
+
+async def _wait_healthy(url: str, process: subprocess.Popen[bytes], timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession(url) as session:
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                msg = f"the server exited with code {process.returncode}"
+                raise RuntimeError(msg)
+            with contextlib.suppress(aiohttp.ClientError):
+                async with session.get("/healthz") as response:
+                    if response.status == 200:
+                        return
+            await asyncio.sleep(0.1)
+    msg = f"the server did not become healthy within {timeout:.0f}s"
+    raise RuntimeError(msg)
+
+
+@contextlib.contextmanager
+def local_server() -> Iterator[tuple[str, subprocess.Popen[bytes]]]:
+    """Start the service with a stub upstream and no access log; stop it gracefully on exit."""
+    port = _free_port()
+    command = [sys.executable, "-m", "{{cookiecutter.project_name|lower|replace('-', '_')}}.app", "--port", str(port), "--stub-upstream"]
+    process = subprocess.Popen([*command, "--no-access-log"])  # noqa: S603
+    try:
+        yield f"http://127.0.0.1:{port}", process
+    finally:
+        if process.poll() is None:
+            process.terminate()  # SIGTERM: the server finishes in-flight requests and exits.
+            try:
+                process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Load the service and report latency percentiles and throughput.")
+    parser.add_argument("--url", help="base URL of a running server (default: start one locally)")
+    parser.add_argument("--path", default="/items/demo", help="request path (default: %(default)s)")
+    parser.add_argument("--concurrency", type=int, default=32, help="concurrent clients (default: %(default)s)")
+    parser.add_argument("--duration", type=float, default=10.0, help="measured seconds (default: %(default)s)")
+    parser.add_argument("--warmup", type=float, default=1.0, help="unmeasured seconds first (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    loop = new_event_loop()
+    try:
+        with contextlib.ExitStack() as stack:
+            url = args.url
+            if url is None:
+                url, process = stack.enter_context(local_server())
+                loop.run_until_complete(_wait_healthy(url, process))
+            print(f"Loading {url}{args.path} with {args.concurrency} clients for {args.duration:g}s ...")
+            result = loop.run_until_complete(run_load(url, args.path, args.concurrency, args.duration, args.warmup))
+    finally:
+        loop.close()
+
+    print(f"{'requests':>10} {'errors':>8} {'req/s':>10} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}")
+    print(
+        f"{result['requests']:>10.0f} {result['errors']:>8.0f} {result['rps']:>10.1f} "
+        f"{result['p50_ms']:>7.2f}ms {result['p90_ms']:>7.2f}ms {result['p99_ms']:>7.2f}ms {result['max_ms']:>7.2f}ms"
+    )
+    return 1 if result["errors"] or not result["requests"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""Run the test suite on every supported Python version at once.
+
+The versions come from `envlist` in tox.ini. Missing interpreters are installed
+by uv, then each version gets its own environment in `.venvs/<version>` and runs
+`uv sync` and pytest there, several versions concurrently. All environments
+install from the shared uv cache, so packages are downloaded once and linked
+into each environment. The whole matrix takes about as long as the slowest version.
+
+Usage:
+    python scripts/test_matrix.py                        # all versions in tox.ini
+    python scripts/test_matrix.py --python 3.12,3.13 --jobs 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import configparser
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+ROOT = Path(__file__).resolve().parent.parent
+VENVS = ROOT / ".venvs"
+
+
+class Result(NamedTuple):
+    """Outcome of one Python version."""
+
+    python: str
+    step: str
+    passed: bool
+    sync_seconds: float
+    test_seconds: float
+    log: Path
+
+
+def tox_versions(tox_ini: Path = ROOT / "tox.ini") -> list[str]:
+    """Return the Python versions of the tox envlist, e.g. `py310` -> `3.10`."""
+    config = configparser.ConfigParser()
+    config.read(tox_ini)
+    envs = re.split(r"[,\s]+", config.get("tox", "envlist", fallback="").strip())
+    return [f"{env[2]}.{env[3:]}" for env in envs if re.fullmatch(r"py3\d+", env)]
+
+
+def _python_available(version: str) -> bool:
+    """Whether uv finds an interpreter for `version`, either installed by uv or on the system."""
+    command = ["uv", "python", "find", version]
+    return subprocess.run(command, cwd=ROOT, capture_output=True, check=False).returncode == 0  # noqa: S603
+
+
+def _run(command: list[str], env: dict[str, str], log: Path) -> tuple[bool, float]:
+    start = time.perf_counter()
+    with log.open("a") as out:
+        out.write(f"$ {' '.join(command)}\n")
+        out.flush()
+        completed = subprocess.run(command, cwd=ROOT, env=env, stdout=out, stderr=subprocess.STDOUT, check=False)  # noqa: S603
+    return completed.returncode == 0, time.perf_counter() - start
+
+
+def run_version(python: str, pytest_args: list[str]) -> Result:
+    """Sync and test one Python version in its own environment."""
+    VENVS.mkdir(exist_ok=True)
+    log = VENVS / f"{python}.log"
+    log.write_text("")
+    # Each version gets its own environment; the uv cache stays shared.
+    env = {**os.environ, "UV_PROJECT_ENVIRONMENT": str(VENVS / python)}
+
+    synced, sync_seconds = _run(["uv", "sync", "--frozen", "--python", python], env, log)
+    if not synced:
+        return Result(python, "sync", False, sync_seconds, 0.0, log)
+    command = ["uv", "run", "--frozen", "--no-sync", "python", "-m", "pytest", "--doctest-modules", *pytest_args]
+    passed, test_seconds = _run(command, env, log)
+    return Result(python, "test", passed, sync_seconds, test_seconds, log)
+
+
+def format_table(results: list[Result], seconds: float) -> str:
+    """Render the aggregated results as a plain-text table."""
+    rows = [("python", "result", "sync", "tests", "total")]
+    for r in results:
+        status = "pass" if r.passed else f"FAIL ({r.step})"
+        total = r.sync_seconds + r.test_seconds
+        rows.append((r.python, status, f"{r.sync_seconds:.1f}s", f"{r.test_seconds:.1f}s", f"{total:.1f}s"))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    # zip(strict=) needs Python 3.10
+    lines = ["  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows]  # noqa: B905
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    passed = sum(r.passed for r in results)
+    lines.append(f"\n{passed}/{len(results)} versions passed in {seconds:.1f}s (wall clock)")
+    lines += [f"  {r.python}: see {r.log.relative_to(ROOT)}" for r in results if not r.passed]
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the tests on every supported Python version concurrently.")
+    parser.add_argument("--python", default="", help="comma-separated versions (default: the tox.ini envlist)")
+    parser.add_argument("--jobs", "-j", type=int, default=0, help="versions run at once (default: all, max. CPUs)")
+    args = parser.parse_args(argv)
+
+    versions = [v for v in args.python.split(",") if v] or tox_versions()
+    jobs = args.jobs or min(len(versions), os.cpu_count() or 1)
+    # Split the CPUs between concurrent versions instead of letting each pytest-xdist run claim all of them.
+    workers = max(1, (os.cpu_count() or 1) // jobs)
+    pytest_args = ["-q", "-p", "no:cacheprovider", "-n", str(workers if workers > 1 else 0)]
+
+    start = time.perf_counter()
+    missing = [version for version in versions if not _python_available(version)]
+    if missing:
+        print(f"🚀 Provisioning Python {', '.join(missing)}")
+        if subprocess.run(["uv", "python", "install", *missing], cwd=ROOT, check=False).returncode != 0:  # noqa: S603, S607
+            return 1
+    # Lock once up front; the concurrent syncs then only read uv.lock.
+    lock = ["uv", "lock", "--quiet"]
+    if subprocess.run(lock, cwd=ROOT, check=False).returncode != 0:  # noqa: S603
+        return 1
+
+    print(f"🚀 Testing {len(versions)} versions, {jobs} at a time")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(lambda python: run_version(python, pytest_args), versions))
+    print(format_table(results, time.perf_counter() - start))
+    return 0 if all(r.passed for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
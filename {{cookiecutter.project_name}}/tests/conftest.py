@@ -6,6 +6,18 @@ Fixtures defined here are available to all test files.
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import hashlib
+import importlib
+import inspect
+import mmap
+import os
+import pickle
+import sys
+import time
+import tracemalloc
+
 import pytest
 
 
@@ -43,7 +55,268 @@ import pytest
 # ============================================================================
 
 
+def pytest_addoption(parser):
+    """Add the command-line options used by the fixtures and hooks in this file."""
+    parser.addoption(
+        "--budget-tolerance",
+        type=float,
+        default=None,
+        help=(
+            "fraction by which time_budget and memory_budget may be exceeded, e.g. 0.5 on noisy CI machines;"
+            " 0 by default, 0.5 under pytest-xdist"
+        ),
+    )
+{%- if cookiecutter.project_type == 'notebooks' %}
+    parser.addoption(
+        "--synthetic-rows",
+        type=int,
+        default=100_000,
+        help="rows in the synthetic_data fixture; raise it to run the tests at production scale",
+    )
+{%- endif %}
+
+
 def pytest_configure(config):
     """Register custom pytest markers."""
     config.addinivalue_line("markers", "slow: mark test as slow")
     config.addinivalue_line("markers", "integration: mark test as integration test")
+    config.addinivalue_line("markers", "time_budget(seconds): fail if the test function takes longer")
+    config.addinivalue_line("markers", "memory_budget(mb): fail if the test function's peak allocation is larger (MiB)")
+
+
+# ============================================================================
+# Performance Budgets
+# ============================================================================
+#
+# @pytest.mark.time_budget(0.05) and @pytest.mark.memory_budget(20) fail a test whose
+# function body takes more than 0.05 s (time.perf_counter) or whose peak Python
+# allocation exceeds 20 MiB (tracemalloc, which also sees NumPy buffers). Fixtures
+# are not measured. Allow slack on noisy machines with --budget-tolerance 0.5 (+50%);
+# under `-n auto` the workers compete for the CPU, so that is the default there.
+# Tracing memory slows allocation-heavy code down, so a test with both markers is
+# timed with tracing on. The tests closest to their limits are listed at the end
+# of the session; this works with `-n auto` because the measurements travel with
+# the test reports.
+
+MIB = 2**20
+# Rows in the end-of-session table of the budgets closest to their limits.
+BUDGET_SUMMARY_ROWS = 10
+# Tolerance when --budget-tolerance is not given and the tests run in pytest-xdist workers.
+XDIST_BUDGET_TOLERANCE = 0.5
+_budget_usage = pytest.StashKey[list]()
+
+
+def _limit(marker, keyword):
+    limit = float(marker.args[0] if marker.args else marker.kwargs[keyword])
+    if limit <= 0:
+        msg = f"{marker.name} needs a positive limit, got {limit}"
+        raise ValueError(msg)
+    return limit
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """Measure the time and peak memory of test functions that have a budget marker."""
+    time_marker = pyfuncitem.get_closest_marker("time_budget")
+    memory_marker = pyfuncitem.get_closest_marker("memory_budget")
+    if time_marker is None and memory_marker is None:
+        yield
+        return
+
+    started_tracing = memory_marker is not None and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    if memory_marker is not None:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+
+    usage = []
+    if time_marker is not None:
+        usage.append(("time", elapsed, _limit(time_marker, "seconds")))
+    if memory_marker is not None:
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        if started_tracing:
+            tracemalloc.stop()
+        usage.append(("memory", peak / MIB, _limit(memory_marker, "mb")))
+    pyfuncitem.stash[_budget_usage] = usage
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Fail passing tests that exceeded a budget, and attach the measurements to the report."""
+    report = (yield).get_result()
+    usage = item.stash.get(_budget_usage, None)
+    if report.when != "call" or not usage:
+        return
+    tolerance = item.config.getoption("--budget-tolerance")
+    if tolerance is None:
+        tolerance = XDIST_BUDGET_TOLERANCE if "PYTEST_XDIST_WORKER" in os.environ else 0.0
+    exceeded = []
+    for kind, used, limit in usage:
+        # User properties are sent from xdist workers to the controller with the report.
+        report.user_properties.append(("budget", (kind, used, limit)))
+        if used > limit * (1 + tolerance):
+            exceeded.append(f"{kind} budget exceeded: {_format_usage(kind, used)} > {_format_usage(kind, limit)}")
+    if exceeded and report.passed:
+        report.outcome = "failed"
+        report.longrepr = "\n".join(exceeded) + f" (tolerance {tolerance:.0%})"
+
+
+def _format_usage(kind, value):
+    return f"{value:.3f} s" if kind == "time" else f"{value:.1f} MiB"
+
+
+def pytest_terminal_summary(terminalreporter):
+    """List the budgeted tests that came closest to their limits."""
+    rows = []
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            if getattr(report, "when", None) != "call":
+                continue
+            for name, value in report.user_properties:
+                if name == "budget":
+                    kind, used, limit = value
+                    rows.append((used / limit, report.nodeid, kind, used, limit))
+    if not rows:
+        return
+    terminalreporter.write_sep("=", "performance budgets closest to their limits")
+    width = max(len(row[1]) for row in rows)
+    terminalreporter.write_line(f"{'test':<{width}}  {'budget':<6}  {'used':>12}  {'limit':>12}  {'use':>5}")
+    for ratio, nodeid, kind, used, limit in sorted(rows, reverse=True)[:BUDGET_SUMMARY_ROWS]:
+        terminalreporter.write_line(
+            f"{nodeid:<{width}}  {kind:<6}  {_format_usage(kind, used):>12}  {_format_usage(kind, limit):>12}  {ratio:>5.0%}"
+        )
+
+
+# ============================================================================
+# Shared Session Fixtures
+# ============================================================================
+#
+# @shared_fixture turns a function that builds an expensive value, such as a big
+# frame or a trained model, into a session fixture that is built once per test run,
+# however many `-n auto` workers use it, and reused by later runs until its code changes:
+#
+#     @shared_fixture(depends=["my_project.features"])
+#     def feature_matrix():
+#         return build_features(load_raw_data())
+#
+# The first worker that needs the value builds it while holding a file lock; the others
+# wait for the lock, then load what it saved. Values are kept in the pytest cache
+# (.pytest_cache/d/shared_fixtures, emptied by --cache-clear) under a hash of the
+# function's source, the source of its `depends` and its `inputs`. They are pickled
+# with their large buffers (NumPy arrays, pandas columns, ...) stored next to the pickle
+# and memory-mapped on load: loading copies nothing, and all workers share the same
+# pages. Those arrays are read-only, so copy them before modifying them in a test.
+
+SHARED_FIXTURE_DIR = "shared_fixtures"
+# Buffers start at multiples of this offset in a cache file, which suits any NumPy dtype.
+_BUFFER_ALIGNMENT = 64
+
+
+@contextlib.contextmanager
+def _file_lock(path):
+    """Hold an exclusive lock on `path` across processes; the OS releases it if the holder dies."""
+    with open(path, "a+b") as f:
+        if sys.platform == "win32":
+            import msvcrt
+
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)  # Gives up after 10 s, so keep trying.
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _cache_key(func, depends, kwargs):
+    digest = hashlib.sha256(repr((sys.version_info[:2], sorted(kwargs.items()))).encode())
+    for obj in (func, *depends):
+        digest.update(inspect.getsource(importlib.import_module(obj) if isinstance(obj, str) else obj).encode())
+    return digest.hexdigest()[:16]
+
+
+def _save(value, path):
+    """Write the buffers of `value`, then its pickle and the pickle's offset, and move the file into place."""
+    buffers = []
+    data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+    spans = []
+    tmp = path.with_name(f".{path.name}.{os.getpid()}")
+    with tmp.open("wb") as f:
+        for buffer in buffers:
+            f.write(bytes(-f.tell() % _BUFFER_ALIGNMENT))
+            raw = buffer.raw()
+            spans.append((f.tell(), raw.nbytes))
+            f.write(raw)
+        offset = f.tell()
+        f.write(pickle.dumps((data, spans), protocol=5))
+        f.write(offset.to_bytes(8, "little"))
+    os.replace(tmp, path)
+
+
+def _load(path):
+    with path.open("rb") as f:
+        view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    offset = int.from_bytes(view[-8:], "little")
+    data, spans = pickle.loads(view[offset:-8])  # noqa: S301 | written by _save
+    return pickle.loads(data, buffers=[view[start : start + size] for start, size in spans])  # noqa: S301 | written by _save
+
+
+def shared_fixture(func=None, *, depends=(), inputs=None):
+    """Declare a session fixture that is built once for all xdist workers and cached on disk.
+
+    Args:
+        func: Function returning the value; the fixture gets its name.
+        depends: Modules (dotted names or module objects), functions and classes the value is
+            built from; changing their source rebuilds it, like changing `func` does.
+        inputs: Function of the pytest config returning keyword arguments for `func`, e.g.
+            from command-line options. They are part of the cache key.
+    """
+    if func is None:
+        return functools.partial(shared_fixture, depends=depends, inputs=inputs)
+
+    def fixture(pytestconfig, tmp_path_factory):
+        kwargs = inputs(pytestconfig) if inputs is not None else {}
+        if hasattr(pytestconfig, "cache"):
+            directory = pytestconfig.cache.mkdir(SHARED_FIXTURE_DIR)
+        else:  # -p no:cacheprovider: share the value between the workers of this run only.
+            directory = tmp_path_factory.getbasetemp().parent / SHARED_FIXTURE_DIR
+            directory.mkdir(exist_ok=True)
+        path = directory / f"{func.__name__}-{_cache_key(func, depends, kwargs)}.pickle"
+        with _file_lock(directory / f"{func.__name__}.lock"):
+            if not path.exists():
+                for stale in directory.glob(f"{func.__name__}-*.pickle"):
+                    with contextlib.suppress(OSError):  # Windows keeps files that another process maps.
+                        stale.unlink()
+                _save(func(**kwargs), path)
+        return _load(path)
+
+    fixture.__doc__ = func.__doc__
+    return pytest.fixture(scope="session", name=func.__name__)(fixture)
+{%- if cookiecutter.project_type == 'notebooks' %}
+
+
+@shared_fixture(
+    depends=["{{cookiecutter.project_name|lower|replace('-', '_')}}.utils"],
+    inputs=lambda config: {"n_rows": config.getoption("--synthetic-rows")},
+)
+def synthetic_data(n_rows):
+    """Provide `generate_synthetic_data` output with as many rows as --synthetic-rows asks for."""
+    from {{cookiecutter.project_name|lower|replace('-', '_')}}.utils import generate_synthetic_data
+
+    return generate_synthetic_data(n_rows, n_categories=8)
+{%- endif %}
@@ -0,0 +1,180 @@
+"""Tests for the in-process cache."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from {{cookiecutter.project_name|lower|replace('-', '_')}} import cache
+
+
+class FakeTimer:
+    """Manually advanced clock for expiry tests."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lru_eviction_by_count():
+    """The least recently used entry is evicted first."""
+    c = cache.Cache(maxsize=2)
+    c.set("a", 1)
+    c.set("b", 2)
+    assert c.get("a") == 1  # "b" is now the least recently used.
+    c.set("c", 3)
+
+    assert "b" not in c
+    assert c.get("a") == 1
+    assert c.get("c") == 3
+    assert c.info().evictions == 1
+
+
+def test_eviction_by_bytes():
+    """Entries are evicted until the total size fits, and oversized values are not stored."""
+    c = cache.Cache(maxsize=None, maxbytes=100, sizeof=len)
+    c.set("a", "x" * 40)
+    c.set("b", "x" * 40)
+    c.set("c", "x" * 40)
+
+    assert list(c._data) == ["b", "c"]
+    assert c.info().nbytes == 80
+
+    c.set("huge", "x" * 101)
+    assert "huge" not in c
+    assert len(c) == 2
+
+
+def test_ttl_expiry():
+    """Entries expire after the cache's time-to-live, or their own."""
+    timer = FakeTimer()
+    c = cache.Cache(ttl=10, timer=timer)
+    c.set("default", 1)
+    c.set("short", 2, ttl=1)
+
+    timer.now = 5
+    assert c.get("short") is None
+    assert c.get("default") == 1
+    timer.now = 10
+    assert c.get("default", "gone") == "gone"
+    assert c.info().expired == 2
+
+
+def test_decorator_stats_and_invalidation():
+    """Hits, misses and invalidation through the decorator."""
+    calls = []
+
+    @cache.cached(maxsize=8)
+    def double(x: int) -> int:
+        calls.append(x)
+        return x * 2
+
+    assert [double(1), double(1), double(x=1), double(2)] == [2, 2, 2, 4]
+    info = double.cache_info()
+    assert (info.hits, info.misses, info.size) == (1, 3, 3)
+
+    assert double.invalidate(1)
+    assert not double.invalidate(1)
+    double(1)
+    assert calls == [1, 1, 2, 1]
+
+
+def test_unhashable_arguments():
+    """Lists and dicts are converted to keys instead of raising."""
+
+    @cache.cached()
+    def total(values: list[int], weights: dict[str, int]) -> int:
+        return sum(values) * weights["w"]
+
+    assert total([1, 2], {"w": 3}) == 9
+    assert total([1, 2], {"w": 3}) == 9
+    assert total.cache_info().hits == 1
+    assert cache.make_key(([1, 2],), {}) != cache.make_key(((1, 2),), {})
+
+
+def test_single_flight():
+    """Concurrent misses for one key compute the value once."""
+    calls = []
+    start = threading.Barrier(8)
+
+    @cache.cached()
+    def slow(x: int) -> int:
+        calls.append(x)
+        time.sleep(0.1)
+        return x
+
+    def worker() -> None:
+        start.wait()
+        assert slow(7) == 7
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [7]
+    assert slow.cache_info().misses == 1
+
+
+def test_errors_are_shared_but_not_cached():
+    """Waiting callers get the leader's exception, and the next call tries again."""
+    c = cache.Cache()
+    computing = threading.Event()
+    release = threading.Event()
+    errors: list[Exception] = []
+
+    def failing() -> int:
+        computing.set()
+        release.wait()
+        msg = "boom"
+        raise ValueError(msg)
+
+    def call(compute) -> None:
+        try:
+            c.get_or_compute("k", compute)
+        except ValueError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=call, args=(failing,))
+    leader.start()
+    computing.wait()
+    follower = threading.Thread(target=call, args=(lambda: 0,))
+    follower.start()
+    time.sleep(0.05)  # Let the follower start waiting for the leader.
+    release.set()
+    leader.join()
+    follower.join()
+
+    assert len(errors) == 2
+    assert errors[0] is errors[1]
+    assert c.get_or_compute("k", lambda: 1) == 1
+
+
+def test_invalidate_during_computation():
+    """A value invalidated while it is computed is returned but not stored."""
+    c = cache.Cache()
+
+    def compute() -> str:
+        c.invalidate("k")
+        return "stale"
+
+    assert c.get_or_compute("k", compute) == "stale"
+    assert "k" not in c
+
+
+def test_cached_method():
+    """Methods are cached per instance."""
+
+    class Squarer:
+        def __init__(self, offset: int) -> None:
+            self.offset = offset
+
+        @cache.cached()
+        def square(self, x: int) -> int:
+            return x * x + self.offset
+
+    assert Squarer(0).square(3) == 9
+    assert Squarer(1).square(3) == 10
@@ -0,0 +1,117 @@
+"""Tests for the static shell completion scripts."""
+
+from __future__ import annotations
+
+import enum
+import os
+import shutil
+import subprocess
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from {{cookiecutter.project_name|lower|replace('-', '_')}} import completion
+from {{cookiecutter.project_name|lower|replace('-', '_')}}.cli import app
+
+runner = CliRunner()
+
+
+class Color(str, enum.Enum):
+    red = "red"
+    blue = "blue"
+
+
+def _names() -> list[str]:
+    return ["Alice", "Bob"]
+
+
+color_option = typer.Option("red", help="Paint color")
+owner_option = typer.Option("", autocompletion=_names)
+demo = typer.Typer(add_completion=False)
+
+
+@demo.command()
+def paint(
+    color: Color = color_option,
+    owner: str = owner_option,
+) -> None:
+    """Paint something."""
+
+
+@demo.command()
+def clean() -> None:
+    """Clean up."""
+
+
+def test_collect_command_tree():
+    """Subcommands, options and value kinds are read from the command tree."""
+    specs = {spec.path: spec for spec in completion.collect(typer.main.get_command(demo))}
+
+    assert [name for name, _ in specs[""].subcommands] == ["clean", "paint"]
+    assert specs["paint"].values["--color"] == ("choice", ("red", "blue"))
+    assert specs["paint"].values["--owner"] == ("dynamic", ())
+
+
+def test_complete_values():
+    """Dynamic values come from the option's completion callback."""
+    assert completion.complete_values(demo, "paint", "--owner") == ["Alice", "Bob"]
+
+
+def test_hidden_complete_command():
+    """The app answers dynamic completion requests through a hidden command."""
+    result = runner.invoke(app, ["__complete", "--", "hello", "--name"])
+    assert result.exit_code == 0
+    assert "__complete" not in runner.invoke(app, ["--help"]).stdout
+
+
+def test_write_scripts(tmp_path):
+    """One script is written per supported shell."""
+    paths = completion.write_scripts(app, tmp_path)
+    assert sorted(path.name for path in paths) == sorted(completion.SCRIPTS)
+    assert all("hello" in path.read_text() for path in paths)
+
+
+def _run_bash_completion(tmp_path, line: str, env: dict[str, str] | None = None) -> list[str]:
+    script = completion.bash_script(completion.collect(typer.main.get_command(demo)))
+    words = [completion.PROG, *line.split()]
+    if line == "" or line.endswith(" "):
+        words.append("")
+    driver = (
+        f"{script}\n"
+        f"COMP_WORDS=({' '.join(repr(word) for word in words)}); COMP_CWORD={len(words) - 1}\n"
+        f"_{completion.PROG.replace('-', '_')}\n"
+        'echo "${COMPREPLY[*]}"\n'
+    )
+    result = subprocess.run(["bash", "-c", driver], capture_output=True, text=True, check=True, env=env)  # noqa: S603, S607
+    return result.stdout.split()
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="bash not available")
+@pytest.mark.parametrize(
+    "line,expected",
+    [
+        ("", "clean paint --help"),
+        ("paint --c", "--color"),
+        ("paint --color ", "red blue"),
+        ("paint --color red ", "--help --color --owner"),
+    ],
+)
+def test_bash_static_completion(tmp_path, line, expected):
+    """The bash script completes static values without calling Python."""
+    assert _run_bash_completion(tmp_path, line) == expected.split()
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="bash not available")
+def test_bash_dynamic_completion_is_cached(tmp_path):
+    """Dynamic values are fetched from the app once and then served from the cache."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    fake_app = bin_dir / completion.PROG
+    fake_app.write_text(f'#!/bin/sh\necho call >> "{tmp_path}/calls"\nprintf "Alice\\nBob\\n"\n')
+    fake_app.chmod(0o755)
+    env = {**os.environ, "PATH": f"{bin_dir}{os.pathsep}{os.environ['PATH']}", "XDG_CACHE_HOME": str(tmp_path)}
+
+    for _ in range(2):
+        assert _run_bash_completion(tmp_path, "paint --owner ", env) == ["Alice", "Bob"]
+    assert (tmp_path / "calls").read_text().count("call") == 1
@@ -4,6 +4,8 @@
 from __future__ import annotations
 
 {% if cookiecutter.project_type == 'cli' %}
+import json
+
 from typer.testing import CliRunner
 
 from {{package_name}}.cli import app
@@ -39,6 +41,21 @@ def test_cli_version():
     assert "version" in result.stdout.lower()
 
 
+def test_cli_json_output():
+    """Test --output json emits machine-readable records."""
+    result = runner.invoke(app, ["--output", "json", "hello", "--name", "Alice"])
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == [{"greeting": "Hello, Alice!"}]
+
+
+def test_cli_metrics_out(tmp_path):
+    """Test --metrics-out writes command timings."""
+    metrics_file = tmp_path / "metrics.prom"
+    result = runner.invoke(app, ["--metrics-out", str(metrics_file), "hello"])
+    assert result.exit_code == 0
+    assert "cli_hello_seconds_count 1" in metrics_file.read_text()
+
+
 # TODO: Replace examples above with your actual CLI tests
 
 {% else %}
@@ -56,6 +73,13 @@ def test_parametrized_example(value, expected):
     assert value**2 == expected
 
 
+@pytest.mark.time_budget(0.5)
+@pytest.mark.memory_budget(10)
+def test_budget_example():
+    """Example showing a performance contract: at most 0.5 s and 10 MiB of allocations."""
+    assert sorted(range(10_000, 0, -1))[0] == 1
+
+
 # TODO: Replace examples above with your actual tests
 # from {{package_name}} import your_module
 # def test_your_function():
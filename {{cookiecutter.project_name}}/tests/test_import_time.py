@@ -0,0 +1,93 @@
+{% set package_name = cookiecutter.project_name|lower|replace('-', '_') -%}
+"""Import-time budget for the package.
+
+Runs `python -X importtime -c "import {{package_name}}"` and fails when the cumulative
+import time, or the set of third-party modules imported eagerly, exceeds the
+budget in the `[tool.import-budget]` table of `pyproject.toml`.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
+import {{package_name}}
+
+PACKAGE = "{{package_name}}"
+PYPROJECT = pathlib.Path(__file__).resolve().parents[1] / "pyproject.toml"
+
+
+def _budget() -> dict:
+    with PYPROJECT.open("rb") as f:
+        return tomllib.load(f)["tool"]["import-budget"]
+
+
+def _import_profile() -> list[tuple[str, int, int]]:
+    """Return (module, depth, cumulative microseconds) for the package and everything it imports."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {PACKAGE}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # Header line.
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), depth, int(cumulative)))
+    # Children are listed before their parent; keep the package line and the nested lines just above it.
+    end = next(i for i, (name, depth, _) in enumerate(entries) if name == PACKAGE and depth == 0)
+    start = end
+    while start > 0 and entries[start - 1][1] > 0:
+        start -= 1
+    return entries[start : end + 1]
+
+
+def _is_third_party(module: str) -> bool:
+    top = module.partition(".")[0]
+    if top == PACKAGE:
+        return False
+    stdlib = getattr(sys, "stdlib_module_names", None)
+    if stdlib is not None:
+        return top not in stdlib
+    spec = importlib.util.find_spec(top)
+    return spec is not None and "-packages" in (spec.origin or "")
+
+
+def test_import_time_budget():
+    """Importing the package stays within the cumulative time budget."""
+    cumulative_ms = _import_profile()[-1][2] / 1000
+    assert cumulative_ms <= _budget()["max-cumulative-ms"], f"import {PACKAGE} took {cumulative_ms:.1f} ms"
+
+
+def test_no_unexpected_eager_third_party_imports():
+    """Only allowed third-party modules are imported by `import {{package_name}}`."""
+    third_party = {name.partition(".")[0] for name, _, _ in _import_profile() if _is_third_party(name)}
+    unexpected = third_party - set(_budget()["allowed-third-party"])
+    assert not unexpected, f"import {PACKAGE} eagerly imports {sorted(unexpected)}"
+
+
+@pytest.mark.parametrize("name", {{package_name}}.__all__)
+def test_lazy_exports(name):
+    """Every exported name resolves through the lazy export table."""
+    assert getattr({{package_name}}, name) is not None
+    assert name in dir({{package_name}})
+
+
+def test_unknown_attribute():
+    """Unknown attributes raise AttributeError."""
+    with pytest.raises(AttributeError):
+        {{package_name}}.does_not_exist  # noqa: B018
@@ -0,0 +1,105 @@
+"""Tests for the SQLite job queue."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from {{cookiecutter.project_name|lower|replace('-', '_')}}.jobs import JobQueue, backoff_delay
+
+
+@pytest.fixture
+def queue(tmp_path):
+    with JobQueue(tmp_path / "jobs.db") as queue:
+        yield queue
+
+
+def test_claims_in_order_and_never_twice(queue):
+    """Jobs are handed out in insertion order, and a claimed job is not claimed again while leased."""
+    queue.put([{"n": i} for i in range(5)])
+
+    first = queue.claim(3)
+    second = queue.claim(3)
+
+    assert [job.payload["n"] for job in first + second] == [0, 1, 2, 3, 4]
+    assert queue.claim(3) == []
+    assert queue.counts() == {"pending": 0, "running": 5, "done": 0, "failed": 0}
+
+
+def test_results_are_kept_across_connections(queue, tmp_path):
+    """Completed results are committed, and another connection reads them."""
+    queue.put(["a", "bb"])
+    queue.complete([(job.id, len(job.payload)) for job in queue.claim(10)])
+
+    with JobQueue(tmp_path / "jobs.db") as other:
+        assert list(other.results()) == [("a", 1), ("bb", 2)]
+        assert other.next_ready() is None
+
+
+def test_expired_leases_are_claimed_again(queue):
+    """Jobs of a run that died are resumed once their lease expires, counting the lost attempt."""
+    queue.put(["x"])
+    (lost,) = queue.claim(1, lease=60, now=1000.0)
+
+    assert queue.claim(1, now=1059.0) == []
+    (resumed,) = queue.claim(1, now=1061.0)
+    assert (resumed.id, resumed.attempts) == (lost.id, 2)
+
+
+def test_failures_back_off_then_fail(queue):
+    """A failed job is retried after a growing delay, and marked as failed after its last attempt."""
+    queue.put(["flaky"])
+    now = 1000.0
+    for attempt in (1, 2):
+        (job,) = queue.claim(1, now=now)
+        assert job.attempts == attempt
+        assert queue.fail([(job, "boom")], max_attempts=3, backoff=10, now=now) == 1
+        delay = queue.next_ready(now=now)
+        assert 5 * attempt <= delay <= 10 * attempt
+        assert queue.claim(1, now=now + delay - 0.01) == []
+        now += delay
+
+    (job,) = queue.claim(1, now=now)
+    assert queue.fail([(job, "boom")], max_attempts=3, now=now) == 0
+    assert list(queue.failures()) == [("flaky", "boom")]
+
+    assert queue.retry_failed() == 1
+    assert queue.claim(1, now=now)[0].attempts == 1
+
+
+def test_release_does_not_count_an_attempt(queue):
+    """Jobs returned by an interrupted run are claimed again at once, as fresh jobs."""
+    queue.put(["a"])
+    queue.release(job.id for job in queue.claim(1))
+
+    assert queue.claim(1)[0].attempts == 1
+
+
+def test_concurrent_claims_do_not_overlap(tmp_path):
+    """Several connections claiming at the same time get disjoint jobs."""
+    with JobQueue(tmp_path / "jobs.db") as queue:
+        queue.put(range(1000))
+    claimed: list[list[int]] = []
+
+    def claim_all() -> None:
+        ids = []
+        with JobQueue(tmp_path / "jobs.db") as queue:
+            while jobs := queue.claim(7):
+                ids += [job.id for job in jobs]
+        claimed.append(ids)
+
+    threads = [threading.Thread(target=claim_all) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    ids = [job_id for part in claimed for job_id in part]
+    assert sorted(ids) == list(range(1, 1001))
+
+
+def test_backoff_is_capped():
+    """The delay doubles per attempt up to the cap, with jitter in its upper half."""
+    assert backoff_delay(10, base=1, cap=30, jitter=lambda: 1.0) == 30
+    assert 15 <= backoff_delay(10, base=1, cap=30) <= 30
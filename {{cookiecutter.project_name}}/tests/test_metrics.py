@@ -0,0 +1,63 @@
+"""Tests for the metrics instrumentation module."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from {{cookiecutter.project_name|lower|replace('-', '_')}} import metrics
+
+
+@pytest.fixture(autouse=True)
+def enabled_metrics():
+    """Record metrics during each test and start from an empty registry."""
+    metrics.reset()
+    metrics.enable()
+    yield
+    metrics.disable()
+    metrics.reset()
+
+
+def test_timed_records_duration():
+    """Each call of a timed function is observed once."""
+
+    @metrics.timed("work_seconds")
+    def work(x: int) -> int:
+        return x * 2
+
+    assert work(2) == 4
+    assert work(3) == 6
+    assert metrics.histogram("work_seconds").count == 2
+
+
+def test_disabled_metrics_record_nothing():
+    """Nothing is recorded while metrics are disabled."""
+    metrics.disable()
+    metrics.counter("calls_total").inc()
+    metrics.histogram("latency_seconds").observe(0.1)
+
+    assert metrics.counter("calls_total").value == 0
+    assert metrics.histogram("latency_seconds").count == 0
+
+
+def test_histogram_buckets():
+    """Observations land in the first bucket whose bound is not exceeded."""
+    hist = metrics.histogram("size", buckets=(1.0, 10.0))
+    for value in (0.5, 1.0, 5.0, 50.0):
+        hist.observe(value)
+
+    assert hist.bucket_counts == [2, 1, 1]
+    assert hist.sum == pytest.approx(56.5)
+
+
+@pytest.mark.parametrize("suffix,marker", [(".json", '"counters"'), (".prom", "# TYPE calls_total counter")])
+def test_export(tmp_path, suffix, marker):
+    """Exports pick the format from the file suffix."""
+    metrics.counter("calls_total").inc(3)
+    path = metrics.export(tmp_path / f"metrics{suffix}")
+
+    text = path.read_text()
+    assert marker in text
+    if suffix == ".json":
+        assert json.loads(text)["counters"]["calls_total"] == 3
@@ -9,8 +9,19 @@ Notebooks are tested via pytest-nbval - run with: pytest --nbval notebooks/
 from __future__ import annotations
 
 {% if cookiecutter.project_type == 'notebooks' -%}
+import os
 import pathlib
 
+import numpy as np
+import pandas as pd
+{%- if cookiecutter.dataframe_backend == 'polars' %}
+import polars as pl
+{%- endif %}
+import pyarrow as pa
+import pytest
+
+from {{cookiecutter.project_name|lower|replace('-', '_')}} import utils
+
 
 def test_notebooks_directory_exists():
     """Verify notebooks directory structure."""
@@ -26,4 +37,178 @@ def test_data_directory_exists():
     data_dir = pathlib.Path("data")
     assert data_dir.exists()
     assert data_dir.is_dir()
+
+
+def test_relative_paths_resolve_to_processed_dir(monkeypatch, tmp_path):
+    """Bare names land in data/processed with the format's suffix."""
+    monkeypatch.setattr(utils, "PROCESSED_DIR", tmp_path)
+
+    assert utils.save_array(np.zeros(3), "zeros") == tmp_path / "zeros.npy"
+    assert utils.save_table(pd.DataFrame({"x": [1]}), "nested/frame") == tmp_path / "nested" / "frame.feather"
+
+
+def test_open_array_is_memory_mapped(tmp_path):
+    """Arrays come back as read-only memory maps of the saved file."""
+    path = utils.save_array(np.arange(1000, dtype=np.float32), tmp_path / "values")
+
+    values = utils.open_array(path)
+
+    assert isinstance(values, np.memmap)
+    assert values.dtype == np.float32
+    assert not values.flags.writeable
+    np.testing.assert_array_equal(values[10:13], [10, 11, 12])
+
+
+def test_open_table_maps_columns_without_copying(tmp_path):
+    """Table columns point into the mapped file instead of allocated memory."""
+    df = pd.DataFrame({"x": np.arange(100_000), "category": ["A", "B"] * 50_000})
+    path = utils.save_table(df, tmp_path / "frame")
+    allocated = pa.total_allocated_bytes()
+
+    table = utils.open_table(path, columns=["x"])
+
+    assert table.column_names == ["x"]
+    assert pa.total_allocated_bytes() == allocated
+    assert table.slice(5, 2).to_pandas()["x"].tolist() == [5, 6]
+    pd.testing.assert_frame_equal(utils.open_table(path).to_pandas(), df)
+
+
+def test_overwriting_keeps_open_maps_intact(tmp_path):
+    """Saving over a file replaces it, so readers of the old version are unaffected."""
+    path = utils.save_array(np.ones(10), tmp_path / "values")
+    old = utils.open_array(path)
+
+    utils.save_array(np.zeros(5), path)
+
+    assert old.tolist() == [1.0] * 10
+    assert utils.open_array(path).tolist() == [0.0] * 5
+    assert [p.name for p in tmp_path.iterdir()] == ["values.npy"]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="file modes are POSIX")
+def test_saved_files_get_the_default_mode(tmp_path):
+    """Saved files are as accessible as files written with `open`, not private like temporary files."""
+    path = utils.save_table(pd.DataFrame({"x": [1]}), tmp_path / "frame")
+    plain = tmp_path / "plain.txt"
+    plain.write_text("")
+    assert path.stat().st_mode & 0o777 == plain.stat().st_mode & 0o777
+
+
+def test_synthetic_data_is_reproducible_across_chunk_sizes():
+    """The same seed gives the same rows whatever the chunking."""
+    whole = utils.generate_synthetic_data(10_000, n_categories=30, seed=1)
+    chunked = utils.generate_synthetic_data(10_000, n_categories=30, seed=1, chunk_rows=999)
+
+    pd.testing.assert_frame_equal(whole, chunked)
+    assert list(whole.columns) == ["x", "y", "category"]
+    assert whole["category"].cat.categories[-4:].tolist() == ["AA", "AB", "AC", "AD"]
+    assert whole["x"].between(0, 10).all()
+    assert abs((whole["y"] - whole["x"] ** 2).mean()) < 0.1
+
+
+def test_category_summary(synthetic_data):
+    """The group analysis of 01-exploratory.ipynb works at the size given by --synthetic-rows."""
+    summary = synthetic_data.groupby("category", observed=True)["y"].agg(["mean", "count"])
+
+    assert len(summary) == 8
+    assert summary["count"].sum() == len(synthetic_data)
+
+
+def test_synthetic_data_streams_to_file(monkeypatch, tmp_path):
+    """Streaming to a file writes the same rows as generating in memory."""
+    monkeypatch.setattr(utils, "RAW_DIR", tmp_path)
+
+    path = utils.generate_synthetic_data(5_000, n_categories=4, seed=7, out="synthetic", chunk_rows=1_000)
+
+    assert path == tmp_path / "synthetic.feather"
+    table = utils.open_table(path)
+    assert table.num_rows == 5_000
+    assert table.to_batches()[0].num_rows == 1_000
+    assert pa.types.is_signed_integer(table.schema.field("category").type.index_type)
+    pd.testing.assert_frame_equal(table.to_pandas(), utils.generate_synthetic_data(5_000, n_categories=4, seed=7))
+
+
+{% if cookiecutter.dataframe_backend == 'polars' -%}
+def test_load_many_pushes_projection_and_predicate_into_the_scan(tmp_path):
+    """The loader returns a lazy query that reads only the requested columns and rows of each file."""
+    for part in range(4):
+        df = pl.DataFrame({"x": np.arange(5) + 5 * part, "y": np.ones(5), "category": ["A", "B", "A", "B", "A"]})
+        df.write_parquet(tmp_path / f"part-{part}.parquet")
+
+    query = utils.load_many(
+        str(tmp_path / "part-*.parquet"), columns=["x", "file"], where=pl.col("x") >= 13, source_column="file"
+    )
+
+    assert isinstance(query, pl.LazyFrame)
+    plan = query.explain()
+    assert plan.count("SELECTION") == 4
+    assert plan.count("PROJECT 1/3 COLUMNS") == 4
+    df = query.collect()
+    assert df["x"].to_list() == list(range(13, 20))
+    assert df["file"].to_list() == ["part-2.parquet"] * 2 + ["part-3.parquet"] * 5
+
+
+def test_load_many_aligns_columns(monkeypatch, tmp_path):
+    """Columns missing from some parts are filled, or rejected in strict mode."""
+    monkeypatch.setattr(utils, "RAW_DIR", tmp_path)
+    pl.DataFrame({"x": [1], "y": [2]}).write_csv(tmp_path / "a.csv")
+    pl.DataFrame({"x": [3.5], "z": [4]}).write_csv(tmp_path / "b.csv")
+
+    df = utils.load_many("*.csv").collect()
+
+    assert df.columns == ["x", "y", "z"]
+    assert df["x"].to_list() == [1.0, 3.5]
+    assert df["y"].is_null().to_list() == [False, True]
+    with pytest.raises(ValueError, match=r"b\.csv has columns"):
+        utils.load_many("*.csv", strict=True)
+    with pytest.raises(FileNotFoundError):
+        utils.load_many("*.parquet")
+
+
+def test_to_pandas_converts_the_query_result(tmp_path):
+    """Queries over streamed synthetic data come out as pandas frames, with categories kept."""
+    path = utils.generate_synthetic_data(10_000, n_categories=4, out=tmp_path / "synthetic", chunk_rows=1_000)
+    query = utils.load_many(str(path)).group_by("category").agg(pl.len()).sort("category")
+
+    df = utils.to_pandas(query, streaming=True)
+
+    assert isinstance(df, pd.DataFrame)
+    assert df["category"].dtype == "category"
+    assert df["category"].tolist() == ["A", "B", "C", "D"]
+    assert df["len"].sum() == 10_000
+{%- else -%}
+@pytest.mark.parametrize("suffix,executor", [(".csv", "process"), (".csv", "thread"), (".parquet", "auto")])
+def test_load_many_concatenates_parts(tmp_path, suffix, executor):
+    """Parts are read concurrently and concatenated in path order, tagged with their file."""
+    (tmp_path / "drop").mkdir()
+    for part in range(4):
+        df = pd.DataFrame({"x": np.arange(5) + 5 * part, "category": ["A", "B", "A", "B", "A"]})
+        path = tmp_path / "drop" / f"part-{part}{suffix}"
+        if suffix == ".csv":
+            df.to_csv(path, index=False)
+        else:
+            df.to_parquet(path, index=False)
+
+    df = utils.load_many(str(tmp_path / "drop" / f"part-*{suffix}"), executor=executor, source_column="file")
+
+    assert df["x"].tolist() == list(range(20))
+    assert df["file"].dtype == "category"
+    assert df["file"].iloc[[0, 19]].tolist() == [f"part-0{suffix}", f"part-3{suffix}"]
+
+
+def test_load_many_aligns_columns(monkeypatch, tmp_path):
+    """Columns missing from some parts are filled, or rejected in strict mode."""
+    monkeypatch.setattr(utils, "RAW_DIR", tmp_path)
+    pd.DataFrame({"x": [1], "y": [2]}).to_csv(tmp_path / "a.csv", index=False)
+    pd.DataFrame({"x": [3], "z": [4]}).to_csv(tmp_path / "b.csv", index=False)
+
+    df = utils.load_many("*.csv", executor="thread")
+
+    assert list(df.columns) == ["x", "y", "z"]
+    assert df["y"].isna().tolist() == [False, True]
+    with pytest.raises(ValueError, match=r"b\.csv has columns"):
+        utils.load_many("*.csv", executor="thread", strict=True)
+    with pytest.raises(FileNotFoundError):
+        utils.load_many("*.parquet")
+{%- endif %}
 {%- endif %}
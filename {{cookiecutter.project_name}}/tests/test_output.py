@@ -0,0 +1,75 @@
+"""Tests for the command output formats."""
+
+from __future__ import annotations
+
+import io
+import json
+import subprocess
+import sys
+
+import pytest
+
+from {{cookiecutter.project_name|lower|replace('-', '_')}} import output
+
+RECORDS = [{"name": "Alice", "count": 1}, {"name": "Bob", "count": 2}]
+
+
+def _render(fmt: str, records: list[dict]) -> str:
+    stream = io.StringIO()
+    out = output.make_output(fmt, stream)
+    for record in records:
+        out.emit(record)
+    out.close()
+    return stream.getvalue()
+
+
+@pytest.mark.parametrize("records", [RECORDS, []])
+def test_json_output(records):
+    """The json format writes one valid JSON array."""
+    assert json.loads(_render("json", records)) == records
+
+
+def test_ndjson_output():
+    """The ndjson format writes one JSON object per line."""
+    lines = _render("ndjson", RECORDS).splitlines()
+    assert [json.loads(line) for line in lines] == RECORDS
+
+
+def test_plain_output():
+    """The plain format writes tab-separated values."""
+    assert _render("plain", RECORDS) == "Alice\t1\nBob\t2\n"
+
+
+def test_output_without_format_cannot_be_created():
+    """A format that does not implement `format` fails when created, not on its first record."""
+
+    class Incomplete(output.Output):
+        pass
+
+    with pytest.raises(TypeError, match="abstract"):
+        Incomplete(io.StringIO())
+
+
+def test_output_is_buffered(monkeypatch):
+    """Records are written in batches rather than one write per record."""
+    monkeypatch.setattr(output, "BUFFER_RECORDS", 10)
+    stream = io.StringIO()
+    out = output.make_output("ndjson", stream)
+    for i in range(9):
+        out.emit({"i": i})
+    assert stream.getvalue() == ""
+    out.emit({"i": 9})
+    assert len(stream.getvalue().splitlines()) == 10
+
+
+@pytest.mark.parametrize("fmt", ["json", "ndjson", "plain"])
+def test_machine_formats_do_not_import_rich(fmt):
+    """Machine-readable formats never import Rich."""
+    code = (
+        "import sys\n"
+        "from {{cookiecutter.project_name|lower|replace('-', '_')}}.cli import app\n"
+        f"app(['--output', '{fmt}', 'version'], standalone_mode=False)\n"
+        "print('rich' in sys.modules)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+    assert result.stdout.splitlines()[-1] == "False"
@@ -0,0 +1,85 @@
+"""Tests for the shared-memory process-pool helpers."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from {{cookiecutter.project_name|lower|replace('-', '_')}} import parallel
+from {{cookiecutter.project_name|lower|replace('-', '_')}}.utils import newton_sqrt
+
+
+def _column_sum(handle: parallel.SharedArray) -> float:
+    return float(handle.open().sum())
+
+
+def _crash(_: int) -> None:
+    os._exit(1)
+
+
+def _segment_exists(name: str) -> bool:
+    try:
+        segment = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return False
+    segment.close()
+    return True
+
+
+def test_pmap_keeps_order_across_chunks():
+    """Results come back in input order, whatever the chunking."""
+    assert parallel.pmap(abs, range(-50, 0), workers=2, chunksize=7) == list(range(50, 0, -1))
+    assert parallel.pmap(abs, []) == []
+
+
+def test_shared_frame_columns_are_readable_in_workers():
+    """Workers see the published columns without receiving the frame."""
+    df = pd.DataFrame({"x": np.arange(100.0), "y": np.ones(100, dtype=np.int32)})
+
+    with parallel.shared(df) as columns:
+        sums = parallel.pmap(_column_sum, [columns["x"], columns["y"]], workers=2)
+        view = columns["y"].open()
+        assert view.dtype == np.int32
+        assert not view.flags.writeable
+
+    assert sums == [4950.0, 100.0]
+
+
+def test_shared_rejects_object_columns():
+    """Strings and other Python objects cannot be shared."""
+    with pytest.raises(TypeError, match="'category'"), parallel.shared(pd.DataFrame({"category": ["a", "b"]})):
+        pass
+
+
+def test_segments_are_removed_when_a_worker_crashes():
+    """A dead worker breaks the pool, but the shared memory is still released."""
+    with pytest.raises(BrokenProcessPool), parallel.shared({"x": np.arange(10)}) as arrays:
+        name = arrays["x"].name
+        parallel.pmap(_crash, range(4), workers=2)
+
+    assert not _segment_exists(name)
+
+
+def test_map_column_matches_serial_result():
+    """The parallel transform equals the serial one, block boundaries included."""
+    values = pd.Series(np.linspace(0, 1000, 1001))
+
+    result = parallel.map_column(newton_sqrt, values, workers=2, blocks=7)
+
+    np.testing.assert_allclose(result, np.sqrt(values))
+
+
+@pytest.mark.parametrize("length,blocks", [(0, 4), (3, 8), (10, 3), (1000, 16)])
+def test_block_slices_cover_range(length, blocks):
+    """Slices are contiguous, non-empty (unless the range is) and cover the range exactly."""
+    slices = parallel.block_slices(length, blocks)
+
+    covered = [i for block in slices for i in range(length)[block]]
+    assert covered == list(range(length))
+    assert len(slices) <= max(blocks, 1)
+    assert all(block.stop > block.start for block in slices) or length == 0
@@ -0,0 +1,143 @@
+"""Tests for plugin discovery and the lazily imported plugin commands."""
+
+from __future__ import annotations
+
+import json
+import sys
+import textwrap
+
+import pytest
+from typer.testing import CliRunner
+
+from {{cookiecutter.project_name|lower|replace('-', '_')}} import plugins
+from {{cookiecutter.project_name|lower|replace('-', '_')}}.cli import app
+
+runner = CliRunner()
+
+PLUGIN_SOURCE = '''
+import typer
+
+app = typer.Typer()
+
+
+@app.command()
+def report(ctx: typer.Context, rows: int = typer.Option(1, help="Number of rows")) -> None:
+    """Print a small report."""
+    for row in range(rows):
+        ctx.obj.emit({"row": row})
+
+
+@app.command()
+def hello() -> None:
+    """Clashes with the built-in command."""
+'''
+
+
+@pytest.fixture
+def plugin(tmp_path, monkeypatch):
+    """Install `demo_plugin` as the only plugin, with the index in a temporary directory."""
+    (tmp_path / "demo_plugin.py").write_text(textwrap.dedent(PLUGIN_SOURCE))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv(plugins.ENV_INDEX, str(tmp_path / "index.json"))
+    monkeypatch.setattr(plugins, "_entry_points", lambda: [("demo", "demo_plugin:app")])
+    plugins._cached_index.cache_clear()
+    yield tmp_path / "index.json"
+    plugins._cached_index.cache_clear()
+    sys.modules.pop("demo_plugin", None)
+
+
+def _fresh_process(monkeypatch) -> None:
+    """Forget what this process imported and cached, as if the CLI started again."""
+    sys.modules.pop("demo_plugin", None)
+    plugins._cached_index.cache_clear()
+
+    def fail() -> list[tuple[str, str]]:
+        msg = "entry points were scanned although the index is current"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(plugins, "_entry_points", fail)
+
+
+def test_index_is_written_once(plugin, monkeypatch):
+    """The first run builds and saves the index; later runs read it without scanning entry points."""
+    index = plugins.load_index()
+    assert set(index["commands"]) == {"report", "hello"}
+    assert json.loads(plugin.read_text()) == index
+
+    _fresh_process(monkeypatch)
+    assert plugins.load_index() == index
+
+
+def test_help_does_not_import_plugins(plugin, monkeypatch):
+    """Listing commands uses the index only."""
+    plugins.load_index()
+    _fresh_process(monkeypatch)
+
+    result = runner.invoke(app, ["--help"])
+
+    assert result.exit_code == 0
+    assert "report" in result.output
+    assert "Print a small report." in result.output
+    assert "demo_plugin" not in sys.modules
+
+
+def test_plugin_command_runs(plugin, monkeypatch):
+    """Running a plugin command imports the plugin and shares the CLI's options."""
+    plugins.load_index()
+    _fresh_process(monkeypatch)
+
+    result = runner.invoke(app, ["--output", "ndjson", "report", "--rows", "2"])
+
+    assert result.exit_code == 0, result.output
+    assert [json.loads(line) for line in result.output.splitlines()] == [{"row": 0}, {"row": 1}]
+    assert "demo_plugin" in sys.modules
+
+
+def test_plugin_command_help(plugin):
+    """A plugin command's own help comes from the real command."""
+    result = runner.invoke(app, ["report", "--help"])
+
+    assert result.exit_code == 0
+    assert "Number of rows" in result.output
+
+
+def test_builtin_commands_take_precedence(plugin):
+    """A plugin command named like a built-in one is ignored."""
+    result = runner.invoke(app, ["hello", "--name", "Plugin"])
+
+    assert "Hello, Plugin!" in result.output
+
+
+def test_index_is_rebuilt_when_environment_changes(plugin, monkeypatch):
+    """A different fingerprint of the installed distributions triggers a rebuild."""
+    monkeypatch.setattr(plugins, "environment_fingerprint", lambda: "before")
+    plugins.load_index()
+    (plugin.parent / "demo_plugin.py").write_text(PLUGIN_SOURCE.replace("def report", "def summary"))
+    sys.modules.pop("demo_plugin", None)
+    plugins._cached_index.cache_clear()
+    assert "report" in plugins.load_index()["commands"]
+
+    monkeypatch.setattr(plugins, "environment_fingerprint", lambda: "after")
+    plugins._cached_index.cache_clear()
+    assert set(plugins.load_index()["commands"]) == {"summary", "hello"}
+
+
+def test_broken_plugin_is_skipped(plugin, monkeypatch, capsys):
+    """A plugin that fails to import is reported but does not break the CLI."""
+    monkeypatch.setattr(
+        plugins, "_entry_points", lambda: [("broken", "no_such_module:app"), ("demo", "demo_plugin:app")]
+    )
+
+    index = plugins.load_index()
+
+    assert set(index["commands"]) == {"report", "hello"}
+    assert "skipping plugin 'broken'" in capsys.readouterr().err
+
+
+def test_plugins_command_lists_index(plugin):
+    """`plugins` shows each plugin command with its help."""
+    result = runner.invoke(app, ["--output", "ndjson", "plugins", "--refresh"])
+
+    assert result.exit_code == 0, result.output
+    records = [json.loads(line) for line in result.output.splitlines()]
+    assert {"command": "report", "plugin": "demo", "help": "Print a small report."} in records
@@ -0,0 +1,144 @@
+"""Tests for the experiment results store, with the writer function defined here so that workers can import it."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from {{cookiecutter.project_name|lower|replace('-', '_')}}.results import ResultStore
+
+
+def _write_runs(path: Path, worker: int) -> int:
+    with ResultStore(path) as store:
+        for batch in range(5):
+            runs = [
+                (f"w{worker}-{batch}-{i}", {"worker": worker, "lr": 10.0**-i}, {"loss": 1.0 / (i + 1)})
+                for i in range(20)
+            ]
+            store.log_runs(runs)
+    return worker
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ResultStore(tmp_path / "results.db") as store:
+        yield store
+
+
+def test_runs_frame_has_a_column_per_param_and_metric(store):
+    """Runs come back one per row, oldest first, with missing values where a run did not log something."""
+    store.log_runs([
+        ("a", {"model": "cnn", "lr": 0.1}, {"loss": 0.5}),
+        ("b", {"model": "mlp"}, {"loss": 0.7, "acc": 0.8}),
+    ])
+
+    df = store.runs()
+
+    assert list(df.columns) == ["experiment", "run", "created_at", "lr", "model", "acc", "loss"]
+    assert df["run"].tolist() == ["a", "b"]
+    assert df["lr"].dtype == "float64"
+    assert df["lr"].isna().tolist() == [False, True]
+    assert df["acc"].isna().tolist() == [True, False]
+    assert pd.api.types.is_datetime64_any_dtype(df["created_at"])
+
+
+def test_metrics_use_the_last_step_and_keep_their_history(store):
+    """Metrics logged per step report their last value, and the history keeps every step."""
+    for step, loss in enumerate([0.9, 0.5, 0.2]):
+        store.log_run("a", {"lr": 0.1}, {"loss": loss}, step=step)
+
+    assert store.runs()["loss"].tolist() == [0.2]
+    history = store.history("loss")
+    assert history.to_dict("list") == {"run": ["a"] * 3, "step": [0, 1, 2], "value": [0.9, 0.5, 0.2]}
+
+
+def test_lookups_by_param_and_metric(store):
+    """Runs are found by parameter values, ranked by metric and compared per parameter value."""
+    runs = [
+        (f"run{i}", {"lr": [0.1, 0.01][i % 2], "model": "cnn" if i < 4 else "mlp"}, {"acc": i / 10}) for i in range(8)
+    ]
+    store.log_runs(runs)
+    store.log_runs([("other", {"lr": 0.1}, {"acc": 1.0})], experiment="baseline")
+
+    assert store.runs(where={"lr": 0.01, "model": "cnn"})["run"].tolist() == ["run1", "run3"]
+    assert store.best("acc", n=3)["run"].tolist() == ["other", "run7", "run6"]
+    assert store.best("acc", n=2, maximize=False, experiment="default")["run"].tolist() == ["run0", "run1"]
+    comparison = store.compare("acc", by="lr", experiment="default")
+    assert comparison.to_dict("list") == {
+        "lr": [0.01, 0.1],
+        "runs": [4, 4],
+        "mean": pytest.approx([0.4, 0.3]),
+        "min": [0.1, 0.0],
+        "max": [0.7, 0.6],
+    }
+
+
+def test_relogging_overwrites_and_collisions_are_suffixed(store):
+    """Logging a run again updates it in place; a metric named like a parameter gets a suffix."""
+    store.log_run("a", {"lr": 0.1, "opt": {"name": "adam"}}, {"lr": 0.5})
+    store.log_run("a", {"lr": 0.2}, {})
+
+    df = store.runs()
+
+    assert len(df) == 1
+    assert df.loc[0, "lr"] == 0.2
+    assert df.loc[0, "lr_metric"] == 0.5
+    assert df.loc[0, "opt"] == '{"name": "adam"}'
+
+
+def test_numpy_values_are_stored_as_python_values(store):
+    """NumPy parameters and metrics, e.g. from a grid or a model, are stored like the Python numbers they hold."""
+    for i, lr in enumerate(np.array([0.1, 0.01], dtype=np.float32)):
+        params = {"lr": lr, "layers": np.int64(i + 1), "sizes": np.arange(2) * i, "opt": {"eps": np.float64(1e-8)}}
+        store.log_run(f"run{i}", params, {"acc": np.float32(0.5 + i / 4), "steps": np.int64(10)})
+
+    df = store.runs(where={"layers": np.int64(2)})
+
+    assert df["run"].tolist() == ["run1"]
+    assert df.loc[0, "sizes"] == "[0, 1]"
+    assert df.loc[0, "opt"] == '{"eps": 1e-08}'
+    assert df["acc"].dtype == df["steps"].dtype == "float64"
+    assert store.best("acc", n=1)["run"].tolist() == ["run1"]
+    comparison = store.compare("acc", by="layers")
+    assert comparison[["layers", "mean"]].to_dict("list") == {"layers": [1, 2], "mean": [0.5, 0.75]}
+
+
+def test_concurrent_writers(tmp_path):
+    """Processes writing batches to the same database at once lose nothing."""
+    path = tmp_path / "results.db"
+    ResultStore(path).close()
+
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        assert sorted(pool.map(_write_runs, [path] * 4, range(4))) == [0, 1, 2, 3]
+
+    with ResultStore(path) as store:
+        df = store.runs()
+        assert len(df) == 4 * 5 * 20
+        assert df.groupby("worker").size().tolist() == [100] * 4
+
+
+@pytest.fixture
+def many_runs(store):
+    """A store holding 5,000 runs, logged in one batch."""
+    runs = [
+        (f"run{i}", {"lr": 10.0 ** -(i % 5), "seed": i}, {"loss": 1 / (i + 1), "acc": (i % 97) / 97})
+        for i in range(5_000)
+    ]
+    store.log_runs(runs)
+    return store
+
+
+@pytest.mark.time_budget(0.5)
+def test_queries_over_thousands_of_runs_are_fast(many_runs):
+    """Indexed lookups and SQL aggregation keep queries over thousands of runs well under a second."""
+    comparison = many_runs.compare("acc", by="lr")
+    best = many_runs.best("acc", n=5)
+    single = many_runs.runs(where={"seed": 4_321})
+
+    assert comparison["runs"].sum() == 5_000
+    assert best["acc"].iloc[0] == 96 / 97
+    assert single["run"].tolist() == ["run4321"]
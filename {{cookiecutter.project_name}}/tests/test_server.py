@@ -0,0 +1,96 @@
+"""Tests for the warm-process server mode."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+from {{cookiecutter.project_name|lower|replace('-', '_')}} import server
+
+pytestmark = pytest.mark.skipif(not server.SUPPORTED, reason="needs Unix domain sockets and fork")
+
+CLIENT = "from {{cookiecutter.project_name|lower|replace('-', '_')}}.server import client_main; client_main()"
+
+
+@pytest.fixture
+def server_env():
+    """Point the client and server at a private socket and stop the server afterwards."""
+    # Unix socket paths are limited to ~100 characters, so avoid long temporary directories.
+    socket_dir = tempfile.mkdtemp(dir="/tmp" if os.path.isdir("/tmp") else None)  # noqa: S108
+    env = {**os.environ, f"{server.ENV_PREFIX}_SOCKET": os.path.join(socket_dir, "s.sock")}
+    yield env
+    subprocess.run([sys.executable, "-m", server.__name__, "stop"], env=env, capture_output=True, check=False)  # noqa: S603
+    shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+def _client(env: dict[str, str], *args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run([sys.executable, "-c", CLIENT, *args], env=env, capture_output=True, text=True, check=False)  # noqa: S603
+
+
+def _status(env: dict[str, str]) -> str:
+    result = subprocess.run([sys.executable, "-m", server.__name__, "status"], env=env, capture_output=True, text=True)  # noqa: S603
+    return result.stdout.strip()
+
+
+def test_commands_run_in_warm_server(server_env):
+    """Repeated invocations are served by the same server process."""
+    first = _client(server_env, "--output", "ndjson", "version")
+    status = _status(server_env)
+    second = _client(server_env, "--output", "ndjson", "version")
+
+    assert first.returncode == second.returncode == 0
+    assert json.loads(first.stdout) == json.loads(second.stdout)
+    assert json.loads(status)["pid"] == json.loads(_status(server_env))["pid"]
+
+
+def test_exit_code_and_stderr_are_forwarded(server_env):
+    """Usage errors keep their exit code and message."""
+    result = _client(server_env, "hello", "--bogus")
+
+    assert result.returncode == 2
+    assert "--bogus" in result.stderr
+
+
+def test_stop(server_env):
+    """The server can be stopped explicitly."""
+    _client(server_env, "version")
+    subprocess.run([sys.executable, "-m", server.__name__, "stop"], env=server_env, check=True, capture_output=True)  # noqa: S603
+    assert _status(server_env) == "not running"
+
+
+@pytest.mark.parametrize("unsafe", ["shared", "symlink"])
+def test_unsafe_socket_directory_is_refused(tmp_path, unsafe):
+    """Neither the client nor the server uses a socket directory that other users could control."""
+    private = tmp_path / "private"
+    private.mkdir(mode=0o700)
+    socket_dir = tmp_path / "sockets"
+    if unsafe == "shared":
+        socket_dir.mkdir()
+        socket_dir.chmod(0o755)
+    else:
+        socket_dir.symlink_to(private)
+    env = {**os.environ, f"{server.ENV_PREFIX}_SOCKET": str(socket_dir / "s.sock")}
+
+    with pytest.raises(PermissionError, match="refusing"):
+        server._request({"control": "status"}, socket_dir / "s.sock")
+    result = _client(env, "--output", "ndjson", "version")
+    assert result.returncode == 0
+    assert json.loads(result.stdout)
+    assert "running without the server" in result.stderr
+    assert not (private / "s.sock").exists()
+
+
+def test_source_fingerprint_changes(tmp_path, monkeypatch):
+    """Editing a source file changes the fingerprint that triggers a restart."""
+    monkeypatch.setattr(server, "PACKAGE_DIR", tmp_path)
+    module = tmp_path / "mod.py"
+    module.write_text("x = 1\n")
+    before = server.source_fingerprint()
+    module.write_text("x = 22\n")
+    assert server.source_fingerprint() != before
@@ -0,0 +1,127 @@
+"""Tests for the HTTP service, against the local stub upstream."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from {{cookiecutter.project_name|lower|replace('-', '_')}} import stub
+from {{cookiecutter.project_name|lower|replace('-', '_')}}.app import Settings, create_app, serve
+
+
+@contextlib.asynccontextmanager
+async def service(latency: float = 0.0, **settings: object) -> AsyncIterator[tuple[TestClient, web.Application]]:
+    """Run the service against a fresh stub upstream; yields a client for the service and the stub app."""
+    runner, url = await stub.start_stub(latency=latency)
+    try:
+        app = create_app(Settings(upstream_url=url, **settings))  # type: ignore[arg-type]
+        async with TestClient(TestServer(app)) as client:
+            yield client, runner.app
+    finally:
+        await runner.cleanup()
+
+
+def test_health_and_hello():
+    """Local endpoints answer without the upstream."""
+
+    async def scenario() -> None:
+        async with service() as (client, _):
+            assert await (await client.get("/healthz")).json() == {"status": "ok"}
+            response = await client.get("/hello", params={"name": "Alice"})
+            assert await response.json() == {"greeting": "Hello, Alice!"}
+            assert response.headers["Server-Timing"].startswith("app;dur=")
+
+    asyncio.run(scenario())
+
+
+def test_items_reuse_pooled_connections():
+    """Sequential upstream calls share one kept-alive connection."""
+
+    async def scenario() -> None:
+        async with service() as (client, upstream):
+            for key in ["a", "bb", "ccc"] * 5:
+                response = await client.get(f"/items/{key}")
+                assert response.status == 200
+                assert await response.json() == {"key": key, "item": {"key": key, "value": len(key)}}
+            assert len(upstream[stub.PEERS]) == 1
+
+    asyncio.run(scenario())
+
+
+def test_pool_size_bounds_upstream_connections():
+    """Concurrent requests open at most `pool_size` upstream connections."""
+
+    async def scenario() -> None:
+        async with service(latency=0.05, pool_size=2) as (client, upstream):
+            responses = await asyncio.gather(*(client.get(f"/items/{i}") for i in range(8)))
+            assert [response.status for response in responses] == [200] * 8
+            assert len(upstream[stub.PEERS]) == 2
+
+    asyncio.run(scenario())
+
+
+def test_upstream_errors():
+    """A missing item is a 404; an unreachable or slow upstream is a 502."""
+
+    async def scenario() -> None:
+        async with service() as (client, _):
+            assert (await client.get("/items/missing-1")).status == 404
+        async with service(latency=1.0, upstream_timeout=0.1) as (client, _):
+            response = await client.get("/items/slow")
+            assert response.status == 502
+            assert await response.json() == {"error": "upstream unavailable"}
+
+    asyncio.run(scenario())
+
+
+def test_access_log_records_timing(caplog):
+    """Every request produces one structured access record."""
+
+    async def scenario() -> None:
+        async with service() as (client, _):
+            await client.get("/hello")
+            await client.get("/nowhere")
+
+    with caplog.at_level(logging.INFO, logger="{{cookiecutter.project_name|lower|replace('-', '_')}}.access"):
+        asyncio.run(scenario())
+
+    records = [record.access for record in caplog.records if hasattr(record, "access")]
+    assert [(r["method"], r["path"], r["status"]) for r in records] == [
+        ("GET", "/hello", 200),
+        ("GET", "/nowhere", 404),
+    ]
+    assert all(r["duration_ms"] >= 0 for r in records)
+
+
+def test_graceful_shutdown_finishes_in_flight_requests():
+    """After stop, the in-flight request completes, and new connections are refused."""
+
+    async def scenario() -> None:
+        runner, url = await stub.start_stub(latency=0.3)
+        stop = asyncio.Event()
+        bound = asyncio.get_running_loop().create_future()
+        server = asyncio.create_task(
+            serve(Settings(port=0, upstream_url=url), stop=stop, ready=bound.set_result),
+        )
+        base = f"http://127.0.0.1:{await bound}"
+        try:
+            async with aiohttp.ClientSession(base) as session:
+                in_flight = asyncio.create_task(session.get("/items/slow"))
+                await asyncio.sleep(0.1)
+                stop.set()
+                response = await in_flight
+                assert response.status == 200
+                await server
+                with pytest.raises(aiohttp.ClientConnectionError):
+                    await session.get("/healthz")
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(scenario())
@@ -0,0 +1,180 @@
+"""Tests for the worker pool, with task functions defined here so that workers can import them."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from {{cookiecutter.project_name|lower|replace('-', '_')}} import tasks
+from {{cookiecutter.project_name|lower|replace('-', '_')}}.jobs import JobQueue
+from {{cookiecutter.project_name|lower|replace('-', '_')}}.worker import WorkerInitError, main, run
+
+_inits = 0
+
+
+def _count_init() -> None:
+    global _inits
+    _inits += 1
+
+
+def _report_inits(batch: list[int]) -> list[list[int]]:
+    return [[os.getpid(), _inits] for _ in batch]
+
+
+def _fail_bad_and_flaky(batch: list[str]) -> list[str]:
+    """Fail on "bad" always, and on "flaky:<path>" until the file at <path> exists."""
+    for payload in batch:
+        if payload == "bad":
+            msg = "bad payload"
+            raise ValueError(msg)
+        if payload.startswith("flaky:") and not Path(payload[6:]).exists():
+            Path(payload[6:]).touch()
+            msg = "not yet"
+            raise OSError(msg)
+    return [payload.upper() for payload in batch]
+
+
+def _fail_once_and_report_batch_size(batch: list[str]) -> list[int]:
+    """Fail on each "<path>" payload until the file at <path> exists, then return the size of its batch."""
+    for payload in batch:
+        if not Path(payload).exists():
+            Path(payload).touch()
+            msg = "not yet"
+            raise OSError(msg)
+    return [len(batch)] * len(batch)
+
+
+def _crash_on_crash(batch: list[str]) -> list[str]:
+    if "crash" in batch:
+        os._exit(1)
+    return batch
+
+
+def _fail_init() -> None:
+    msg = "model not found"
+    raise FileNotFoundError(msg)
+
+
+def _queue(path: Path, payloads: list) -> Path:
+    with JobQueue(path) as queue:
+        queue.put(payloads)
+    return path
+
+
+def test_run_processes_every_job(tmp_path):
+    """All jobs complete, in batches across workers, with the same results as a direct call."""
+    documents = [f"document {i} about cats and dogs {i % 7}" for i in range(200)]
+    path = _queue(tmp_path / "jobs.db", documents)
+
+    stats = run(path, tasks.extract_features, init=tasks.init, workers=2, batch_size=16)
+
+    assert (stats.done, stats.failed, stats.retried) == (200, 0, 0)
+    tasks.init()
+    with JobQueue(path) as queue:
+        assert [result for _, result in queue.results()] == tasks.extract_features(documents)
+
+
+def test_init_runs_once_per_worker(tmp_path):
+    """Each worker process initializes once, however many batches it runs."""
+    path = _queue(tmp_path / "jobs.db", list(range(100)))
+
+    run(path, _report_inits, init=_count_init, workers=2, batch_size=5)
+
+    with JobQueue(path) as queue:
+        reports = [result for _, result in queue.results()]
+    assert len({pid for pid, _ in reports}) <= 2
+    assert {inits for _, inits in reports} == {1}
+
+
+def test_failing_jobs_are_isolated_and_retried(tmp_path):
+    """Only the jobs that raise are retried, and a job that keeps failing is marked as failed."""
+    payloads = ["a", "bad", f"flaky:{tmp_path / 'marker'}", "b"]
+    path = _queue(tmp_path / "jobs.db", payloads)
+
+    stats = run(path, _fail_bad_and_flaky, workers=1, max_attempts=3, backoff=0)
+
+    assert (stats.done, stats.failed, stats.retried) == (3, 1, 3)
+    with JobQueue(path) as queue:
+        assert [payload for payload, _ in queue.results()] == ["a", payloads[2], "b"]
+        assert list(queue.failures()) == [("bad", "ValueError: bad payload")]
+
+
+def test_retries_of_jobs_that_raised_run_in_batches(tmp_path):
+    """Jobs that raised are retried together; only jobs whose worker died run alone."""
+    path = _queue(tmp_path / "jobs.db", [str(tmp_path / f"marker{i}") for i in range(8)])
+
+    stats = run(path, _fail_once_and_report_batch_size, workers=1, batch_size=8, backoff=0)
+
+    assert (stats.done, stats.failed, stats.retried) == (8, 0, 7)
+    with JobQueue(path) as queue:
+        sizes = [size for _, size in queue.results()]
+    # The first job succeeds alone while the failing batch is split up; the other seven are retried as one batch.
+    assert sizes == [1] + [7] * 7
+
+
+def test_worker_crash_restarts_the_pool(tmp_path):
+    """A job that kills its worker fails on its own; the other jobs complete in a new pool."""
+    path = _queue(tmp_path / "jobs.db", [*map(str, range(20)), "crash"])
+
+    stats = run(path, _crash_on_crash, workers=2, batch_size=4, max_attempts=2, backoff=0)
+
+    assert (stats.done, stats.failed) == (20, 1)
+    assert stats.restarts >= 1
+    with JobQueue(path) as queue:
+        assert list(queue.failures()) == [("crash", "worker process died")]
+
+
+def test_worker_crash_uses_no_attempt_of_the_other_jobs(tmp_path):
+    """With a single attempt per job, the jobs in flight with one that kills its worker still complete."""
+    path = _queue(tmp_path / "jobs.db", [*map(str, range(8)), "crash", *map(str, range(8, 40))])
+
+    stats = run(path, _crash_on_crash, workers=2, batch_size=4, max_attempts=1)
+
+    assert (stats.done, stats.failed, stats.retried) == (40, 1, 0)
+    with JobQueue(path) as queue:
+        assert list(queue.failures()) == [("crash", "worker process died")]
+        assert sorted(int(payload) for payload, _ in queue.results()) == list(range(40))
+
+
+def test_init_failure_returns_the_jobs(tmp_path):
+    """If workers cannot initialize, the run stops and its jobs are queued again without using an attempt."""
+    path = _queue(tmp_path / "jobs.db", ["a", "b"])
+
+    with pytest.raises(WorkerInitError, match="model not found"):
+        run(path, _report_inits, init=_fail_init, workers=1)
+
+    with JobQueue(path) as queue:
+        assert queue.counts()["pending"] == 2
+        assert [job.attempts for job in queue.claim(2)] == [1, 1]
+
+
+def test_run_resumes_after_a_killed_run(tmp_path):
+    """A new run skips completed jobs and takes over the expired leases of a run that was killed."""
+    path = _queue(tmp_path / "jobs.db", [f"job{i}" for i in range(10)])
+    with JobQueue(path) as queue:
+        done = queue.claim(4)
+        queue.complete((job.id, "earlier") for job in done)
+        queue.claim(3, lease=0)  # Claimed by a run that died before finishing them.
+
+    stats = run(path, _fail_bad_and_flaky, workers=2, backoff=0)
+
+    assert stats.done == 6
+    with JobQueue(path) as queue:
+        assert [result for _, result in queue.results()] == ["earlier"] * 4 + [f"JOB{i}" for i in range(4, 10)]
+
+
+def test_cli_enqueue_run_and_status(tmp_path, capsys):
+    """The command line queues the lines of a file, runs them with the example task and reports the failures."""
+    source = tmp_path / "documents.txt"
+    source.write_text('the cat sat\n\n{"not": "a string"}\n')
+    path = str(tmp_path / "jobs.db")
+
+    assert main(["enqueue", path, str(source)]) == 0
+    assert main(["run", path, "--workers", "1", "--max-attempts", "1"]) == 1
+    assert main(["status", path]) == 0
+    output = capsys.readouterr().out
+    assert "queued 2 jobs" in output
+    assert "done 1, failed 1" in output
+    assert "TypeError: expected a string, got dict" in output
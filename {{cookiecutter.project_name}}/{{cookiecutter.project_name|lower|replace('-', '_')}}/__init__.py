@@ -0,0 +1,39 @@
+{% if cookiecutter.project_type == 'package' -%}
+"""{{cookiecutter.project_description}}
+
+Public names are exported lazily: a submodule is imported the first time one of
+its names is accessed, so `import {{cookiecutter.project_name|lower|replace('-', '_')}}` stays fast however heavy the
+submodules get. To export a new name, add it to `_EXPORTS`, `__all__` and the
+`TYPE_CHECKING` block (which lets type checkers and IDEs see it).
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from {{cookiecutter.project_name|lower|replace('-', '_')}}.example import greet
+
+__all__ = ["greet"]
+
+# Public name -> submodule that defines it.
+_EXPORTS = {
+    "greet": "{{cookiecutter.project_name|lower|replace('-', '_')}}.example",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module), name)
+    # Cache the value so later lookups skip __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+{% endif %}
\ No newline at end of file
@@ -0,0 +1,287 @@
+"""Asynchronous HTTP service for {{cookiecutter.project_name}}.
+
+The service runs on aiohttp and, when installed, the uvloop event loop. Calls
+to the upstream service share one `aiohttp.ClientSession` whose connection pool
+keeps connections alive between requests, so a request does not pay for a new
+TCP handshake. Each request is timed and logged as one JSON line by the
+`{{cookiecutter.project_name|lower|replace('-', '_')}}.access` logger, and responses carry a `Server-Timing` header.
+
+On SIGTERM or SIGINT the server stops accepting connections, lets in-flight
+requests finish for up to `shutdown_timeout` seconds, then closes the pool.
+
+Settings come from `{{cookiecutter.project_name|upper|replace('-', '_')}}_*` environment variables (see `Settings`)
+and command-line options.
+
+Usage:
+    {{cookiecutter.project_name}} [--host HOST] [--port PORT] [--upstream URL | --stub-upstream]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import dataclasses
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import signal
+import sys
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+
+ENV_PREFIX = "{{cookiecutter.project_name|upper|replace('-', '_')}}"
+
+LOG = logging.getLogger("{{cookiecutter.project_name|lower|replace('-', '_')}}")
+ACCESS_LOG = logging.getLogger("{{cookiecutter.project_name|lower|replace('-', '_')}}.access")
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+@dataclasses.dataclass(frozen=True)
+class Settings:
+    """Service configuration; each field can be set with `{{cookiecutter.project_name|upper|replace('-', '_')}}_<FIELD>` in the environment."""
+
+    host: str = "127.0.0.1"
+    port: int = 8080
+    upstream_url: str = "http://127.0.0.1:8081"
+    # Maximum number of open connections to the upstream; requests beyond it wait for a free one.
+    pool_size: int = 100
+    upstream_timeout: float = 5.0
+    shutdown_timeout: float = 10.0
+    # "auto" uses uvloop when it is installed, "uvloop" requires it, "asyncio" never uses it.
+    loop: str = "auto"
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ, **overrides: Any) -> Settings:
+        """Read the settings from the environment; keyword arguments that are not None take precedence."""
+        defaults = cls()
+        values: dict[str, Any] = {}
+        for field in dataclasses.fields(cls):
+            raw = environ.get(f"{ENV_PREFIX}_{field.name.upper()}")
+            if raw is not None:
+                values[field.name] = type(getattr(defaults, field.name))(raw)
+        values.update({name: value for name, value in overrides.items() if value is not None})
+        return cls(**values)
+
+
+SETTINGS = web.AppKey("settings", Settings)
+UPSTREAM = web.AppKey("upstream", aiohttp.ClientSession)
+
+
+# ============================================================================
+# Middleware and handlers
+# ============================================================================
+
+
+@web.middleware
+async def access_timing(request: web.Request, handler: Handler) -> web.StreamResponse:
+    """Time each request, add a `Server-Timing` header and log one structured access record."""
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await handler(request)
+    except web.HTTPException as e:
+        status = e.status
+        raise
+    else:
+        status = response.status
+        if not response.prepared:
+            response.headers["Server-Timing"] = f"app;dur={(time.perf_counter() - start) * 1000:.2f}"
+        return response
+    finally:
+        if ACCESS_LOG.isEnabledFor(logging.INFO):
+            access = {
+                "method": request.method,
+                "path": request.path,
+                "status": status,
+                "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+                "remote": request.remote,
+            }
+            ACCESS_LOG.info("%(method)s %(path)s %(status)s", access, extra={"access": access})
+
+
+async def health(request: web.Request) -> web.Response:
+    """Liveness check."""
+    return web.json_response({"status": "ok"})
+
+
+async def hello(request: web.Request) -> web.Response:
+    """Greet someone; answered locally, without the upstream."""
+    name = request.query.get("name", "World")
+    return web.json_response({"greeting": f"Hello, {name}!"})
+
+
+async def get_item(request: web.Request) -> web.Response:
+    """Fetch an item from the upstream through the pooled session."""
+    key = request.match_info["key"]
+    try:
+        async with request.app[UPSTREAM].get(f"/items/{key}") as upstream:
+            if upstream.status == 404:
+                raise web.HTTPNotFound(text=json.dumps({"error": f"no item {key!r}"}), content_type="application/json")
+            upstream.raise_for_status()
+            item = await upstream.json()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:  # noqa: UP041 | not the builtin before Python 3.11
+        LOG.warning("upstream request for %r failed: %r", key, e)
+        body = json.dumps({"error": "upstream unavailable"})
+        raise web.HTTPBadGateway(text=body, content_type="application/json") from e
+    return web.json_response({"key": key, "item": item})
+
+
+async def upstream_session(app: web.Application) -> AsyncIterator[None]:
+    """Open the pooled upstream session on startup and close it after the last request."""
+    settings = app[SETTINGS]
+    connector = aiohttp.TCPConnector(limit=settings.pool_size, limit_per_host=settings.pool_size, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(
+        settings.upstream_url,
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=settings.upstream_timeout),
+    ) as session:
+        app[UPSTREAM] = session
+        yield
+
+
+def create_app(settings: Settings | None = None) -> web.Application:
+    """Create the application; the upstream session is opened when it starts."""
+    app = web.Application(middlewares=[access_timing])
+    app[SETTINGS] = settings or Settings()
+    app.cleanup_ctx.append(upstream_session)
+    app.router.add_get("/healthz", health)
+    app.router.add_get("/hello", hello)
+    app.router.add_get("/items/{key}", get_item)
+    return app
+
+
+# ============================================================================
+# Serving
+# ============================================================================
+
+
+async def serve(
+    settings: Settings,
+    *,
+    stop: asyncio.Event | None = None,
+    ready: Callable[[int], None] | None = None,
+) -> None:
+    """Serve until `stop` is set or the process receives SIGTERM or SIGINT, then shut down gracefully.
+
+    Args:
+        settings: Service configuration; port 0 picks a free port.
+        stop: Event that ends serving; a new one is created if not given.
+        ready: Called with the bound port once the server accepts connections.
+    """
+    stop = stop or asyncio.Event()
+    loop = asyncio.get_running_loop()
+    runner = web.AppRunner(create_app(settings), access_log=None, shutdown_timeout=settings.shutdown_timeout)
+    await runner.setup()
+    signals = []
+    try:
+        site = web.TCPSite(runner, settings.host, settings.port, backlog=1024)
+        await site.start()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            with contextlib.suppress(NotImplementedError, RuntimeError):  # Windows, or not the main thread.
+                loop.add_signal_handler(sig, stop.set)
+                signals.append(sig)
+        port = runner.addresses[0][1]
+        LOG.info("listening on http://%s:%d, upstream %s", settings.host, port, settings.upstream_url)
+        if ready is not None:
+            ready(port)
+        await stop.wait()
+        LOG.info("shutting down; waiting up to %.0fs for in-flight requests", settings.shutdown_timeout)
+    finally:
+        for sig in signals:
+            loop.remove_signal_handler(sig)
+        # Closes the listening socket, waits for running handlers, then closes the upstream pool.
+        await runner.cleanup()
+
+
+def new_event_loop(kind: str = "auto") -> asyncio.AbstractEventLoop:
+    """Create an event loop: uvloop if `kind` is "uvloop", or "auto" and uvloop is installed.
+
+    Raises:
+        ImportError: `kind` is "uvloop" but uvloop is not installed.
+    """
+    if kind != "asyncio":
+        try:
+            import uvloop
+        except ImportError:
+            if kind == "uvloop":
+                raise
+        else:
+            return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects, merging the `access` fields of access records."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(getattr(record, "access", {}))
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+
+def configure_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """Log JSON lines to stderr from a background thread, so that writes never block the event loop.
+
+    Returns the started listener; call `stop()` on it to flush the remaining records.
+    """
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    stream = logging.StreamHandler()
+    stream.setFormatter(JsonFormatter())
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(records)]
+    root.setLevel(level)
+    listener = logging.handlers.QueueListener(records, stream)
+    listener.start()
+    return listener
+
+
+async def _serve_with_stub(settings: Settings) -> None:
+    from {{cookiecutter.project_name|lower|replace('-', '_')}}.stub import start_stub
+
+    stub, url = await start_stub()
+    try:
+        await serve(dataclasses.replace(settings, upstream_url=url))
+    finally:
+        await stub.cleanup()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="{{cookiecutter.project_description}}")
+    parser.add_argument("--host", help="interface to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, help="port to listen on, 0 for any free port (default: 8080)")
+    upstream = parser.add_mutually_exclusive_group()
+    upstream.add_argument("--upstream", dest="upstream_url", help="base URL of the upstream service")
+    upstream.add_argument("--stub-upstream", action="store_true", help="start a local stub upstream in-process")
+    parser.add_argument("--no-access-log", action="store_true", help="do not log a line per request")
+    args = parser.parse_args(argv)
+
+    settings = Settings.from_env(host=args.host, port=args.port, upstream_url=args.upstream_url)
+    listener = configure_logging()
+    if args.no_access_log:
+        ACCESS_LOG.setLevel(logging.WARNING)
+    loop = new_event_loop(settings.loop)
+    try:
+        loop.run_until_complete(_serve_with_stub(settings) if args.stub_upstream else serve(settings))
+    finally:
+        loop.close()
+        listener.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
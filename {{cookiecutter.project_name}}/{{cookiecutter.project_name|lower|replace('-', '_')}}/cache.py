@@ -0,0 +1,353 @@
+"""Thread-safe in-process cache with LRU eviction, size bounds and expiry.
+
+Unlike `functools.lru_cache`, a `Cache` can be bounded by the approximate
+memory of its values as well as by the number of entries, lets entries expire
+after a time-to-live, and computes a missing value only once however many
+threads ask for it at the same time ("single flight"). Unhashable arguments
+such as lists and dicts are accepted by the `cached` decorator.
+
+Example:
+    >>> @cached(maxsize=256, ttl=60)
+    ... def square(x: int) -> int:
+    ...     return x * x
+    >>> square(4), square(4)
+    (16, 16)
+    >>> square.cache_info().hits
+    1
+    >>> square.invalidate(4)
+    True
+"""
+
+from __future__ import annotations
+
+import functools
+import sys
+import threading
+import time
+import types
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, Generic, NamedTuple, TypeVar
+
+R = TypeVar("R")
+
+_MISSING = object()
+# Separates positional from keyword arguments in a key.
+_KWARGS_MARK = object()
+# Single arguments of these types are their own key, as in `functools.lru_cache`.
+_FAST_TYPES = frozenset({int, str})
+# Containers whose items `approx_size` and `_freeze` follow. Named tuples rather than `list | tuple`,
+# which `isinstance` only accepts from Python 3.10.
+_SEQUENCES = (list, tuple)
+_SETS = (set, frozenset)
+_CONTAINERS = (*_SEQUENCES, *_SETS)
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cache.
+
+    `hits` includes calls that waited for a value another thread was computing;
+    `expired` counts entries dropped because their time-to-live had passed.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expired: int
+    size: int
+    nbytes: int
+
+
+class _Flight:
+    """A value being computed by one thread while others wait for it."""
+
+    __slots__ = ("error", "lock", "stale", "value")
+
+    def __init__(self) -> None:
+        # Held by the computing thread until the result is in; waiting threads block on it.
+        # A bare lock is much cheaper to create than an Event, and a flight is created on every miss.
+        self.lock = threading.Lock()
+        self.lock.acquire()
+        self.value: Any = None
+        self.error: BaseException | None = None
+        # Set when the key is invalidated during the computation: the result is returned but not stored.
+        self.stale = False
+
+
+def approx_size(obj: Any) -> int:
+    """Estimate the memory held by `obj` and the containers, strings and buffers it references.
+
+    Objects exposing `nbytes` (NumPy arrays, memoryviews, ...) count their buffer.
+    Each object is counted once, however often it is referenced.
+
+    Example:
+        >>> approx_size(b"x" * 1000) > 1000
+        True
+    """
+    seen: set[int] = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        nbytes = getattr(item, "nbytes", None)
+        total += nbytes if isinstance(nbytes, int) else sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, _CONTAINERS):
+            stack.extend(item)
+    return total
+
+
+class Cache:
+    """Thread-safe mapping with least-recently-used eviction and optional expiry.
+
+    Args:
+        maxsize: Maximum number of entries, or None for no limit.
+        maxbytes: Maximum total of `sizeof` over all values, or None for no limit.
+            A single value larger than this is returned but never stored.
+        ttl: Default time-to-live of entries in seconds, or None to keep them until evicted.
+        sizeof: Estimates the size of a value; only called when `maxbytes` is set.
+        timer: Monotonic clock used for expiry.
+    """
+
+    def __init__(
+        self,
+        maxsize: int | None = 128,
+        maxbytes: int | None = None,
+        ttl: float | None = None,
+        sizeof: Callable[[Any], int] = approx_size,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.ttl = ttl
+        self._sizeof = sizeof
+        self._timer = timer
+        # key -> (value, expiry time or None, size)
+        self._data: OrderedDict[Hashable, tuple[Any, float | None, int]] = OrderedDict()
+        self._flights: dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        self._nbytes = 0
+        self._hits = self._misses = self._evictions = self._expired = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._lookup(key) is not _MISSING
+
+    def _lookup(self, key: Hashable) -> Any:
+        """Return the live value for `key` and mark it as recently used, or _MISSING. Needs the lock."""
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+        if entry[1] is not None and entry[1] <= self._timer():
+            self._remove(key)
+            self._expired += 1
+            return _MISSING
+        self._data.move_to_end(key)
+        return entry[0]
+
+    def _remove(self, key: Hashable) -> None:
+        self._nbytes -= self._data.pop(key)[2]
+
+    def _store(self, key: Hashable, value: Any, ttl: float | None, nbytes: int) -> None:
+        """Insert an entry and evict down to the bounds. Needs the lock."""
+        if key in self._data:
+            self._remove(key)
+        if self.maxbytes is not None and nbytes > self.maxbytes:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        self._data[key] = (value, None if ttl is None else self._timer() + ttl, nbytes)
+        self._nbytes += nbytes
+        while (self.maxsize is not None and len(self._data) > self.maxsize) or (
+            self.maxbytes is not None and self._nbytes > self.maxbytes
+        ):
+            self._nbytes -= self._data.popitem(last=False)[1][2]
+            self._evictions += 1
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for `key`, or `default` if it is missing or expired."""
+        with self._lock:
+            value = self._lookup(key)
+            if value is _MISSING:
+                self._misses += 1
+                return default
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Store `value`, evicting least recently used entries to stay within the bounds.
+
+        Args:
+            key: Hashable key.
+            value: Value to store.
+            ttl: Time-to-live in seconds; defaults to the cache's `ttl`.
+        """
+        nbytes = self._sizeof(value) if self.maxbytes is not None else 0
+        with self._lock:
+            self._store(key, value, ttl, nbytes)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], R], ttl: float | None = None) -> R:
+        """Return the value for `key`, calling `compute` to create and store it if it is missing.
+
+        Concurrent calls for the same missing key run `compute` once: the other
+        threads wait for its result, or re-raise its exception. Exceptions are not cached.
+        """
+        return self._get_or_call(key, compute, (), {}, ttl)
+
+    def _get_or_call(
+        self, key: Hashable, func: Callable[..., R], args: tuple[Any, ...], kwargs: dict[str, Any], ttl: float | None
+    ) -> R:
+        with self._lock:
+            entry = self._data.get(key)
+            # The hit path, inlined: this is the per-call overhead of a cached function.
+            if entry is not None and (entry[1] is None or entry[1] > self._timer()):
+                self._data.move_to_end(key)
+                self._hits += 1
+                return entry[0]  # type: ignore[no-any-return]
+            if entry is not None:
+                self._lookup(key)  # Drops the expired entry.
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                self._misses += 1
+                leader = True
+            else:
+                self._hits += 1
+                leader = False
+
+        if not leader:
+            with flight.lock:  # Released once the leader is done.
+                pass
+            if flight.error is not None:
+                raise flight.error
+            return flight.value  # type: ignore[no-any-return]
+
+        try:
+            flight.value = value = func(*args, **kwargs)
+            nbytes = self._sizeof(value) if self.maxbytes is not None else 0
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                del self._flights[key]
+            raise
+        else:
+            with self._lock:
+                del self._flights[key]
+                if not flight.stale:
+                    self._store(key, value, ttl, nbytes)
+            return value
+        finally:
+            flight.lock.release()
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Remove `key`. A computation for it that is still running will not be stored.
+
+        Returns:
+            Whether an entry was removed.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                flight.stale = True
+            if key not in self._data:
+                return False
+            self._remove(key)
+            return True
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            for flight in self._flights.values():
+                flight.stale = True
+            self._data.clear()
+            self._nbytes = 0
+            self._hits = self._misses = self._evictions = self._expired = 0
+
+    def info(self) -> CacheInfo:
+        """Return the current statistics."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self._expired, len(self._data), self._nbytes)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert lists, dicts and sets, recursively, into hashable equivalents."""
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((_freeze(k), _freeze(v)) for k, v in value.items())))
+    if isinstance(value, _SEQUENCES):
+        return (type(value), tuple(_freeze(item) for item in value))
+    if isinstance(value, _SETS):
+        return (frozenset, frozenset(_freeze(item) for item in value))
+    hash(value)  # Raises TypeError for other unhashable types.
+    return value  # type: ignore[no-any-return]
+
+
+def make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+    """Build a cache key from call arguments; keyword order does not matter.
+
+    Unhashable lists, dicts and sets are converted to hashable equivalents.
+
+    Raises:
+        TypeError: An argument is unhashable and not one of the convertible containers.
+    """
+    if not kwargs and len(args) == 1 and type(args[0]) in _FAST_TYPES:
+        return args[0]  # type: ignore[no-any-return]
+    key: tuple[Any, ...] = (*args, _KWARGS_MARK, *sorted(kwargs.items())) if kwargs else args
+    try:
+        hash(key)
+    except TypeError:
+        return _freeze(key)
+    return key
+
+
+class CachedFunction(Generic[R]):
+    """A function whose results are stored in a `Cache`; created by `cached`."""
+
+    def __init__(self, func: Callable[..., R], cache: Cache) -> None:
+        self.__wrapped__ = func
+        self.cache = cache
+        functools.update_wrapper(self, func)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> R:
+        return self.cache._get_or_call(make_key(args, kwargs), self.__wrapped__, args, kwargs, None)
+
+    def __get__(self, instance: object, owner: type | None = None) -> Any:
+        # Bind like a plain function, so that methods can be cached too; `self` becomes part of the key.
+        return self if instance is None else types.MethodType(self, instance)
+
+    def cache_info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        return self.cache.info()
+
+    def cache_clear(self) -> None:
+        """Remove all cached results."""
+        self.cache.clear()
+
+    def invalidate(self, *args: Any, **kwargs: Any) -> bool:
+        """Remove the result cached for these arguments; returns whether there was one."""
+        return self.cache.invalidate(make_key(args, kwargs))
+
+
+def cached(
+    maxsize: int | None = 128,
+    *,
+    maxbytes: int | None = None,
+    ttl: float | None = None,
+    sizeof: Callable[[Any], int] = approx_size,
+) -> Callable[[Callable[..., R]], CachedFunction[R]]:
+    """Cache the results of a function (see `Cache` for the arguments).
+
+    The decorated function gets `cache_info()`, `cache_clear()` and
+    `invalidate(*args, **kwargs)`, and its `Cache` as `.cache`.
+    """
+
+    def decorator(func: Callable[..., R]) -> CachedFunction[R]:
+        return CachedFunction(func, Cache(maxsize, maxbytes, ttl, sizeof))
+
+    return decorator
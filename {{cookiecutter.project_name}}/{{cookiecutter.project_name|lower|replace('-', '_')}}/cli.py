@@ -3,26 +3,76 @@
 from __future__ import annotations
 
 import typer
-from rich.console import Console
+
+from {{cookiecutter.project_name|lower|replace('-', '_')}} import completion, metrics, plugins
+from {{cookiecutter.project_name|lower|replace('-', '_')}}.output import Output, OutputFormat, make_output
 
 app = typer.Typer(
     name="{{cookiecutter.project_name}}",
     help="{{cookiecutter.project_description}}",
     add_completion=False,
+    cls=plugins.PluginGroup,
+)
+output_option = typer.Option(
+    OutputFormat.rich, "--output", "-o", help="Output format; json, ndjson and plain stream without Rich"
 )
-console = Console()
+
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    output: OutputFormat = output_option,
+    metrics_out: str = typer.Option(
+        "", "--metrics-out", help="Write command timings to this file (.json for JSON, Prometheus text otherwise)"
+    ),
+) -> None:
+    """{{cookiecutter.project_description}}"""
+    ctx.obj = make_output(output)
+    ctx.call_on_close(ctx.obj.close)
+    if metrics_out:
+        metrics.enable()
+        ctx.call_on_close(lambda: metrics.export(metrics_out))
 
 
 @app.command()
-def hello(name: str = typer.Option("World", help="Name to greet")) -> None:
+@metrics.timed("cli_hello_seconds")
+def hello(ctx: typer.Context, name: str = typer.Option("World", help="Name to greet")) -> None:
     """Say hello to someone."""
-    console.print(f"[bold green]Hello, {name}![/bold green]")
+    out: Output = ctx.obj
+    out.emit({"greeting": f"Hello, {name}!"}, markup=f"[bold green]Hello, {name}![/bold green]")
 
 
 @app.command()
-def version() -> None:
+@metrics.timed("cli_version_seconds")
+def version(ctx: typer.Context) -> None:
     """Show the application version."""
-    console.print("[bold blue]{{cookiecutter.project_name}}[/bold blue] version 0.0.1")
+    out: Output = ctx.obj
+    out.emit(
+        {"name": "{{cookiecutter.project_name}}", "version": "0.0.1"},
+        markup="[bold blue]{{cookiecutter.project_name}}[/bold blue] version 0.0.1",
+    )
+
+
+@app.command("plugins")
+@metrics.timed("cli_plugins_seconds")
+def list_plugins(
+    ctx: typer.Context,
+    refresh: bool = typer.Option(False, "--refresh", help="Rebuild the plugin index before listing"),
+) -> None:
+    """List the commands provided by installed plugins."""
+    out: Output = ctx.obj
+    for name, entry in sorted(plugins.load_index(refresh=refresh)["commands"].items()):
+        out.emit(
+            {"command": name, "plugin": entry["plugin"], "help": entry["help"]},
+            markup=f"[bold]{name}[/bold]  {entry['help']}  [dim]({entry['plugin']})[/dim]",
+        )
+
+
+@app.command("__complete", hidden=True)
+def complete(command_path: str, option: str) -> None:
+    """Print completion values for an option; called by the generated shell completion scripts."""
+    for value in completion.complete_values(app, command_path, option):
+        typer.echo(value)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,340 @@
+"""Static shell completion scripts for {{cookiecutter.project_name}}.
+
+The scripts are generated from the command tree once (`make completions`, also
+run by `make install`) and answer subcommand and option completion without
+starting Python. Only options with a custom completion callback call back into
+the app, through the hidden `__complete` command, and their values are cached
+on disk for `{{cookiecutter.project_name|upper|replace('-', '_')}}_COMPLETION_TTL` minutes (default 1).
+
+Usage:
+    python -m {{cookiecutter.project_name|lower|replace('-', '_')}}.completion [OUTPUT_DIR]
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import typer
+
+PROG = "{{cookiecutter.project_name}}"
+{% raw %}
+
+class CommandSpec(NamedTuple):
+    """Completion data for one command path ("" is the root command)."""
+
+    path: str
+    subcommands: list[tuple[str, str]]
+    options: list[tuple[str, str]]
+    # Value-taking option flag -> ("choice", values) | ("file", ()) | ("dynamic", ()) | ("none", ())
+    values: dict[str, tuple[str, tuple[str, ...]]]
+    arguments: list[str]
+
+
+# Commands and parameters are inspected by attribute rather than by class, so this works
+# with both click and the click copy that newer typer releases vendor.
+
+
+def _value_kind(param: Any) -> tuple[str, tuple[str, ...]]:
+    # click keeps user-supplied completion callbacks here; those need the app at completion time.
+    if getattr(param, "_custom_shell_complete", None) is not None:
+        return ("dynamic", ())
+    if param.type.name == "choice":
+        return ("choice", tuple(str(choice) for choice in param.type.choices))
+    if param.type.name in ("path", "filename"):
+        return ("file", ())
+    return ("none", ())
+
+
+def collect(command: Any) -> list[CommandSpec]:
+    """Walk a click command tree and return the completion data of every command path."""
+    specs: list[CommandSpec] = []
+
+    def visit(cmd: Any, path: str) -> None:
+        spec = CommandSpec(path, [], [("--help", "Show this message and exit.")], {}, [])
+        specs.append(spec)
+        for param in cmd.params:
+            if getattr(param, "hidden", False):
+                continue
+            if param.param_type_name == "option":
+                spec.options.extend((flag, param.help or "") for flag in [*param.opts, *param.secondary_opts])
+                if not param.is_flag and not param.count:
+                    kind = _value_kind(param)
+                    spec.values.update(dict.fromkeys(param.opts, kind))
+            elif param.type.name == "choice":
+                spec.arguments.extend(str(choice) for choice in param.type.choices)
+        if hasattr(cmd, "commands"):
+            for name, sub in sorted(cmd.commands.items()):
+                if sub.hidden:
+                    continue
+                spec.subcommands.append((name, sub.get_short_help_str()))
+                visit(sub, f"{path} {name}".strip())
+
+    visit(command, "")
+    return specs
+
+
+def complete_values(app: typer.Typer, path: str, option: str) -> list[str]:
+    """Run the completion callback of `option` on the command at `path`."""
+    command: Any = typer.main.get_command(app)
+    ctx = command.make_context(PROG, [], resilient_parsing=True)
+    for name in path.split():
+        if name not in getattr(command, "commands", {}):
+            return []
+        command = command.commands[name]
+        ctx = command.make_context(name, [], parent=ctx, resilient_parsing=True)
+    for param in command.params:
+        if option in param.opts:
+            return [str(item.value) for item in param.shell_complete(ctx, "")]
+    return []
+
+
+def _func_name() -> str:
+    return "_" + PROG.replace("-", "_")
+
+
+def _ttl_var() -> str:
+    return PROG.upper().replace("-", "_") + "_COMPLETION_TTL"
+
+
+def _words(spec: CommandSpec) -> str:
+    return " ".join([*(name for name, _ in spec.subcommands), *spec.arguments, *(flag for flag, _ in spec.options)])
+
+
+def _transitions(specs: list[CommandSpec]) -> tuple[list[str], list[str]]:
+    """Return `path:word` patterns that enter a subcommand and those that consume an option value."""
+    enter = [f"{spec.path}:{name}" for spec in specs for name, _ in spec.subcommands]
+    skip = [f"{spec.path}:{flag}" for spec in specs for flag in spec.values]
+    return enter, skip
+
+
+def _posix_cached_values() -> str:
+    """Shell function shared by bash and zsh that caches `__complete` output on disk."""
+    fn = _func_name()
+    return f"""{fn}_cached_values() {{
+    local dir="${{XDG_CACHE_HOME:-$HOME/.cache}}/{PROG}/completion"
+    local file="$dir/$(printf '%s_%s' "$1" "$2" | tr -c 'A-Za-z0-9_-' '_')"
+    if [ -z "$(find "$file" -mmin -"${{{_ttl_var()}:-1}}" 2>/dev/null)" ]; then
+        mkdir -p "$dir" && {PROG} __complete -- "$1" "$2" >"$file" 2>/dev/null || rm -f "$file"
+    fi
+    cat "$file" 2>/dev/null
+}}
+"""
+
+
+def _case_patterns(patterns: list[str]) -> str:
+    # An impossible pattern keeps the case arm valid when there is nothing to match.
+    return "|".join(f'"{p}"' for p in patterns) or '"::"'
+
+
+def _posix_path_loop(specs: list[CommandSpec], words: str, start: str, end: str) -> str:
+    """Loop that resolves the current subcommand path into `cmdpath`, skipping option values."""
+    enter, skip = _transitions(specs)
+    return f"""    local cmdpath="" word i skip=0
+    for ((i = {start}; i < {end}; i++)); do
+        word="${{{words}[i]}}"
+        if [ "$skip" = 1 ]; then
+            skip=0
+            continue
+        fi
+        case "$cmdpath:$word" in
+            {_case_patterns(enter)}) cmdpath="${{cmdpath:+$cmdpath }}$word" ;;
+            {_case_patterns(skip)}) skip=1 ;;
+        esac
+    done
+"""
+
+
+def bash_script(specs: list[CommandSpec]) -> str:
+    """Render a bash completion script."""
+    fn = _func_name()
+    loop = _posix_path_loop(specs, "COMP_WORDS", "1", "COMP_CWORD")
+    value_arms = []
+    for spec in specs:
+        for flag, (kind, choices) in spec.values.items():
+            if kind == "choice":
+                reply = f'COMPREPLY=($(compgen -W "{" ".join(choices)}" -- "$cur"))'
+            elif kind == "file":
+                reply = 'COMPREPLY=($(compgen -f -- "$cur"))'
+            elif kind == "dynamic":
+                reply = f'COMPREPLY=($(compgen -W "$({fn}_cached_values "{spec.path}" "{flag}")" -- "$cur"))'
+            else:
+                reply = "COMPREPLY=()"
+            value_arms.append(f'        "{spec.path}:{flag}") {reply}; return ;;')
+    word_arms = [f'        "{spec.path}") words="{_words(spec)}" ;;' for spec in specs]
+    return (
+        f"# bash completion for {PROG}; generated by `make completions`, do not edit.\n"
+        + _posix_cached_values()
+        + f"""
+{fn}() {{
+    local cur="${{COMP_WORDS[COMP_CWORD]}}" prev="${{COMP_WORDS[COMP_CWORD-1]}}" words=""
+{loop}    case "$cmdpath:$prev" in
+{chr(10).join(value_arms)}
+    esac
+    case "$cmdpath" in
+{chr(10).join(word_arms)}
+    esac
+    COMPREPLY=($(compgen -W "$words" -- "$cur"))
+}}
+
+complete -F {fn} {PROG}
+"""
+    )
+
+
+def _zsh_item(name: str, help_text: str) -> str:
+    text = f"{name.replace(':', chr(92) + ':')}:{help_text.replace(':', chr(92) + ':')}"
+    return "'" + text.replace("'", "'\\''") + "'"
+
+
+def zsh_script(specs: list[CommandSpec]) -> str:
+    """Render a zsh completion script (install it as `_<prog>` on `$fpath`)."""
+    fn = _func_name()
+    # zsh arrays are 1-based: words[1] is the program name.
+    loop = _posix_path_loop(specs, "words", "2", "CURRENT")
+    value_arms = []
+    for spec in specs:
+        for flag, (kind, choices) in spec.values.items():
+            if kind == "choice":
+                reply = f"compadd -- {' '.join(choices)}"
+            elif kind == "file":
+                reply = "_files"
+            elif kind == "dynamic":
+                reply = f'compadd -- ${{(f)"$({fn}_cached_values "{spec.path}" "{flag}")"}}'
+            else:
+                reply = ":"
+            value_arms.append(f'        "{spec.path}:{flag}") {reply}; return ;;')
+    word_arms = []
+    for spec in specs:
+        commands = " ".join(_zsh_item(name, help_text) for name, help_text in spec.subcommands)
+        options = " ".join(_zsh_item(flag, help_text) for flag, help_text in spec.options)
+        word_arms.append(
+            f'        "{spec.path}")\n'
+            f"            commands=({commands})\n"
+            f"            options=({options})\n"
+            f"            arguments=({' '.join(spec.arguments)})\n"
+            "            ;;"
+        )
+    return (
+        f"#compdef {PROG}\n# zsh completion for {PROG}; generated by `make completions`, do not edit.\n"
+        + _posix_cached_values()
+        + f"""
+{fn}() {{
+    local prev="${{words[CURRENT-1]}}"
+    local -a commands options arguments
+{loop}    case "$cmdpath:$prev" in
+{chr(10).join(value_arms)}
+    esac
+    case "$cmdpath" in
+{chr(10).join(word_arms)}
+    esac
+    (( $#commands )) && _describe -t commands 'command' commands
+    (( $#arguments )) && compadd -- $arguments
+    _describe -t options 'option' options
+}}
+
+compdef {fn} {PROG}
+"""
+    )
+
+
+def _fish_quote(text: str) -> str:
+    return "'" + text.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def _fish_option(spec: CommandSpec, flag: str, fn: str) -> str:
+    arg = f"-l {flag[2:]}" if flag.startswith("--") else f"-s {flag[1:]}"
+    kind, choices = spec.values.get(flag, ("flag", ()))
+    if kind == "choice":
+        return f"{arg} -x -a {_fish_quote(' '.join(choices))}"
+    if kind == "file":
+        return f"{arg} -r -F"
+    if kind == "dynamic":
+        return f"{arg} -x -a {_fish_quote(f'({fn}_cached_values {spec.path!r} {flag})')}"
+    if kind == "none":
+        return f"{arg} -x"
+    return arg
+
+
+def fish_script(specs: list[CommandSpec]) -> str:
+    """Render a fish completion script."""
+    fn = "_" + _func_name()
+    enter, skip = _transitions(specs)
+    lines = [
+        f"# fish completion for {PROG}; generated by `make completions`, do not edit.",
+        f"function {fn}_path",
+        '    set -l cmdpath ""',
+        "    set -l skip 0",
+        "    for word in (commandline -opc)[2..-1]",
+        "        if test $skip = 1",
+        "            set skip 0",
+        "            continue",
+        "        end",
+        '        switch "$cmdpath:$word"',
+    ]
+    if enter:
+        lines += [
+            f"            case {' '.join(_fish_quote(p) for p in enter)}",
+            '                set cmdpath (string trim -- "$cmdpath $word")',
+        ]
+    if skip:
+        lines += [f"            case {' '.join(_fish_quote(p) for p in skip)}", "                set skip 1"]
+    lines += [
+        "        end",
+        "    end",
+        # Brackets keep the root path a non-empty word for `test`.
+        '    echo "[$cmdpath]"',
+        "end",
+        "",
+        f"function {fn}_cached_values",
+        "    set -l dir $HOME/.cache",
+        "    set -q XDG_CACHE_HOME; and set dir $XDG_CACHE_HOME",
+        f"    set dir $dir/{PROG}/completion",
+        "    set -l ttl 1",
+        f"    set -q {_ttl_var()}; and set ttl ${_ttl_var()}",
+        "    set -l file $dir/(printf '%s_%s' \"$argv[1]\" \"$argv[2]\" | tr -c 'A-Za-z0-9_-' '_')",
+        "    if test (count (find $file -mmin -$ttl 2>/dev/null)) -eq 0",
+        f'        mkdir -p $dir; and {PROG} __complete -- "$argv[1]" "$argv[2]" >$file 2>/dev/null; or rm -f $file',
+        "    end",
+        "    cat $file 2>/dev/null",
+        "end",
+        "",
+        f"complete -c {PROG} -f",
+    ]
+    for spec in specs:
+        cond = "-n " + _fish_quote(f'test ({fn}_path) = "[{spec.path}]"')
+        for name, help_text in spec.subcommands:
+            lines.append(f"complete -c {PROG} {cond} -a {name} -d {_fish_quote(help_text)}")
+        if spec.arguments:
+            lines.append(f"complete -c {PROG} {cond} -a {_fish_quote(' '.join(spec.arguments))}")
+        for flag, help_text in spec.options:
+            lines.append(f"complete -c {PROG} {cond} {_fish_option(spec, flag, fn)} -d {_fish_quote(help_text)}")
+    return "\n".join(lines) + "\n"
+
+
+SCRIPTS = {
+    f"{PROG}.bash": bash_script,
+    f"_{PROG}": zsh_script,
+    f"{PROG}.fish": fish_script,
+}
+
+
+def write_scripts(app: typer.Typer, output_dir: str | Path) -> list[Path]:
+    """Write bash, zsh and fish completion scripts for `app` into `output_dir`."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    specs = collect(typer.main.get_command(app))
+    written = []
+    for filename, render in SCRIPTS.items():
+        path = output_dir / filename
+        path.write_text(render(specs))
+        written.append(path)
+    return written
+{% endraw %}
+
+if __name__ == "__main__":
+    from {{cookiecutter.project_name|lower|replace('-', '_')}}.cli import app
+
+    for script in write_scripts(app, sys.argv[1] if len(sys.argv) > 1 else "build/completions"):
+        print(script)
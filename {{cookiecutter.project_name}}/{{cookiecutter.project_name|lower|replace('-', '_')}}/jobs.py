@@ -0,0 +1,230 @@
+"""Durable local job queue in a SQLite file.
+
+Each job is a row holding a JSON payload, its status, the number of attempts
+and, once it is done, its JSON result. The file survives crashes and restarts,
+so it also serves as the checkpoint of a run:
+
+- `claim` hands out a batch of pending jobs in insertion order and leases them
+  to the caller for `lease` seconds.
+- `complete` stores a batch of results in one transaction; completed jobs are
+  never handed out again.
+- `fail` schedules a retry after an exponential backoff, or marks the job as
+  failed once it has used up its attempts.
+- Jobs whose lease has expired, because the process that claimed them died, are
+  claimed again, and `release` returns jobs that were claimed but not started.
+
+The database runs in WAL mode, so `counts` and `results` can read it while a
+run writes to it, and several processes can claim jobs from the same file.
+
+Example:
+    >>> queue = JobQueue(":memory:")
+    >>> queue.put(["a", "bb"])
+    2
+    >>> jobs = queue.claim(10)
+    >>> queue.complete([(job.id, len(job.payload)) for job in jobs])
+    >>> list(queue.results())
+    [('a', 1), ('bb', 2)]
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import random
+import sqlite3
+import time
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, NamedTuple
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# `available_at` is the earliest time a pending job may run, or the lease expiry of a running one.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_by_status ON jobs (status, id);
+"""
+
+
+class Job(NamedTuple):
+    """A claimed job; `attempts` includes the current one, and `error` is that of the last failed attempt."""
+
+    id: int
+    payload: Any
+    attempts: int
+    error: str | None = None
+
+
+def backoff_delay(
+    attempts: int, base: float = 1.0, cap: float = 60.0, *, jitter: Callable[[], float] = random.random
+) -> float:
+    """Return the seconds to wait before the next attempt, after `attempts` failed ones.
+
+    The delay doubles with each attempt up to `cap`, and is spread over its upper
+    half at random so that jobs failing together do not all retry together.
+
+    Example:
+        >>> [backoff_delay(n, jitter=lambda: 1.0) for n in (1, 2, 3)]
+        [1.0, 2.0, 4.0]
+    """
+    delay = min(cap, base * 2.0 ** max(attempts - 1, 0))
+    return delay * (0.5 + jitter() / 2)
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"))
+
+
+class JobQueue:
+    """Job queue stored in the SQLite database at `path`, created if needed.
+
+    A queue object is a single connection: use it from one thread, and open one
+    queue per process.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, timeout: float = 30.0) -> None:
+        # Autocommit mode: transactions are explicit, see `_transaction`.
+        self._db = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # Safe in WAL mode: a power loss may lose the last commits, but never corrupts the file.
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> JobQueue:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # IMMEDIATE takes the write lock up front, so two processes cannot claim the same jobs.
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._db
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        else:
+            self._db.execute("COMMIT")
+
+    def put(self, payloads: Iterable[Any]) -> int:
+        """Add a job per JSON-serializable payload in one transaction; return the number added."""
+        with self._transaction() as db:
+            cursor = db.executemany("INSERT INTO jobs (payload) VALUES (?)", ((_dumps(p),) for p in payloads))
+        return cursor.rowcount
+
+    def claim(self, limit: int, *, lease: float = 600.0, now: float | None = None) -> list[Job]:
+        """Lease up to `limit` jobs that are ready to run: expired leases first, then pending jobs in order.
+
+        Args:
+            limit: Maximum number of jobs to return.
+            lease: Seconds after which the jobs may be claimed again if they are not completed or failed.
+            now: Current time as from `time.time()`, for tests.
+        """
+        now = time.time() if now is None else now
+        with self._transaction() as db:
+            rows = db.execute(
+                "SELECT id, payload, attempts, error FROM jobs"
+                " WHERE status = ? AND available_at <= ? ORDER BY id LIMIT ?",
+                (RUNNING, now, limit),
+            ).fetchall()
+            rows += db.execute(
+                "SELECT id, payload, attempts, error FROM jobs"
+                " WHERE status = ? AND available_at <= ? ORDER BY id LIMIT ?",
+                (PENDING, now, limit - len(rows)),
+            ).fetchall()
+            db.executemany(
+                "UPDATE jobs SET status = ?, attempts = attempts + 1, available_at = ? WHERE id = ?",
+                ((RUNNING, now + lease, job_id) for job_id, _, _, _ in rows),
+            )
+        return [Job(job_id, json.loads(payload), attempts + 1, error) for job_id, payload, attempts, error in rows]
+
+    def complete(self, results: Iterable[tuple[int, Any]]) -> None:
+        """Store the JSON-serializable result of each job id, and mark the jobs as done."""
+        with self._transaction() as db:
+            db.executemany(
+                "UPDATE jobs SET status = ?, result = ?, error = NULL WHERE id = ?",
+                ((DONE, _dumps(result), job_id) for job_id, result in results),
+            )
+
+    def fail(
+        self,
+        failures: Iterable[tuple[Job, str]],
+        *,
+        max_attempts: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        now: float | None = None,
+    ) -> int:
+        """Record an error for each job; retry it after a backoff unless it has used `max_attempts`.
+
+        Returns the number of jobs scheduled for a retry; the others are marked as failed.
+        """
+        now = time.time() if now is None else now
+        retries = []
+        failed = []
+        for job, error in failures:
+            if job.attempts < max_attempts:
+                retries.append((PENDING, now + backoff_delay(job.attempts, backoff, max_backoff), error, job.id))
+            else:
+                failed.append((FAILED, now, error, job.id))
+        with self._transaction() as db:
+            db.executemany("UPDATE jobs SET status = ?, available_at = ?, error = ? WHERE id = ?", retries + failed)
+        return len(retries)
+
+    def release(self, job_ids: Iterable[int]) -> None:
+        """Return claimed jobs to the queue without counting an attempt, e.g. when a run is interrupted."""
+        with self._transaction() as db:
+            db.executemany(
+                "UPDATE jobs SET status = ?, attempts = attempts - 1, available_at = 0 WHERE id = ? AND status = ?",
+                ((PENDING, job_id, RUNNING) for job_id in job_ids),
+            )
+
+    def retry_failed(self) -> int:
+        """Return every failed job to the queue with a fresh set of attempts; return how many."""
+        with self._transaction() as db:
+            cursor = db.execute(
+                "UPDATE jobs SET status = ?, attempts = 0, available_at = 0 WHERE status = ?", (PENDING, FAILED)
+            )
+        return cursor.rowcount
+
+    def next_ready(self, *, now: float | None = None) -> float | None:
+        """Return the seconds until a pending or leased job can be claimed, 0 if one can now, or None if none is left."""
+        now = time.time() if now is None else now
+        (earliest,) = self._db.execute(
+            "SELECT min(available_at) FROM jobs WHERE status IN (?, ?)", (PENDING, RUNNING)
+        ).fetchone()
+        return None if earliest is None else max(earliest - now, 0.0)
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of jobs by status."""
+        counts = dict.fromkeys((PENDING, RUNNING, DONE, FAILED), 0)
+        counts.update(self._db.execute("SELECT status, count(*) FROM jobs GROUP BY status").fetchall())
+        return counts
+
+    def results(self) -> Iterator[tuple[Any, Any]]:
+        """Yield `(payload, result)` for the completed jobs, in insertion order."""
+        rows = self._db.execute("SELECT payload, result FROM jobs WHERE status = ? ORDER BY id", (DONE,))
+        for payload, result in rows:
+            yield json.loads(payload), json.loads(result)
+
+    def failures(self) -> Iterator[tuple[Any, str]]:
+        """Yield `(payload, error)` for the jobs that used up their attempts, in insertion order."""
+        rows = self._db.execute("SELECT payload, error FROM jobs WHERE status = ? ORDER BY id", (FAILED,))
+        for payload, error in rows:
+            yield json.loads(payload), error
@@ -0,0 +1,131 @@
+"""Output formats for command results.
+
+Commands hand records (flat dicts) to an `Output` instead of printing. The
+`rich` format renders them with Rich for interactive use; `json`, `ndjson` and
+`plain` stream them to stdout in large buffered writes and never import Rich,
+so piping into tools like `jq` is not slowed down by markup parsing and styling.
+
+Example:
+    >>> out = make_output("ndjson")
+    >>> out.emit({"name": "Alice", "count": 2})
+    >>> out.close()
+    {"name": "Alice", "count": 2}
+"""
+
+from __future__ import annotations
+
+import abc
+import enum
+import json
+import sys
+from typing import Any, TextIO
+
+# Number of records buffered before they are written to the stream in one call.
+BUFFER_RECORDS = 1024
+
+
+class OutputFormat(str, enum.Enum):
+    """Supported values of the `--output` option."""
+
+    rich = "rich"
+    json = "json"
+    ndjson = "ndjson"
+    plain = "plain"
+
+
+class Output(abc.ABC):
+    """Base class for output formats: buffers serialized records and writes them in batches."""
+
+    def __init__(self, stream: TextIO | None = None) -> None:
+        self.stream = stream if stream is not None else sys.stdout
+        self._buffer: list[str] = []
+
+    def emit(self, record: dict[str, Any], markup: str | None = None) -> None:
+        """Write one record.
+
+        Args:
+            record: Field names and values of the result.
+            markup: Rich markup shown instead of the fields in the `rich` format.
+        """
+        self._buffer.append(self.format(record))
+        if len(self._buffer) >= BUFFER_RECORDS:
+            self.flush()
+
+    @abc.abstractmethod
+    def format(self, record: dict[str, Any]) -> str:
+        """Serialize a record, including its trailing newline."""
+
+    def flush(self) -> None:
+        """Write buffered records to the stream."""
+        if self._buffer:
+            self.stream.write("".join(self._buffer))
+            self._buffer.clear()
+        self.stream.flush()
+
+    def close(self) -> None:
+        """Flush remaining records. Called once the command has finished."""
+        self.flush()
+
+
+class NdjsonOutput(Output):
+    """One JSON object per line."""
+
+    def format(self, record: dict[str, Any]) -> str:
+        return json.dumps(record, default=str) + "\n"
+
+
+class PlainOutput(Output):
+    """Tab-separated field values, one record per line."""
+
+    def format(self, record: dict[str, Any]) -> str:
+        return "\t".join(str(value) for value in record.values()) + "\n"
+
+
+class JsonOutput(Output):
+    """A single JSON array, streamed element by element."""
+
+    def __init__(self, stream: TextIO | None = None) -> None:
+        super().__init__(stream)
+        self._count = 0
+
+    def format(self, record: dict[str, Any]) -> str:
+        prefix = "[\n" if self._count == 0 else ",\n"
+        self._count += 1
+        return prefix + json.dumps(record, default=str)
+
+    def close(self) -> None:
+        self._buffer.append("[]\n" if self._count == 0 else "\n]\n")
+        self.flush()
+
+
+class RichOutput(Output):
+    """Styled output through a Rich console, for humans at a terminal."""
+
+    def __init__(self, stream: TextIO | None = None) -> None:
+        super().__init__(stream)
+        # Imported here so that the machine-readable formats never pay for Rich.
+        from rich.console import Console
+
+        self.console = Console(file=stream)
+
+    def emit(self, record: dict[str, Any], markup: str | None = None) -> None:
+        self.console.print(self.format(record) if markup is None else markup)
+
+    def format(self, record: dict[str, Any]) -> str:
+        return "  ".join(f"[bold]{key}[/bold]: {value}" for key, value in record.items())
+
+    def flush(self) -> None:
+        self.console.file.flush()
+
+
+OUTPUTS: dict[OutputFormat, type[Output]] = {
+    OutputFormat.rich: RichOutput,
+    OutputFormat.json: JsonOutput,
+    OutputFormat.ndjson: NdjsonOutput,
+    OutputFormat.plain: PlainOutput,
+}
+
+
+def make_output(fmt: OutputFormat | str, stream: TextIO | None = None) -> Output:
+    """Create the `Output` for a format name."""
+    return OUTPUTS[OutputFormat(fmt)](stream)
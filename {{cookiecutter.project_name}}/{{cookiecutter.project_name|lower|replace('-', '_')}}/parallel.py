@@ -0,0 +1,216 @@
+"""Process-pool helpers for CPU-bound NumPy and pandas work.
+
+Plain `multiprocessing` pickles every argument, so mapping over a large frame
+copies it to each worker. Here, arrays are published once in shared memory with
+`shared`, and workers receive only small `SharedArray` handles that attach to
+the same pages without copying. `pmap` sends items to the pool in chunks, which
+keeps the per-task overhead low when there are many small items, and
+`map_column` combines both to run a blockwise transform over a column.
+
+The process that calls `shared` owns the segments and unlinks them when the
+block exits, also when a worker crashes and the pool breaks. Workers only attach.
+If the owning process itself dies, Python's resource tracker removes the segments.
+
+Functions sent to workers must be importable, i.e. defined in a module rather
+than in a notebook cell, because some platforms start workers with `spawn`.
+
+Example:
+    >>> import numpy as np
+    >>> values = np.arange(10.0)
+    >>> map_column(np.sqrt, values, workers=2).round(2).tolist()[:4]
+    [0.0, 1.0, 1.41, 1.73]
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import math
+import os
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, NamedTuple, TypeVar
+
+import numpy as np
+import pandas as pd
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Chunks per worker in `pmap`: several, so that uneven items still balance across workers.
+_CHUNKS_PER_WORKER = 4
+
+# Segments attached by this process, by name. Kept open so that repeated `open()` calls,
+# e.g. one per chunk, reuse the mapping instead of attaching again.
+_attached: dict[str, shared_memory.SharedMemory] = {}
+
+
+class SharedArray(NamedTuple):
+    """Picklable handle to a NumPy array in shared memory.
+
+    Sending a handle to a worker costs a few bytes, whatever the size of the array.
+    """
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+    def open(self, writable: bool = False) -> np.ndarray:
+        """Return the array as a view of the shared segment, without copying.
+
+        Views are read-only unless `writable` is set: writes are visible to every
+        process, so only write to disjoint parts of an array, e.g. one slice per task.
+        """
+        segment = _attached.get(self.name)
+        if segment is None:
+            segment = _attached[self.name] = shared_memory.SharedMemory(name=self.name)
+        array: np.ndarray = np.ndarray(self.shape, dtype=np.dtype(self.dtype), buffer=segment.buf)
+        array.flags.writeable = writable
+        return array
+
+
+def _detach(name: str) -> None:
+    segment = _attached.pop(name, None)
+    if segment is not None:
+        with contextlib.suppress(BufferError):  # A view is still alive; the mapping goes with it.
+            segment.close()
+
+
+def _columns(data: Mapping[str, Any] | pd.DataFrame) -> dict[str, np.ndarray]:
+    if isinstance(data, pd.DataFrame):
+        data = {str(column): data[column].to_numpy() for column in data.columns}
+    arrays = {}
+    for key, value in data.items():
+        array = np.asarray(value)
+        if array.dtype.hasobject:
+            msg = f"Column {key!r} has dtype {array.dtype}; only fixed-size dtypes can be shared"
+            raise TypeError(msg)
+        arrays[key] = array
+    return arrays
+
+
+@contextlib.contextmanager
+def shared(data: Mapping[str, Any] | pd.DataFrame) -> Iterator[dict[str, SharedArray]]:
+    """Copy arrays, or the columns of a DataFrame, into shared memory for the duration of the block.
+
+    Args:
+        data: Arrays by name, or a DataFrame whose columns all have fixed-size
+            dtypes (numbers, booleans, datetimes). Select the columns you need,
+            e.g. `df[["x", "y"]]`, to leave out strings and other object columns.
+
+    Yields:
+        A handle per array, to pass to worker functions.
+
+    Raises:
+        TypeError: An array has an object dtype, which cannot live in shared memory.
+
+    Example:
+        >>> import numpy as np
+        >>> with shared({"x": np.arange(3)}) as arrays:
+        ...     arrays["x"].open().tolist()
+        [0, 1, 2]
+    """
+    arrays = _columns(data)
+    segments: list[shared_memory.SharedMemory] = []
+    try:
+        handles = {}
+        for key, array in arrays.items():
+            # Zero-size segments are not allowed; an empty array still gets one byte.
+            segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            segments.append(segment)
+            handle = SharedArray(segment.name, array.shape, array.dtype.str)
+            np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)[...] = array
+            handles[key] = handle
+        yield handles
+    finally:
+        # Runs on errors too, including a BrokenProcessPool after a worker crashed.
+        for segment in segments:
+            _detach(segment.name)
+            segment.close()
+            segment.unlink()
+
+
+def _apply_chunk(func: Callable[[T], R], chunk: Sequence[T]) -> list[R]:
+    return [func(item) for item in chunk]
+
+
+def pmap(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    workers: int | None = None,
+    chunksize: int | None = None,
+) -> list[R]:
+    """Apply `func` to every item in a process pool and return the results in order.
+
+    Items are sent in chunks, so each task amortizes the cost of a round trip to a
+    worker. Keep items small: pass `SharedArray` handles or slices, not arrays.
+
+    Args:
+        func: Module-level function, called once per item in a worker.
+        items: Arguments for `func`.
+        workers: Pool size; defaults to the CPU count.
+        chunksize: Items per task; defaults to about four tasks per worker.
+
+    Raises:
+        concurrent.futures.process.BrokenProcessPool: A worker died, e.g. killed by the OS.
+    """
+    items = list(items)
+    if not items:
+        return []
+    workers = min(workers or os.cpu_count() or 1, len(items))
+    chunksize = chunksize or math.ceil(len(items) / (workers * _CHUNKS_PER_WORKER))
+    chunks = [items[i : i + chunksize] for i in range(0, len(items), chunksize)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(functools.partial(_apply_chunk, func), chunks)
+        return [result for chunk in results for result in chunk]
+
+
+def block_slices(length: int, blocks: int) -> list[slice]:
+    """Split `range(length)` into at most `blocks` contiguous slices of nearly equal size.
+
+    Example:
+        >>> block_slices(10, 3)
+        [slice(0, 3, None), slice(3, 6, None), slice(6, 10, None)]
+    """
+    blocks = max(1, min(blocks, length))
+    bounds = [length * i // blocks for i in range(blocks + 1)]
+    return [slice(bounds[i], bounds[i + 1]) for i in range(blocks)]
+
+
+def _transform_block(
+    func: Callable[[np.ndarray], np.ndarray], source: SharedArray, target: SharedArray, block: slice
+) -> None:
+    target.open(writable=True)[block] = func(source.open()[block])
+
+
+def map_column(
+    func: Callable[[np.ndarray], Any],
+    values: np.ndarray | pd.Series,
+    *,
+    workers: int | None = None,
+    blocks: int | None = None,
+    dtype: Any = None,
+) -> np.ndarray:
+    """Apply a blockwise transform to a column in parallel and return the result as a new array.
+
+    The input is shared once; each worker reads its blocks from shared memory and
+    writes the output in place, so neither the column nor the result is pickled.
+
+    Args:
+        func: Module-level function mapping a 1-D block of values to a block of results of the same length.
+        values: The column, as an array or Series.
+        workers: Pool size; defaults to the CPU count.
+        blocks: Number of blocks; defaults to four per worker.
+        dtype: Dtype of the result; defaults to the dtype of `values`.
+    """
+    array = np.asarray(values)
+    workers = workers or os.cpu_count() or 1
+    slices = block_slices(len(array), blocks or workers * _CHUNKS_PER_WORKER)
+    output = np.empty(array.shape, dtype=dtype or array.dtype)
+    with shared({"source": array, "target": output}) as arrays:
+        task = functools.partial(_transform_block, func, arrays["source"], arrays["target"])
+        pmap(task, slices, workers=workers, chunksize=1)
+        output[...] = arrays["target"].open()
+    return output
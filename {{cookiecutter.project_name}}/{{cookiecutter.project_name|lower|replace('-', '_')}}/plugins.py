@@ -0,0 +1,213 @@
+"""Plugin commands for {{cookiecutter.project_name}}, discovered from installed distributions.
+
+A distribution adds commands by declaring an entry point in the
+`{{cookiecutter.project_name|lower|replace('-', '_')}}.plugins` group that points to a `typer.Typer` app (or a
+single command function); each command of that app becomes a command of
+`{{cookiecutter.project_name}}`:
+
+    [project.entry-points."{{cookiecutter.project_name|lower|replace('-', '_')}}.plugins"]
+    reports = "my_plugin.cli:app"
+
+Scanning entry points and importing every plugin on each start would make the
+CLI slower with every plugin installed. Instead, the command names and help
+texts are kept in an index file, keyed on a fingerprint of the installed
+distributions. The index is rebuilt, importing each plugin once, only when the
+fingerprint changes, i.e. after packages are installed, upgraded or removed.
+A plugin module is imported only when one of its commands runs or shows its help.
+
+The index lives in `${XDG_CACHE_HOME:-~/.cache}/{{cookiecutter.project_name}}/`, one file per
+environment, or at `{{cookiecutter.project_name|upper|replace('-', '_')}}_PLUGIN_INDEX` if that is set.
+Built-in commands take precedence over plugin commands of the same name. Plugin
+commands are not part of the static completion scripts.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+PROG = "{{cookiecutter.project_name}}"
+ENTRY_POINT_GROUP = "{{cookiecutter.project_name|lower|replace('-', '_')}}.plugins"
+ENV_INDEX = "{{cookiecutter.project_name|upper|replace('-', '_')}}_PLUGIN_INDEX"
+# Bump when the layout of the index changes, so that old files are rebuilt.
+INDEX_VERSION = 1
+_METADATA_SUFFIXES = (".dist-info", ".egg-info")
+
+
+def index_path() -> Path:
+    """Return the index file of the running environment."""
+    override = os.environ.get(ENV_INDEX)
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    digest = hashlib.sha256(sys.prefix.encode()).hexdigest()[:12]
+    return Path(base) / PROG / f"plugins-{digest}.json"
+
+
+def environment_fingerprint() -> str:
+    """Hash the distribution metadata directories on `sys.path` and their modification times.
+
+    Installing, upgrading or removing a distribution adds, replaces or removes its
+    `*.dist-info` directory, which changes the result. Other changes to the
+    `sys.path` directories, such as new `__pycache__` files, do not.
+    """
+    entries = []
+    for entry in sys.path:
+        try:
+            with os.scandir(entry or ".") as it:
+                found = [(item.name, item.stat().st_mtime_ns) for item in it if item.name.endswith(_METADATA_SUFFIXES)]
+        except OSError:  # Missing directories and zip files hold no installed distributions here.
+            continue
+        entries.append((entry, sorted(found)))
+    return hashlib.sha256(repr(entries).encode()).hexdigest()
+
+
+def _entry_points() -> list[tuple[str, str]]:
+    """Return (name, target) of the entry points in the plugin group."""
+    from importlib import metadata
+
+    eps: Any = metadata.entry_points()
+    selected = eps.select(group=ENTRY_POINT_GROUP) if hasattr(eps, "select") else eps.get(ENTRY_POINT_GROUP, [])
+    return sorted({(ep.name, ep.value) for ep in selected})
+
+
+def _load_target(target: str) -> Any:
+    """Import `module:attribute` and return the click command or group it defines."""
+    from importlib import metadata
+
+    obj = metadata.EntryPoint(name="", value=target, group=ENTRY_POINT_GROUP).load()
+    if not isinstance(obj, typer.Typer):
+        wrapper = typer.Typer()
+        wrapper.command()(obj)
+        obj = wrapper
+    return typer.main.get_command(obj)
+
+
+def _plugin_commands(command: Any) -> dict[str, Any]:
+    """Return the commands a plugin provides by name: the subcommands of a group, or the command itself."""
+    if hasattr(command, "commands"):
+        return dict(command.commands)
+    return {command.name: command}
+
+
+def build_index() -> dict[str, Any]:
+    """Import every plugin and collect the names and help texts of their commands.
+
+    Plugins that fail to import are skipped with a warning on stderr; they are tried
+    again the next time the index is rebuilt.
+    """
+    commands: dict[str, dict[str, Any]] = {}
+    for plugin, target in _entry_points():
+        try:
+            provided = _plugin_commands(_load_target(target))
+        except Exception as e:  # A broken plugin must not break the CLI.
+            typer.echo(f"{PROG}: warning: skipping plugin {plugin!r} ({target}): {e}", err=True)
+            continue
+        for name, command in provided.items():
+            commands.setdefault(
+                name,
+                {
+                    "plugin": plugin,
+                    "target": target,
+                    "help": command.get_short_help_str(limit=300),
+                    "hidden": bool(command.hidden),
+                },
+            )
+    return {"version": INDEX_VERSION, "fingerprint": environment_fingerprint(), "commands": commands}
+
+
+def _write_index(path: Path, index: dict[str, Any]) -> None:
+    # Write a temporary file and rename it, so that concurrent runs never read a partial index.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".plugins-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(index, f, indent=1, sort_keys=True)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+@functools.cache
+def _cached_index() -> dict[str, Any]:
+    path = index_path()
+    fingerprint = environment_fingerprint()
+    with contextlib.suppress(OSError, ValueError):
+        index: dict[str, Any] = json.loads(path.read_text())
+        if index.get("version") == INDEX_VERSION and index.get("fingerprint") == fingerprint:
+            return index
+    index = build_index()
+    with contextlib.suppress(OSError):  # A read-only cache directory only costs a rebuild next time.
+        _write_index(path, index)
+    return index
+
+
+def load_index(refresh: bool = False) -> dict[str, Any]:
+    """Return the plugin index, rebuilding it if the environment changed or `refresh` is set.
+
+    The index maps each plugin command name to its `plugin` (entry point name),
+    `target` (`module:attribute`), `help` and `hidden` flag.
+    """
+    if refresh:
+        index_path().unlink(missing_ok=True)
+        _cached_index.cache_clear()
+    return _cached_index()
+
+
+class LazyCommand(TyperCommand):
+    """Placeholder for a plugin command that imports the plugin when the command is used.
+
+    Listing commands in the help only needs the name and help text from the index;
+    parsing arguments, running the command or showing its own help loads the real command.
+    """
+
+    def __init__(self, name: str, target: str, help: str | None = None, hidden: bool = False) -> None:  # noqa: A002
+        super().__init__(name, help=help, short_help=help, hidden=hidden)
+        self.target = target
+
+    @functools.cached_property
+    def command(self) -> Any:
+        """The real command, imported on first access."""
+        return _plugin_commands(_load_target(self.target))[str(self.name)]
+
+    def make_context(self, info_name: str | None, args: list[str], parent: Any = None, **extra: Any) -> Any:
+        # The context belongs to the real command, so the group invokes that one.
+        return self.command.make_context(info_name, args, parent=parent, **extra)
+
+    def invoke(self, ctx: Any) -> Any:
+        return self.command.invoke(ctx)
+
+    def get_params(self, ctx: Any) -> Any:
+        return self.command.get_params(ctx)
+
+
+class PluginGroup(TyperGroup):
+    """Command group that adds the commands of installed plugins to the built-in ones.
+
+    Pass it as `typer.Typer(cls=PluginGroup)`.
+    """
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        builtin = super().list_commands(ctx)
+        plugins = sorted(name for name in load_index()["commands"] if name not in self.commands)
+        return [*builtin, *plugins]
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None:
+            return command
+        entry = load_index()["commands"].get(cmd_name)
+        if entry is None:
+            return None
+        return LazyCommand(cmd_name, entry["target"], help=entry["help"], hidden=entry["hidden"])
@@ -0,0 +1,274 @@
+"""Experiment results in a local SQLite database.
+
+Each run belongs to an experiment and has a name, parameters and metrics. A
+metric can be logged at several steps, e.g. once per epoch; the run's value of
+a metric is the one logged at its last step. Compared with appending rows to
+CSV files, the database:
+
+- writes a whole batch of runs in one transaction with `log_runs`, and lets
+  several processes write at the same time: it runs in WAL mode, and writers
+  wait for each other instead of failing or interleaving partial rows.
+- finds runs by parameter value (`runs(where=...)`) and reads the final value
+  of a metric in every run (`best`, `compare`) through indexes, and aggregates
+  a metric by parameter in SQL, so queries over thousands of runs take
+  milliseconds.
+- returns runs as a DataFrame with one row per run and a column per parameter
+  and metric.
+
+Example:
+    >>> store = ResultStore(":memory:")
+    >>> store.log_runs([("a", {"lr": 0.1}, {"loss": 0.5}), ("b", {"lr": 0.01}, {"loss": 0.3})])
+    2
+    >>> store.runs(where={"lr": 0.01})[["run", "lr", "loss"]].to_dict("records")
+    [{'run': 'b', 'lr': 0.01, 'loss': 0.3}]
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import sqlite3
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from {{cookiecutter.project_name|lower|replace('-', '_')}}.utils import PROCESSED_DIR
+
+# Database used when no path is given.
+DEFAULT_PATH = PROCESSED_DIR / "results.db"
+DEFAULT_EXPERIMENT = "default"
+
+# Parameters and metrics are clustered by run (their primary keys). Parameters are also indexed by
+# key and value for lookups, and metrics by key then run, covering `_FINAL_METRIC` without a sort.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    experiment TEXT NOT NULL,
+    name TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    UNIQUE (experiment, name)
+);
+CREATE TABLE IF NOT EXISTS params (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    key TEXT NOT NULL,
+    value,
+    PRIMARY KEY (run_id, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS params_by_value ON params (key, value);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    key TEXT NOT NULL,
+    step INTEGER NOT NULL,
+    value REAL,
+    PRIMARY KEY (run_id, key, step)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS metrics_by_key ON metrics (key, run_id, step, value);
+"""
+
+# The last-step value of a metric in each run: SQLite takes the bare `value` column from the row holding max(step).
+_FINAL_METRIC = "SELECT run_id, value, max(step) AS step FROM metrics WHERE key = ? GROUP BY run_id"
+
+
+# Stored as they are; parameters of other types are stored as JSON text.
+_SCALARS = (int, float, str)
+# NumPy scalars and arrays, which neither SQLite nor JSON takes, are converted to Python values first.
+_NUMPY = (np.generic, np.ndarray)
+
+
+def _plain(value: Any) -> Any:
+    """Return NumPy scalars and arrays as Python values, for `json.dumps(default=...)`."""
+    if isinstance(value, _NUMPY):
+        return value.tolist()
+    msg = f"Object of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+def _param(value: Any) -> Any:
+    """Store numbers, strings and None as they are, and anything else as JSON text."""
+    if isinstance(value, _NUMPY):
+        value = value.tolist()
+    if value is None or isinstance(value, _SCALARS):
+        return value
+    return json.dumps(value, sort_keys=True, default=_plain)
+
+
+class ResultStore:
+    """Experiment results stored in the SQLite database at `path`, created if needed.
+
+    A store object is a single connection: use it from one thread, and open one
+    store per process, e.g. one in each worker of `parallel.pmap`.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] = DEFAULT_PATH, *, timeout: float = 30.0) -> None:
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode: transactions are explicit, see `_transaction`.
+        self._db = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # Safe in WAL mode: a power loss may lose the last commits, but never corrupts the file.
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> ResultStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # IMMEDIATE takes the write lock up front, so concurrent writers queue instead of deadlocking.
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._db
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        else:
+            self._db.execute("COMMIT")
+
+    def _run_id(self, db: sqlite3.Connection, experiment: str, name: str, now: float) -> int:
+        db.execute(
+            "INSERT OR IGNORE INTO runs (experiment, name, created_at) VALUES (?, ?, ?)", (experiment, name, now)
+        )
+        (run_id,) = db.execute("SELECT id FROM runs WHERE experiment = ? AND name = ?", (experiment, name)).fetchone()
+        return int(run_id)
+
+    def log_runs(
+        self,
+        runs: Iterable[tuple[str, Mapping[str, Any], Mapping[str, float]]],
+        *,
+        experiment: str = DEFAULT_EXPERIMENT,
+        step: int = 0,
+    ) -> int:
+        """Record `(name, params, metrics)` for each run in one transaction; return the number of runs.
+
+        Runs are created on first use. Logging a run again overwrites the parameters
+        and the metrics at `step` that it names, and keeps the others.
+        """
+        now = time.time()
+        params = []
+        metrics = []
+        count = 0
+        with self._transaction() as db:
+            for name, run_params, run_metrics in runs:
+                run_id = self._run_id(db, experiment, name, now)
+                params += [(run_id, key, _param(value)) for key, value in run_params.items()]
+                # float() also converts NumPy scalars, which SQLite would store as blobs.
+                metrics += [
+                    (run_id, key, step, None if value is None else float(value)) for key, value in run_metrics.items()
+                ]
+                count += 1
+            db.executemany("INSERT OR REPLACE INTO params (run_id, key, value) VALUES (?, ?, ?)", params)
+            db.executemany("INSERT OR REPLACE INTO metrics (run_id, key, step, value) VALUES (?, ?, ?, ?)", metrics)
+        return count
+
+    def log_run(
+        self,
+        name: str,
+        params: Mapping[str, Any],
+        metrics: Mapping[str, float],
+        *,
+        experiment: str = DEFAULT_EXPERIMENT,
+        step: int = 0,
+    ) -> None:
+        """Record the parameters and metrics of one run; see `log_runs`."""
+        self.log_runs([(name, params, metrics)], experiment=experiment, step=step)
+
+    def _select(self, experiment: str | None, where: Mapping[str, Any] | None) -> tuple[str, list[Any]]:
+        """Return a query for the ids of the runs in `experiment` whose parameters equal `where`, and its arguments."""
+        conditions = ["1"]
+        args: list[Any] = []
+        if experiment is not None:
+            conditions.append("experiment = ?")
+            args.append(experiment)
+        for key, value in (where or {}).items():
+            conditions.append("id IN (SELECT run_id FROM params WHERE key = ? AND value = ?)")
+            args += [key, _param(value)]
+        return f"SELECT id FROM runs WHERE {' AND '.join(conditions)}", args  # noqa: S608 | placeholders only
+
+    def _frame(self, selected: str, args: list[Any]) -> pd.DataFrame:
+        """Return the runs whose ids `selected` returns, indexed by id, with a column per parameter and metric."""
+        runs = pd.read_sql_query(
+            f"SELECT id, experiment, name AS run, created_at FROM runs WHERE id IN ({selected}) ORDER BY id",  # noqa: S608 | placeholders only
+            self._db,
+            params=args,
+            index_col="id",
+        )
+        runs["created_at"] = pd.to_datetime(runs["created_at"], unit="s")
+        queries = {
+            "_param": f"SELECT run_id, key, value FROM params WHERE run_id IN ({selected})",  # noqa: S608 | placeholders only
+            "_metric": (
+                "SELECT run_id, key, value, max(step) FROM metrics"  # noqa: S608 | placeholders only
+                f" WHERE run_id IN ({selected}) GROUP BY run_id, key"
+            ),
+        }
+        for suffix, query in queries.items():
+            values = pd.read_sql_query(query, self._db, params=args)
+            wide = values.pivot(index="run_id", columns="key", values="value").infer_objects()
+            # A name already taken, by a fixed column or for metrics by a parameter, gets the suffix.
+            runs = runs.join(wide, rsuffix=suffix)
+        runs.columns.name = None
+        return runs
+
+    def runs(self, *, experiment: str | None = None, where: Mapping[str, Any] | None = None) -> pd.DataFrame:
+        """Return the runs, oldest first, as a frame with a column per parameter and metric.
+
+        Args:
+            experiment: Only the runs of this experiment; all by default.
+            where: Only the runs whose parameters have these values, e.g. `{"model": "cnn", "lr": 0.01}`.
+
+        Returns:
+            Columns `experiment`, `run` and `created_at`, then the parameters and the last-step
+            value of each metric, each sorted by name. Values that a run did not log are missing.
+        """
+        return self._frame(*self._select(experiment, where)).reset_index(drop=True)
+
+    def best(self, metric: str, *, n: int = 10, maximize: bool = True, experiment: str | None = None) -> pd.DataFrame:
+        """Return the `n` runs with the highest final `metric` (lowest unless `maximize`), best first, as `runs` does."""
+        selected, args = self._select(experiment, None)
+        ranked = (
+            f"SELECT run_id FROM ({_FINAL_METRIC}) WHERE value IS NOT NULL AND run_id IN ({selected})"  # noqa: S608 | placeholders only
+            f" ORDER BY value {'DESC' if maximize else 'ASC'} LIMIT ?"
+        )
+        ranked_args = [metric, *args, n]
+        ids = [run_id for (run_id,) in self._db.execute(ranked, ranked_args)]
+        return self._frame(ranked, ranked_args).loc[ids].reset_index(drop=True)
+
+    def compare(
+        self, metric: str, by: str, *, experiment: str | None = None, where: Mapping[str, Any] | None = None
+    ) -> pd.DataFrame:
+        """Summarize the final `metric` of the runs for each value of the parameter `by`.
+
+        The aggregation runs in SQLite, so only one row per parameter value leaves the database.
+
+        Returns:
+            One row per value of `by`, in order, with the number of runs and the mean, min and max of `metric`.
+        """
+        selected, args = self._select(experiment, where)
+        query = f"""
+            SELECT p.value, count(*) AS runs, avg(m.value) AS mean, min(m.value) AS min, max(m.value) AS max
+            FROM params AS p JOIN ({_FINAL_METRIC}) AS m ON m.run_id = p.run_id
+            WHERE p.key = ? AND m.value IS NOT NULL AND p.run_id IN ({selected})
+            GROUP BY p.value ORDER BY p.value
+        """  # noqa: S608 | placeholders only
+        return pd.read_sql_query(query, self._db, params=[metric, by, *args]).rename(columns={"value": by})
+
+    def history(
+        self, metric: str, *, experiment: str | None = None, where: Mapping[str, Any] | None = None
+    ) -> pd.DataFrame:
+        """Return every logged step of `metric` as rows of `run`, `step` and `value`, by run and step."""
+        selected, args = self._select(experiment, where)
+        query = f"""
+            SELECT r.name AS run, m.step, m.value FROM metrics AS m JOIN runs AS r ON r.id = m.run_id
+            WHERE m.key = ? AND m.run_id IN ({selected}) ORDER BY m.run_id, m.step
+        """  # noqa: S608 | placeholders only
+        return pd.read_sql_query(query, self._db, params=[metric, *args])
@@ -0,0 +1,311 @@
+"""Opt-in warm-process server mode for {{cookiecutter.project_name}}.
+
+A server process imports the CLI once and listens on a Unix domain socket. The
+`{{cookiecutter.project_name}}-warm` client shim connects to it and passes its stdin, stdout and
+stderr file descriptors together with argv, environment and working directory.
+The server forks a child per request that runs the command directly on those
+descriptors, so output streams to the caller as usual and each run starts from
+the already-imported state. The child reports the exit code back to the client.
+
+The client starts the server on demand. The server exits after
+`{{cookiecutter.project_name|upper|replace('-', '_')}}_SERVER_IDLE` seconds without requests (default 600) and restarts as
+soon as a source file of the package changes. On platforms without Unix sockets
+or `fork` the client runs the command in-process.
+
+This module must stay cheap to import: the client path only uses the standard library.
+
+Usage:
+    {{cookiecutter.project_name}}-warm [ARGS]...                          # run a command through the server
+    python -m {{cookiecutter.project_name|lower|replace('-', '_')}}.server [serve|stop|status]
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import signal
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+PROG = "{{cookiecutter.project_name}}"
+ENV_PREFIX = "{{cookiecutter.project_name|upper|replace('-', '_')}}_SERVER"
+PACKAGE_DIR = Path(__file__).resolve().parent
+SUPPORTED = hasattr(socket, "AF_UNIX") and hasattr(os, "fork") and hasattr(socket, "send_fds")
+
+# Requests start with a fixed-size length prefix sent together with the client's file descriptors.
+_HEADER_SIZE = 8
+_EXIT_RESTART = "restart"
+
+
+def socket_path() -> Path:
+    """Return the socket path, unique per user and installation."""
+    override = os.environ.get(f"{ENV_PREFIX}_SOCKET")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    digest = hashlib.sha256(str(PACKAGE_DIR).encode()).hexdigest()[:12]
+    return Path(base) / f"{PROG}-{os.getuid()}" / f"{digest}.sock"
+
+
+def _check_private(directory: Path) -> None:
+    """Refuse a socket directory that another user could have created or can write to.
+
+    Whoever listens on the socket receives the client's environment and stdio, and the default
+    directory in the shared temporary directory has a predictable name.
+
+    Raises:
+        FileNotFoundError: `directory` does not exist.
+        PermissionError: `directory` is a symlink, is not owned by the current user or is
+            accessible to other users.
+    """
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        msg = f"refusing to use {directory}: it must be a directory owned by the current user with mode 0700"
+        raise PermissionError(msg)
+
+
+def source_fingerprint() -> str:
+    """Hash the names, sizes and modification times of the package sources."""
+    entries = sorted((str(p), p.stat().st_mtime_ns, p.stat().st_size) for p in PACKAGE_DIR.rglob("*.py"))
+    return hashlib.sha256(repr(entries).encode()).hexdigest()
+
+
+def _recv_exact(conn: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = conn.recv(size)
+        if not chunk:
+            msg = "connection closed mid-request"
+            raise ConnectionError(msg)
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _reply(conn: socket.socket, **payload: Any) -> None:
+    conn.sendall(json.dumps(payload).encode() + b"\n")
+
+
+# ============================================================================
+# Server
+# ============================================================================
+
+
+def _run_command(argv: list[str]) -> int:
+    from {{cookiecutter.project_name|lower|replace('-', '_')}}.cli import app
+
+    try:
+        app(args=argv, prog_name=PROG)
+    except SystemExit as exc:
+        if exc.code is None or isinstance(exc.code, int):
+            return exc.code or 0
+        print(exc.code, file=sys.stderr)
+        return 1
+    return 0
+
+
+def _child(conn: socket.socket, fds: list[int], request: dict[str, Any]) -> None:
+    """Run one request in a forked child on the client's stdio. Never returns."""
+    code = 1
+    try:
+        # Announce the pid first so that the client can forward Ctrl-C to this process.
+        _reply(conn, pid=os.getpid())
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        sys.stdin = open(0, closefd=False)  # noqa: SIM115
+        sys.stdout = open(1, "w", buffering=1 if os.isatty(1) else -1, closefd=False)  # noqa: SIM115
+        sys.stderr = open(2, "w", buffering=1, closefd=False)  # noqa: SIM115
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        code = _run_command(request["argv"])
+    except BaseException:  # the child must always report an exit code
+        import traceback
+
+        traceback.print_exc()
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            _reply(conn, exit=code)
+        finally:
+            os._exit(code)
+
+
+def _handle(conn: socket.socket, fingerprint: str) -> bool:
+    """Serve one connection. Returns False when the server should shut down."""
+    header, fds, _, _ = socket.recv_fds(conn, _HEADER_SIZE, 3)
+    try:
+        request = json.loads(_recv_exact(conn, int.from_bytes(header, "big")))
+        control = request.get("control")
+        if control == "status":
+            _reply(conn, pid=os.getpid(), fingerprint=fingerprint)
+            return True
+        if control == "stop":
+            _reply(conn, exit=0)
+            return False
+        if source_fingerprint() != fingerprint:
+            _reply(conn, exit=_EXIT_RESTART)
+            return False
+        if os.fork() == 0:
+            _child(conn, fds, request)
+        return True
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+
+def serve(idle_timeout: float | None = None) -> None:
+    """Run the server in the foreground until it is idle, stopped or out of date."""
+    if idle_timeout is None:
+        idle_timeout = float(os.environ.get(f"{ENV_PREFIX}_IDLE", "600"))
+    path = socket_path()
+    if _request({"control": "status"}, path) is not None:
+        return  # Another server is already listening.
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    _check_private(path.parent)
+    path.unlink(missing_ok=True)
+
+    # Warm up: everything imported here is shared by every forked request.
+    from {{cookiecutter.project_name|lower|replace('-', '_')}}.cli import app  # noqa: F401
+
+    with contextlib.suppress(ImportError):
+        import rich.console  # noqa: F401
+
+    fingerprint = source_fingerprint()
+    # Forked children are reaped automatically.
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(str(path))
+        listener.listen(64)
+        listener.settimeout(idle_timeout)
+        try:
+            while True:
+                try:
+                    conn, _ = listener.accept()
+                except socket.timeout:  # noqa: UP041 | not an alias of TimeoutError before Python 3.10
+                    break
+                with conn:
+                    conn.settimeout(None)
+                    try:
+                        if not _handle(conn, fingerprint):
+                            break
+                    except (OSError, ValueError):
+                        continue
+        finally:
+            path.unlink(missing_ok=True)
+
+
+# ============================================================================
+# Client
+# ============================================================================
+
+
+def _read_reply(replies: Any) -> dict[str, Any]:
+    """Read the final reply, forwarding Ctrl-C to the child that runs the command."""
+    pid = None
+    while True:
+        try:
+            line = replies.readline()
+        except KeyboardInterrupt:
+            if pid is None:
+                raise
+            os.kill(pid, signal.SIGINT)
+            continue
+        if not line:
+            # The child died without reporting; treat it like a crashed command.
+            return {"exit": 1}
+        reply: dict[str, Any] = json.loads(line)
+        if "exit" in reply or "fingerprint" in reply:
+            return reply
+        pid = reply.get("pid")
+
+
+def _request(payload: dict[str, Any], path: Path, fds: list[int] | None = None) -> dict[str, Any] | None:
+    """Send one request. Returns the server's reply, or None when no server is listening.
+
+    Raises:
+        PermissionError: The socket directory is not private to the current user.
+    """
+    try:
+        _check_private(path.parent)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(str(path))
+            data = json.dumps(payload).encode()
+            socket.send_fds(conn, [len(data).to_bytes(_HEADER_SIZE, "big")], fds or [])
+            conn.sendall(data)
+            return _read_reply(conn.makefile("rb"))
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
+
+
+def _start_server(path: Path, timeout: float = 10.0) -> None:
+    command = [sys.executable, "-m", "{{cookiecutter.project_name|lower|replace('-', '_')}}.server", "serve"]
+    subprocess.Popen(  # noqa: S603
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if _request({"control": "status"}, path) is not None:
+            return
+        time.sleep(0.02)
+    msg = f"{PROG} server did not start within {timeout:.0f}s"
+    raise TimeoutError(msg)
+
+
+def run(argv: list[str]) -> int:
+    """Run a command through the warm server, starting or restarting it as needed."""
+    if not SUPPORTED:
+        return _run_command(argv)
+    path = socket_path()
+    request = {"argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)}
+    try:
+        for _ in range(3):
+            reply = _request(request, path, [0, 1, 2])
+            if reply is None:
+                _start_server(path)
+            elif reply["exit"] == _EXIT_RESTART:
+                # The old server has exited; give it a moment to release the socket.
+                time.sleep(0.05)
+            else:
+                return int(reply["exit"])
+    except PermissionError as exc:
+        print(f"{PROG}-warm: {exc}; running without the server", file=sys.stderr)
+    return _run_command(argv)
+
+
+def client_main() -> None:
+    """Entry point of the `{{cookiecutter.project_name}}-warm` client shim."""
+    sys.exit(run(sys.argv[1:]))
+
+
+def main(argv: list[str]) -> int:
+    """Manage the server: `serve` (foreground), `stop` or `status`."""
+    command = argv[0] if argv else "status"
+    if command == "serve":
+        serve()
+        return 0
+    if command in ("stop", "status"):
+        reply = _request({"control": command}, socket_path()) if SUPPORTED else None
+        print(json.dumps(reply) if reply is not None else "not running")
+        return 0
+    print("usage: python -m {{cookiecutter.project_name|lower|replace('-', '_')}}.server [serve|stop|status]", file=sys.stderr)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
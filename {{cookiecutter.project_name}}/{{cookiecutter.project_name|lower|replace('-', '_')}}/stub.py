@@ -0,0 +1,70 @@
+"""Local stand-in for the upstream service, for tests, `make run` and `make loadtest`.
+
+The stub answers `GET /items/{key}` with a small JSON document after an optional
+artificial latency, and records the client port of every connection it sees, so
+tests can check that the service reuses pooled connections.
+
+Usage:
+    python -m {{cookiecutter.project_name|lower|replace('-', '_')}}.stub [--port 8081] [--latency 0.01]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+
+from aiohttp import web
+
+LATENCY = web.AppKey("latency", float)
+# Client ports of the connections that sent requests; one entry per connection.
+PEERS = web.AppKey("peers", set[int])
+
+
+async def get_item(request: web.Request) -> web.Response:
+    """Return a deterministic document for the key, or 404 for keys starting with "missing"."""
+    peer = request.transport.get_extra_info("peername") if request.transport else None
+    if peer:
+        request.app[PEERS].add(peer[1])
+    if request.app[LATENCY]:
+        await asyncio.sleep(request.app[LATENCY])
+    key = request.match_info["key"]
+    if key.startswith("missing"):
+        raise web.HTTPNotFound(text=f"no item {key!r}")
+    return web.json_response({"key": key, "value": len(key)})
+
+
+def create_stub_app(latency: float = 0.0) -> web.Application:
+    """Create the stub upstream application; `latency` delays every response by that many seconds."""
+    app = web.Application()
+    app[LATENCY] = latency
+    app[PEERS] = set()
+    app.router.add_get("/items/{key}", get_item)
+    return app
+
+
+async def start_stub(host: str = "127.0.0.1", port: int = 0, latency: float = 0.0) -> tuple[web.AppRunner, str]:
+    """Start the stub on `port` (0 picks a free one) and return its runner and base URL.
+
+    Stop it with `await runner.cleanup()`.
+    """
+    runner = web.AppRunner(create_stub_app(latency), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound_host, bound_port = runner.addresses[0][:2]
+    return runner, f"http://{bound_host}:{bound_port}"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the stub upstream service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds to wait before each response")
+    args = parser.parse_args(argv)
+    web.run_app(create_stub_app(args.latency), host=args.host, port=args.port, access_log=None)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
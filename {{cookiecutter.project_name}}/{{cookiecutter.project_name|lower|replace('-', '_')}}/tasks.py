@@ -0,0 +1,69 @@
+"""Example batch task: extract simple features from text documents.
+
+A task is a pair of module-level functions. `init` runs once in each worker
+process when the pool starts, and is the place for expensive set-up such as
+loading a model, a vocabulary or a lookup table. `extract_features` then
+processes one batch of payloads at a time using that state, and returns one
+JSON-serializable result per payload, in order.
+
+Replace both with your own work, e.g. parsing files, computing embeddings or
+re-encoding media, and point `{{cookiecutter.project_name}} run --task/--init` at them.
+
+Example:
+    >>> init()
+    >>> extract_features(["the cat sat on the mat"])[0]["tokens"]
+    6
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from typing import Any
+
+# Size of the hashed bag-of-words vector.
+BUCKETS = 64
+
+STOPWORDS = frozenset({"a", "an", "and", "are", "by", "for", "in", "is", "it", "of", "on", "or", "the", "to"})
+
+# Per-process state, set by `init`.
+_state: dict[str, Any] = {}
+
+
+def init(buckets: int = BUCKETS) -> None:
+    """Prepare the per-process state; called once in each worker before its first batch."""
+    _state["token"] = re.compile(r"[a-z0-9]+")
+    # Bucket of each word seen so far; words repeat a lot, so hashing each only once pays off.
+    _state["buckets"] = buckets
+    _state["bucket_of"] = {}
+
+
+def _bucket(word: str) -> int:
+    bucket_of: dict[str, int] = _state["bucket_of"]
+    bucket = bucket_of.get(word)
+    if bucket is None:
+        digest = hashlib.blake2b(word.encode(), digest_size=8).digest()
+        bucket = bucket_of[word] = int.from_bytes(digest, "little") % _state["buckets"]
+    return bucket
+
+
+def extract_features(batch: list[str]) -> list[dict[str, Any]]:
+    """Return the token counts and a hashed bag-of-words vector of each document.
+
+    Raises:
+        TypeError: A payload is not a string.
+    """
+    if not _state:
+        init()
+    results = []
+    for text in batch:
+        if not isinstance(text, str):
+            msg = f"expected a string, got {type(text).__name__}"
+            raise TypeError(msg)
+        tokens = _state["token"].findall(text.lower())
+        vector = [0] * _state["buckets"]
+        for token in tokens:
+            if token not in STOPWORDS:
+                vector[_bucket(token)] += 1
+        results.append({"tokens": len(tokens), "unique": len(set(tokens)), "vector": vector})
+    return results
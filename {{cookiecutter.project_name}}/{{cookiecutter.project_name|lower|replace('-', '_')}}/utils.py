@@ -2,15 +2,80 @@
 
 {% if cookiecutter.project_type == 'notebooks' -%}
 This module provides helper functions for use in Jupyter notebooks.
+{%- if cookiecutter.dataframe_backend == 'polars' %}
+
+The loaders return polars lazy frames: a query is planned until `.collect()`,
+which reads only the columns and rows it needs and runs on all cores. Hand
+small, aggregated results to pandas-based libraries with `to_pandas`.
+{%- endif %}
 {%- endif %}
 """
 
 from __future__ import annotations
 
 {% if cookiecutter.project_type == 'notebooks' -%}
+import itertools
+import os
+import tempfile
+from collections.abc import Callable
+{%- if cookiecutter.dataframe_backend == 'pandas' %}
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+{%- endif %}
+from pathlib import Path
+from typing import Any, overload
+
+import numpy as np
 import pandas as pd
+{%- if cookiecutter.dataframe_backend == 'polars' %}
+import polars as pl
+{%- endif %}
+import pyarrow as pa
+import pyarrow.feather as feather
+
+# Relative paths given to the save and open helpers below are resolved against this directory.
+PROCESSED_DIR = Path(__file__).resolve().parent.parent / "data" / "processed"
+# Relative patterns given to `load_many` are resolved against this directory.
+RAW_DIR = PROCESSED_DIR.parent / "raw"
+
+
+{% if cookiecutter.dataframe_backend == 'polars' -%}
+def load_sample_data() -> pl.LazyFrame:
+    """Load sample dataset for exploration.
+
+    Returns:
+        Lazy frame with sample data including x, y, and category columns; `.collect()` it for the rows.
+
+    Example:
+        >>> df = load_sample_data().collect()
+        >>> df.shape
+        (10, 3)
+    """
+    # Create sample data
+    return pl.LazyFrame({"x": list(range(10)), "y": [i**2 for i in range(10)], "category": ["A", "B"] * 5})
+
+
+def to_pandas(frame: pl.LazyFrame | pl.DataFrame, *, streaming: bool = False) -> pd.DataFrame:
+    """Run a lazy query and convert its result to a pandas DataFrame.
+
+    Use it at the edges, where a library needs pandas (seaborn, statsmodels,
+    scikit-learn, ...): filter, select and aggregate lazily first, so only the small
+    result is materialized and converted.
+
+    Args:
+        frame: The query, or an already collected frame.
+        streaming: Run the query with the streaming engine, which processes the files
+            in batches, for inputs larger than memory.
+
+    Example:
+        >>> to_pandas(load_sample_data().filter(pl.col("x") > 7))["y"].tolist()
+        [64, 81]
+    """
+    if isinstance(frame, pl.LazyFrame):
+        frame = frame.collect(engine="streaming" if streaming else "auto")
+    return frame.to_pandas()
 
 
+{% else -%}
 def load_sample_data() -> pd.DataFrame:
     """Load sample dataset for exploration.
 
@@ -28,6 +93,130 @@ def load_sample_data() -> pd.DataFrame:
     )
 
 
+{% endif -%}
+def _category_names(n_categories: int) -> list[str]:
+    """Spreadsheet-style labels: A, B, ..., Z, AA, AB, ..."""
+    names = []
+    for number in range(1, n_categories + 1):
+        name = ""
+        while number:
+            number, remainder = divmod(number - 1, 26)
+            name = chr(ord("A") + remainder) + name
+        names.append(name)
+    return names
+
+
+@overload
+def generate_synthetic_data(
+    n_rows: int, n_categories: int = ..., seed: int | None = ..., out: None = ..., chunk_rows: int = ...
+) -> pd.DataFrame: ...
+
+
+@overload
+def generate_synthetic_data(
+    n_rows: int, n_categories: int = ..., seed: int | None = ..., out: str | Path = ..., chunk_rows: int = ...
+) -> Path: ...
+
+
+def generate_synthetic_data(
+    n_rows: int,
+    n_categories: int = 2,
+    seed: int | None = 0,
+    out: str | Path | None = None,
+    chunk_rows: int = 1_000_000,
+) -> pd.DataFrame | Path:
+    """Generate data with the schema of `load_sample_data` at any size.
+
+    `x` is uniform on [0, 10), `y` is `x**2` plus standard normal noise and
+    `category` is drawn uniformly from `n_categories` labels (A, B, ...). The
+    columns are filled chunk by chunk with vectorized NumPy into preallocated
+    arrays, and each column has its own random stream, so the result depends on
+    `seed` only, not on `chunk_rows`.
+
+    Args:
+        n_rows: Number of rows.
+        n_categories: Number of distinct categories.
+        seed: Seed of the random generator; None for fresh entropy.
+        out: If given, stream the chunks to this uncompressed Arrow IPC (Feather v2)
+            file instead of returning a frame, so memory stays at one chunk. Relative
+            to `data/raw/` unless absolute; `.feather` is added if there is no suffix.
+            Open the file with `open_table` or read parts of it with `load_many`.
+        chunk_rows: Rows generated, and written, at a time.
+
+    Returns:
+        The frame, with `category` as a categorical column, or the path written.
+
+    Example:
+        >>> df = generate_synthetic_data(1_000, n_categories=3, seed=42)
+        >>> df.shape, sorted(df["category"].unique())
+        ((1000, 3), ['A', 'B', 'C'])
+    """
+    categories = _category_names(n_categories)
+    # Signed, like pandas' own codes: older pyarrow cannot convert unsigned dictionary indices to pandas.
+    code_dtype = np.min_scalar_type(-max(n_categories, 1))
+    x_rng, y_rng, category_rng = (np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(3))
+
+    def fill(x: np.ndarray, y: np.ndarray, codes: np.ndarray) -> None:
+        """Fill the next chunk of each column in place."""
+        x_rng.random(out=x)
+        x *= 10
+        y_rng.standard_normal(out=y)
+        y += np.square(x)
+        draws = category_rng.random(len(codes))
+        draws *= n_categories
+        codes[:] = draws  # Truncates towards zero: uniform codes in [0, n_categories).
+
+    if out is None:
+        x, y = np.empty(n_rows), np.empty(n_rows)
+        codes = np.empty(n_rows, dtype=code_dtype)
+        for start in range(0, n_rows, chunk_rows):
+            chunk = slice(start, start + chunk_rows)
+            fill(x[chunk], y[chunk], codes[chunk])
+        category = pd.Categorical.from_codes(codes, categories=pd.Index(categories))
+        return pd.DataFrame({"x": x, "y": y, "category": category})
+
+    target = RAW_DIR / out  # An absolute path replaces the directory.
+    target = target if target.suffix else target.with_suffix(".feather")
+    dictionary = pa.array(categories)
+    index_type = pa.from_numpy_dtype(code_dtype)
+    schema = pa.schema([("x", pa.float64()), ("y", pa.float64()), ("category", pa.dictionary(index_type, pa.string()))])
+
+    def write(tmp: Path) -> None:
+        x, y = np.empty(chunk_rows), np.empty(chunk_rows)
+        codes = np.empty(chunk_rows, dtype=code_dtype)
+        with pa.ipc.new_file(str(tmp), schema) as writer:
+            for start in range(0, n_rows, chunk_rows):
+                size = min(chunk_rows, n_rows - start)
+                fill(x[:size], y[:size], codes[:size])
+                category = pa.DictionaryArray.from_arrays(codes[:size], dictionary)
+                writer.write_batch(pa.record_batch([pa.array(x[:size]), pa.array(y[:size]), category], schema=schema))
+
+    _write_atomically(target, write)
+    return target
+
+
+def newton_sqrt(values: np.ndarray, tolerance: float = 1e-12) -> np.ndarray:
+    """Square roots computed one element at a time with Newton's method.
+
+    A deliberately slow, pure-Python transform: it stands in for the per-row
+    logic that cannot be vectorized, and is what `parallel.map_column` speeds up.
+
+    Example:
+        >>> newton_sqrt(np.array([4.0, 2.0])).round(6).tolist()
+        [2.0, 1.414214]
+    """
+    result = np.empty(len(values))
+    for i, value in enumerate(values.tolist()):
+        if not value > 0:  # Zero, or negative and NaN like np.sqrt
+            result[i] = 0.0 if value == 0 else np.nan
+            continue
+        root = value if value > 1 else 1.0
+        while abs(root * root - value) > tolerance * value:
+            root = (root + value / root) / 2
+        result[i] = root
+    return result
+
+
 def setup_plotting_style() -> None:
     """Configure matplotlib/seaborn for better-looking plots.
 
@@ -48,4 +237,344 @@ def setup_plotting_style() -> None:
     sns.set_palette("husl")
     plt.rcParams["figure.figsize"] = (10, 6)
     plt.rcParams["font.size"] = 11
+
+
+def _processed_path(path: str | Path, suffix: str) -> Path:
+    path = PROCESSED_DIR / path  # An absolute path replaces the directory.
+    return path if path.suffix else path.with_suffix(suffix)
+
+
+def _read_umask() -> int:
+    # The only way to read the umask is to set it, so set it back straight away. Setting it is
+    # process-wide, so this runs once, at import, before any thread pool of this module exists.
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _read_umask()
+
+
+def _write_atomically(path: Path, write: Callable[[Path], None]) -> None:
+    """Write to a temporary file and rename it over `path`.
+
+    Readers that still map the old file keep seeing it intact; new readers see the new one.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    os.close(fd)
+    try:
+        write(Path(tmp))
+        # mkstemp creates the file readable by its owner only; give it the mode `open` would.
+        os.chmod(tmp, 0o666 & ~_UMASK)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def save_array(array: np.ndarray, path: str | Path) -> Path:
+    """Save an array as `.npy`, the format `open_array` can memory-map.
+
+    Args:
+        array: Array with a fixed-size dtype (object arrays cannot be memory-mapped).
+        path: File name, relative to `data/processed/` unless absolute; `.npy` is added if there is no suffix.
+
+    Returns:
+        The path written.
+    """
+    target = _processed_path(path, ".npy")
+
+    def write(tmp: Path) -> None:
+        with tmp.open("wb") as f:
+            np.save(f, array, allow_pickle=False)
+
+    _write_atomically(target, write)
+    return target
+
+
+def open_array(path: str | Path) -> np.memmap:
+    """Open a `.npy` file as a read-only memory map.
+
+    Opening is instant whatever the file size: nothing is read until elements are
+    accessed, then only the pages that hold them. Pages live in the OS page cache,
+    so every kernel that opens the same file shares them.
+
+    Example:
+        >>> import tempfile
+        >>> path = save_array(np.arange(1_000_000), Path(tempfile.mkdtemp()) / "ids")
+        >>> ids = open_array(path)
+        >>> int(ids[500_000:500_003].sum())
+        1500003
+    """
+    array: np.memmap = np.load(_processed_path(path, ".npy"), mmap_mode="r", allow_pickle=False)
+    return array
+
+
+def save_table(data: pd.DataFrame | pa.Table{% if cookiecutter.dataframe_backend == 'polars' %} | pl.DataFrame{% endif %}, path: str | Path) -> Path:
+    """Save a DataFrame or Arrow table as an uncompressed Arrow IPC (Feather v2) file.
+
+    Compression would make reads decompress the whole file, so the file is left
+    uncompressed for `open_table` to map it without copying.
+
+    Args:
+        data: The table; a pandas DataFrame keeps its index as a column.
+        path: File name, relative to `data/processed/` unless absolute; `.feather` is added if there is no suffix.
+
+    Returns:
+        The path written.
+    """
+    target = _processed_path(path, ".feather")
+{%- if cookiecutter.dataframe_backend == 'polars' %}
+    if isinstance(data, pl.DataFrame):
+        data = data.to_arrow()
+{%- endif %}
+    _write_atomically(target, lambda tmp: feather.write_feather(data, str(tmp), compression="uncompressed"))
+    return target
+
+
+def open_table(path: str | Path, columns: list[str] | None = None) -> pa.Table:
+    """Open an Arrow IPC (Feather v2) file as a memory-mapped Arrow table.
+
+    The columns point into the mapped file, so opening costs no reads and slicing
+    or selecting columns copies nothing. Convert only what you need to pandas,
+    e.g. `open_table(path).slice(0, 1000).to_pandas()`, which reads only those rows.
+    Files written with compression are decompressed into memory instead.
+
+    Example:
+        >>> import tempfile
+        >>> path = save_table(load_sample_data(){% if cookiecutter.dataframe_backend == 'polars' %}.collect(){% endif %}, Path(tempfile.mkdtemp()) / "sample")
+        >>> table = open_table(path, columns=["x", "y"])
+        >>> table.slice(2, 3).to_pandas()["y"].tolist()
+        [4, 9, 16]
+    """
+    # The IPC reader over a memory map returns buffers that point into the file; `feather.read_table`
+    # copies when given `columns`, so select afterwards instead.
+    table = pa.ipc.open_file(pa.memory_map(str(_processed_path(path, ".feather")))).read_all()
+    return table if columns is None else table.select(columns)
+
+
+def _glob(pattern: str) -> tuple[Path, list[Path]]:
+    """Return the directory part of `pattern` before any wildcard, and the matching files in sorted order."""
+    relative = Path(pattern)
+    base = RAW_DIR
+    # Path.glob only takes relative patterns: start absolute ones at the deepest directory without wildcards.
+    static = list(itertools.takewhile(lambda part: not set(part) & set("*?["), relative.parts[:-1]))
+    if static:
+        base = base.joinpath(*static)
+        relative = relative.relative_to(Path(*static))
+    paths = sorted(base.glob(relative.as_posix()))
+    if not paths:
+        msg = f"No files match {pattern!r}"
+        raise FileNotFoundError(msg)
+    return base, paths
+
+
+{% if cookiecutter.dataframe_backend == 'polars' -%}
+def _scan_tsv(path: Path, **kwargs: Any) -> pl.LazyFrame:
+    return pl.scan_csv(path, separator="\t", **kwargs)
+
+
+# Lazy scanner for each file suffix. Compressed files cannot be scanned lazily: decompress them first.
+_SCANNERS: dict[str, Callable[..., pl.LazyFrame]] = {
+    ".csv": pl.scan_csv,
+    ".tsv": _scan_tsv,
+    ".parquet": pl.scan_parquet,
+    ".feather": pl.scan_ipc,
+    ".arrow": pl.scan_ipc,
+    ".ipc": pl.scan_ipc,
+    ".jsonl": pl.scan_ndjson,
+    ".ndjson": pl.scan_ndjson,
+}
+
+
+def _scanner_for(path: Path) -> Callable[..., pl.LazyFrame]:
+    scanner = _SCANNERS.get(path.suffix.lower())
+    if scanner is None:
+        msg = f"No lazy scanner for {path.name}; pass one with `scanner=`"
+        raise ValueError(msg)
+    return scanner
+
+
+def load_many(
+    pattern: str,
+    *,
+    columns: list[str] | None = None,
+    where: pl.Expr | None = None,
+    scanner: Callable[..., pl.LazyFrame] | None = None,
+    source_column: str | None = None,
+    strict: bool = False,
+    **scan_kwargs: Any,
+) -> pl.LazyFrame:
+    """Scan every file matching a glob as one lazy frame.
+
+    Nothing is read until the frame is collected. Polars then pushes the projection
+    (`columns`, and any later `select`) and the predicate (`where`, and any later
+    `filter`) down into the scan of each file, so it reads only those columns and,
+    in Parquet files, skips the row groups whose statistics rule the predicate out.
+    The files are scanned in parallel on all cores. Parts are aligned on the columns
+    of the first file (columns that only some parts have are appended and filled with
+    nulls), and each column gets a type that holds the values of every part.
+
+    Args:
+        pattern: Glob such as `"sales/part-*.parquet"`, relative to `data/raw/` unless absolute.
+        columns: Columns to return; all by default.
+        where: Predicate selecting the rows to return, e.g. `pl.col("store") == "Paris"`.
+        scanner: Function scanning one file; chosen from the file suffix by default (CSV, TSV,
+            Parquet, Feather/Arrow and JSON lines).
+        source_column: If given, add an enum column of this name holding the file each row
+            comes from, relative to the directory part of `pattern` before any wildcard.
+        strict: Raise instead of aligning when a part's columns differ from the first part's.
+        **scan_kwargs: Passed to the scanner for every file, e.g. `schema_overrides=` for CSV.
+
+    Raises:
+        FileNotFoundError: No file matches the pattern.
+        ValueError: There is no scanner for a file, or `strict` is set and the columns differ.
+
+    Example:
+        >>> import tempfile
+        >>> directory = Path(tempfile.mkdtemp())
+        >>> for part in range(3):
+        ...     load_sample_data().collect().write_csv(directory / f"part-{part}.csv")
+        >>> query = load_many(str(directory / "part-*.csv"), where=pl.col("x") < 2, source_column="file")
+        >>> query.group_by("file").len().sort("file").collect().rows()
+        [('part-0.csv', 2), ('part-1.csv', 2), ('part-2.csv', 2)]
+    """
+    base, paths = _glob(pattern)
+    parts = [(scanner or _scanner_for(path))(path, **scan_kwargs) for path in paths]
+    if strict:
+        # Schemas come from the file headers or metadata, so this reads no data.
+        expected = parts[0].collect_schema().names()
+        for path, part in zip(paths, parts):  # noqa: B905 | zip(strict=) needs Python 3.10
+            if part.collect_schema().names() != expected:
+                msg = f"{path.name} has columns {part.collect_schema().names()}, expected {expected}"
+                raise ValueError(msg)
+    if source_column is not None:
+        names = [path.relative_to(base).as_posix() for path in paths]
+        dtype = pl.Enum(names)
+        parts = [
+            part.with_columns(pl.lit(name, dtype=dtype).alias(source_column))
+            for part, name in zip(parts, names)  # noqa: B905 | zip(strict=) needs Python 3.10
+        ]
+    frame = pl.concat(parts, how="diagonal_relaxed")
+    if where is not None:
+        frame = frame.filter(where)
+    return frame if columns is None else frame.select(columns)
+{%- else -%}
+def _read_tsv(path: Path, **kwargs: Any) -> pd.DataFrame:
+    df: pd.DataFrame = pd.read_csv(path, sep="\t", **kwargs)
+    return df
+
+
+def _read_jsonl(path: Path, **kwargs: Any) -> pd.DataFrame:
+    df: pd.DataFrame = pd.read_json(path, lines=True, **kwargs)
+    return df
+
+
+# Reader for each file suffix; compression suffixes such as `.gz` are skipped when matching.
+_READERS: dict[str, Callable[..., pd.DataFrame]] = {
+    ".csv": pd.read_csv,
+    ".tsv": _read_tsv,
+    ".parquet": pd.read_parquet,
+    ".feather": pd.read_feather,
+    ".arrow": pd.read_feather,
+    ".json": pd.read_json,
+    ".jsonl": _read_jsonl,
+}
+_COMPRESSION_SUFFIXES = {".gz", ".bz2", ".xz", ".zst", ".zip"}
+
+
+def _reader_for(path: Path) -> Callable[..., pd.DataFrame]:
+    suffixes = [suffix for suffix in path.suffixes if suffix not in _COMPRESSION_SUFFIXES]
+    reader = _READERS.get(suffixes[-1].lower() if suffixes else "")
+    if reader is None:
+        msg = f"No reader for {path.name}; pass one with `reader=`"
+        raise ValueError(msg)
+    return reader
+
+
+def _releases_gil(reader: Callable[..., pd.DataFrame], kwargs: dict[str, Any]) -> bool:
+    """Whether parsing runs in Arrow's C++ code, which releases the GIL, so that threads scale."""
+    if reader in (pd.read_parquet, pd.read_feather):
+        return True
+    return kwargs.get("engine") == "pyarrow"
+
+
+def _read_part(reader: Callable[..., pd.DataFrame], path: Path, kwargs: dict[str, Any]) -> pd.DataFrame:
+    return reader(path, **kwargs)
+
+
+def load_many(
+    pattern: str,
+    *,
+    reader: Callable[..., pd.DataFrame] | None = None,
+    executor: str = "auto",
+    workers: int | None = None,
+    source_column: str | None = None,
+    strict: bool = False,
+    **read_kwargs: Any,
+) -> pd.DataFrame:
+    """Read every file matching a glob concurrently and concatenate them into one frame.
+
+    Files are parsed in a pool and concatenated once, in sorted path order, so the
+    result is allocated a single time. Parts are aligned on the columns of the
+    first file (columns that only some parts have are appended and filled with
+    missing values), and each column gets a dtype that holds the values of every
+    part; pass `dtype=` to pin the types and skip inference.
+
+    Args:
+        pattern: Glob such as `"sales/part-*.csv"`, relative to `data/raw/` unless absolute.
+        reader: Function reading one file; chosen from the file suffix by default (CSV,
+            TSV, Parquet, Feather/Arrow, JSON and JSON lines, optionally compressed).
+        executor: `"thread"`, `"process"` or `"auto"`. Threads suffice for readers that
+            release the GIL (Parquet, Feather and CSV with `engine="pyarrow"`); `"auto"`
+            uses processes for everything else.
+        workers: Pool size; defaults to the CPU count.
+        source_column: If given, add a categorical column of this name holding the file each row
+            comes from, relative to the directory part of `pattern` before any wildcard.
+        strict: Raise instead of aligning when a part's columns differ from the first part's.
+        **read_kwargs: Passed to the reader for every file, e.g. `dtype=`, `usecols=` or `engine="pyarrow"`.
+
+    Raises:
+        FileNotFoundError: No file matches the pattern.
+        ValueError: There is no reader for a file, or `strict` is set and the columns differ.
+
+    Example:
+        >>> import tempfile
+        >>> directory = Path(tempfile.mkdtemp())
+        >>> for part in range(3):
+        ...     load_sample_data().to_csv(directory / f"part-{part}.csv", index=False)
+        >>> df = load_many(str(directory / "part-*.csv"), source_column="file")
+        >>> df.shape, df["file"].unique().tolist()
+        ((30, 4), ['part-0.csv', 'part-1.csv', 'part-2.csv'])
+    """
+    base, paths = _glob(pattern)
+    readers = [reader or _reader_for(path) for path in paths]
+
+    if executor == "auto":
+        executor = "thread" if all(_releases_gil(r, read_kwargs) for r in readers) else "process"
+    pools: dict[str, Callable[..., Executor]] = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+    if executor not in pools:
+        msg = f"Unknown executor {executor!r}; expected 'auto', 'thread' or 'process'"
+        raise ValueError(msg)
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    with pools[executor](max_workers=workers) as pool:
+        parts = list(pool.map(_read_part, readers, paths, [read_kwargs] * len(paths)))
+
+    columns = list(parts[0].columns)
+    for path, part in zip(paths, parts):  # noqa: B905 | zip(strict=) needs Python 3.10
+        if list(part.columns) != columns:
+            if strict:
+                msg = f"{path.name} has columns {list(part.columns)}, expected {columns}"
+                raise ValueError(msg)
+            columns += [column for column in part.columns if column not in columns]
+    parts = [part if list(part.columns) == columns else part.reindex(columns=columns) for part in parts]
+    # A single concat: every output column is allocated once and filled from all parts.
+    df = pd.concat(parts, ignore_index=True)
+    if source_column is not None:
+        codes = np.repeat(np.arange(len(paths)), [len(part) for part in parts])
+        names = [path.relative_to(base).as_posix() for path in paths]
+        df[source_column] = pd.Categorical.from_codes(codes, categories=pd.Index(names))
+    return df
+{%- endif %}
 {%- endif %}
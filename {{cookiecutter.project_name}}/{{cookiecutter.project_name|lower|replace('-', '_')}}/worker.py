@@ -0,0 +1,390 @@
+"""Run the jobs of a `JobQueue` in a pool of worker processes.
+
+The parent process claims jobs from the queue in batches and sends each batch to
+a worker; workers return one result or error per job, and the parent stores them
+in the queue as each batch comes back. A few batches per worker are kept in
+flight so that workers do not wait while the parent writes to the database.
+
+- Warm workers: the `init` function runs once in each worker process before its
+  first batch, so expensive set-up is paid once per process, not once per job.
+- Batching: one round trip to a worker and one transaction per batch amortize
+  the overhead of small jobs; tune `batch_size` so a batch takes ~10-100 ms.
+- Retries: if a batch raises, the worker runs its jobs one by one, so only the
+  jobs that raise fail. Failed jobs are retried after an exponential backoff, up
+  to `max_attempts`, in ordinary batches. If a worker process dies, the pool is
+  restarted and the jobs that were in flight are bisected, without using an
+  attempt, until the job that crashes its worker is found; only that job fails.
+- Checkpoint and resume: results are committed batch by batch. An interrupted
+  run returns its unfinished jobs to the queue, and jobs leased by a run that
+  was killed are claimed again once their lease expires, so running again
+  resumes where the last run stopped.
+
+Usage:
+    {{cookiecutter.project_name}} enqueue jobs.db documents.jsonl   # one JSON value (or line of text) per line
+    {{cookiecutter.project_name}} run jobs.db --workers 8
+    {{cookiecutter.project_name}} status jobs.db
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import importlib
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, TextIO
+
+from {{cookiecutter.project_name|lower|replace('-', '_')}}.jobs import Job, JobQueue
+
+LOG = logging.getLogger("{{cookiecutter.project_name|lower|replace('-', '_')}}")
+
+Task = Callable[[list[Any]], list[Any]]
+
+DEFAULT_TASK = "{{cookiecutter.project_name|lower|replace('-', '_')}}.tasks:extract_features"
+DEFAULT_INIT = "{{cookiecutter.project_name|lower|replace('-', '_')}}.tasks:init"
+
+# Batches in flight per worker: one running, one queued, so a worker never waits for the parent.
+_BATCHES_PER_WORKER = 2
+# Longest sleep while waiting for a retry to become due, so new jobs are noticed.
+_POLL_SECONDS = 1.0
+
+# Error recorded for the jobs of a pool whose worker process died.
+_WORKER_DIED = "worker process died"
+
+# Error raised by the initializer in this worker process, reported with every batch.
+_init_error: str | None = None
+
+
+class WorkerInitError(RuntimeError):
+    """The `init` function of a run failed in a worker process."""
+
+
+@dataclasses.dataclass
+class RunStats:
+    """Outcome of a run: jobs completed, scheduled for a retry and failed for good, and the worker restarts."""
+
+    done: int = 0
+    retried: int = 0
+    failed: int = 0
+    restarts: int = 0
+    seconds: float = 0.0
+
+    @property
+    def items_per_second(self) -> float:
+        return self.done / self.seconds if self.seconds > 0 else 0.0
+
+
+def load(spec: str) -> Callable[..., Any]:
+    """Import a function given as `package.module:function`.
+
+    Example:
+        >>> load("os.path:basename")("/tmp/jobs.db")
+        'jobs.db'
+    """
+    module, _, name = spec.partition(":")
+    func: Callable[..., Any] = getattr(importlib.import_module(module), name)
+    return func
+
+
+def _error(e: Exception) -> str:
+    return f"{type(e).__name__}: {e}"
+
+
+def _initialize(init: Callable[..., None] | None, initargs: tuple[Any, ...]) -> None:
+    global _init_error
+    if init is None:
+        return
+    try:
+        init(*initargs)
+    except Exception as e:
+        # Raising here would break the pool; the error is reported with the first batch instead.
+        _init_error = _error(e)
+
+
+def _run_batch(task: Task, payloads: list[Any]) -> list[tuple[bool, Any]]:
+    """Run a batch in a worker and return `(ok, result or error)` per payload."""
+    if _init_error is not None:
+        raise WorkerInitError(_init_error)
+    try:
+        results = task(payloads)
+    except Exception:
+        if len(payloads) == 1:
+            raise
+    else:
+        if len(results) != len(payloads):
+            msg = f"{task.__name__} returned {len(results)} results for {len(payloads)} payloads"
+            raise ValueError(msg)
+        return [(True, result) for result in results]
+    # Isolate the payloads that fail, so the others need not be retried.
+    outcomes: list[tuple[bool, Any]] = []
+    for payload in payloads:
+        try:
+            outcomes.append((True, task([payload])[0]))
+        except Exception as e:
+            outcomes.append((False, _error(e)))
+    return outcomes
+
+
+def _new_pool(workers: int, init: Callable[..., None] | None, initargs: tuple[Any, ...]) -> ProcessPoolExecutor:
+    # Forking a process that runs threads, like the parent once a pool exists, can deadlock the child;
+    # workers are forked from a clean server process instead, where available.
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(
+        workers, mp_context=multiprocessing.get_context(method), initializer=_initialize, initargs=(init, initargs)
+    )
+
+
+# The jobs of each batch submitted to the pool, by future.
+_InFlight = dict[Future[list[tuple[bool, Any]]], list[Job]]
+
+
+def _collect(
+    finished: Iterable[Future[list[tuple[bool, Any]]]], in_flight: _InFlight
+) -> tuple[list[tuple[int, Any]], list[tuple[Job, str]], bool, WorkerInitError | None]:
+    """Remove finished batches from `in_flight`; return their results and errors, whether the pool broke,
+    and the initialization error of a worker, if any. The batches that hit either stay in flight.
+    """
+    results: list[tuple[int, Any]] = []
+    errors: list[tuple[Job, str]] = []
+    crashed = False
+    init_error = None
+    for future in finished:
+        try:
+            outcomes = future.result()
+        except WorkerInitError as e:
+            init_error = e
+            continue
+        except BrokenProcessPool:
+            crashed = True
+            continue
+        except Exception as e:  # A single job raised, or the task returned too few results.
+            outcomes = [(False, _error(e))] * len(in_flight[future])
+        for job, (ok, value) in zip(in_flight.pop(future), outcomes):  # noqa: B905 | zip(strict=) needs Python 3.10
+            if ok:
+                results.append((job.id, value))
+            else:
+                errors.append((job, value))
+    return results, errors, crashed, init_error
+
+
+def _submit_batch(pool: ProcessPoolExecutor, task: Task, batch: list[Job], in_flight: _InFlight) -> None:
+    try:
+        future = pool.submit(_run_batch, task, [job.payload for job in batch])
+    except BrokenProcessPool as e:
+        # The pool broke since the last wait: keep the batch in flight, to be handled with the crash.
+        future = Future()
+        future.set_exception(e)
+    in_flight[future] = batch
+
+
+def _submit(
+    queue: JobQueue,
+    pool: ProcessPoolExecutor,
+    task: Task,
+    in_flight: _InFlight,
+    suspects: list[list[Job]],
+    *,
+    limit: int,
+    batch_size: int,
+    lease: float,
+) -> None:
+    """Claim and submit batches until `limit` are in flight, or run the next group of `suspects`.
+
+    A job that crashes its worker breaks the pool and every batch in flight with it, so `run` splits
+    the jobs in flight into two groups of suspects. Once the pool is idle, a group runs on its own,
+    spread over `limit` small batches: those that finish clear their jobs, and if the pool breaks
+    again, the jobs left are split again. Claimed jobs whose last attempt crashed form a group of one.
+    No batches are claimed while suspects are left. Jobs that raised are retried in ordinary batches,
+    since `_run_batch` already isolates the ones that raise.
+    """
+    while not suspects and len(in_flight) < limit:
+        jobs = queue.claim(batch_size, lease=lease)
+        if not jobs:
+            break
+        suspects += [[job] for job in jobs if job.error == _WORKER_DIED]
+        batch = [job for job in jobs if job.error != _WORKER_DIED]
+        if batch:
+            _submit_batch(pool, task, batch, in_flight)
+    if suspects and not in_flight:
+        group = suspects.pop(0)
+        size = -(-len(group) // limit)
+        for i in range(0, len(group), size):
+            _submit_batch(pool, task, group[i : i + size], in_flight)
+
+
+def run(
+    path: str | os.PathLike[str],
+    task: Task,
+    *,
+    init: Callable[..., None] | None = None,
+    initargs: tuple[Any, ...] = (),
+    workers: int | None = None,
+    batch_size: int = 64,
+    max_attempts: int = 3,
+    backoff: float = 1.0,
+    lease: float = 600.0,
+) -> RunStats:
+    """Run the jobs in the queue at `path` until none is left, and return the statistics of the run.
+
+    Args:
+        path: SQLite file of the queue.
+        task: Module-level function mapping a list of payloads to a list of results, in order.
+        init: Module-level function run once in each worker process before its first batch.
+        initargs: Arguments for `init`.
+        workers: Number of worker processes; defaults to the CPU count.
+        batch_size: Jobs per batch sent to a worker.
+        max_attempts: Attempts per job before it is marked as failed.
+        backoff: Delay in seconds before the first retry; it doubles with each further attempt.
+        lease: Seconds after which the jobs of a batch are handed out again if this run dies.
+            Must be longer than a batch takes.
+
+    Raises:
+        WorkerInitError: `init` failed in a worker. The jobs of the run are returned to the queue.
+    """
+    workers = workers or os.cpu_count() or 1
+    stats = RunStats()
+    start = time.perf_counter()
+    in_flight: _InFlight = {}
+    suspects: list[list[Job]] = []
+    with JobQueue(path) as queue:
+        pool = _new_pool(workers, init, initargs)
+        try:
+            while True:
+                limit = workers * _BATCHES_PER_WORKER
+                _submit(queue, pool, task, in_flight, suspects, limit=limit, batch_size=batch_size, lease=lease)
+
+                if not in_flight:
+                    # Nothing to claim: wait for the next retry to become due, or stop if the queue is empty.
+                    delay = queue.next_ready()
+                    if delay is None:
+                        break
+                    time.sleep(min(delay, _POLL_SECONDS))
+                    continue
+
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                results, errors, crashed, init_error = _collect(finished, in_flight)
+                if crashed:
+                    # A dead worker breaks the pool, and with it every batch in flight, whichever job killed it.
+                    crashed_jobs = [job for batch in in_flight.values() for job in batch]
+                    in_flight.clear()
+                    pool.shutdown(wait=True)
+                    pool = _new_pool(workers, init, initargs)
+                    stats.restarts += 1
+                    LOG.warning("a worker process died; restarted the pool")
+                    if len(crashed_jobs) == 1:
+                        # It was alone in the pool, so it killed its worker: that uses an attempt.
+                        errors.append((crashed_jobs[0], _WORKER_DIED))
+                    else:
+                        half = len(crashed_jobs) // 2
+                        suspects += [crashed_jobs[:half], crashed_jobs[half:]]
+
+                # Checkpoint: results are committed as each batch comes back.
+                queue.complete(results)
+                retried = queue.fail(errors, max_attempts=max_attempts, backoff=backoff)
+                stats.done += len(results)
+                stats.retried += retried
+                stats.failed += len(errors) - retried
+                if init_error is not None:
+                    raise init_error
+        finally:
+            # On an interrupt or error, unfinished jobs go back to the queue without using an attempt.
+            unfinished = [*in_flight.values(), *suspects]
+            queue.release([job.id for batch in unfinished for job in batch])
+            pool.shutdown(wait=True, cancel_futures=True)
+            stats.seconds = time.perf_counter() - start
+    return stats
+
+
+# ============================================================================
+# Command line
+# ============================================================================
+
+
+def _read_payloads(lines: TextIO) -> Iterator[Any]:
+    for line in lines:
+        line = line.rstrip("\n")
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            yield line
+
+
+def _print_counts(queue: JobQueue) -> None:
+    print("  ".join(f"{status}: {count}" for status, count in queue.counts().items()))
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="{{cookiecutter.project_description}}")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    enqueue = commands.add_parser("enqueue", help="add a job per line of a file (JSON values or plain text)")
+    enqueue.add_argument("queue", help="SQLite file of the queue, created if needed")
+    enqueue.add_argument("input", nargs="?", type=argparse.FileType("r"), default=sys.stdin, help="default: stdin")
+
+    run_parser = commands.add_parser("run", help="run the queued jobs; run again to resume")
+    run_parser.add_argument("queue")
+    run_parser.add_argument("--task", default=DEFAULT_TASK, help="batch function (default: %(default)s)")
+    run_parser.add_argument("--init", default=DEFAULT_INIT, help="per-worker set-up, or '' (default: %(default)s)")
+    run_parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    run_parser.add_argument("--batch-size", type=int, default=64, help="jobs per batch (default: %(default)s)")
+    run_parser.add_argument("--max-attempts", type=int, default=3, help="attempts per job (default: %(default)s)")
+    run_parser.add_argument("--backoff", type=float, default=1.0, help="first retry delay (default: %(default)ss)")
+
+    status = commands.add_parser("status", help="show the number of jobs by status, and the failed jobs")
+    status.add_argument("queue")
+
+    results = commands.add_parser("results", help="print the completed jobs as JSON lines")
+    results.add_argument("queue")
+
+    retry = commands.add_parser("retry-failed", help="queue the failed jobs again")
+    retry.add_argument("queue")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    if args.command == "run":
+        try:
+            stats = run(
+                args.queue,
+                load(args.task),
+                init=load(args.init) if args.init else None,
+                workers=args.workers,
+                batch_size=args.batch_size,
+                max_attempts=args.max_attempts,
+                backoff=args.backoff,
+            )
+        except KeyboardInterrupt:
+            print("interrupted; the unfinished jobs are back in the queue, run again to resume", file=sys.stderr)
+            return 130
+        print(
+            f"done {stats.done}, failed {stats.failed}, retried {stats.retried}, restarts {stats.restarts} "
+            f"in {stats.seconds:.2f}s ({stats.items_per_second:,.0f} items/s)"
+        )
+        return 1 if stats.failed else 0
+
+    with JobQueue(args.queue) as queue:
+        if args.command == "enqueue":
+            print(f"queued {queue.put(_read_payloads(args.input))} jobs")
+        elif args.command == "status":
+            _print_counts(queue)
+            for payload, error in queue.failures():
+                print(f"failed: {json.dumps(payload)[:60]}: {error}")
+        elif args.command == "results":
+            for payload, result in queue.results():
+                print(json.dumps({"payload": payload, "result": result}))
+        else:
+            print(f"queued {queue.retry_failed()} failed jobs again")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())